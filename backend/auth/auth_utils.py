@@ -1,11 +1,64 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
 from passlib.context import CryptContext
 
+import metrics
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt (~250 ms po hash-u) ide u poseban thread pool da ne blokira event loop;
+# bcrypt oslobadja GIL, pa niti zaista rade paralelno
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# koliko zahteva sme da ceka na slobodnu nit; preko toga 503 umesto beskonacnog reda
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_pending = 0
+_running = 0
+_running_lock = threading.Lock()
+
+metrics.register_gauge("password_hash_pending", lambda: _pending)
+metrics.register_gauge("password_hash_running", lambda: _running)
+
+
+def _timed(op: str, fn, *args):
+    global _running
+    with _running_lock:
+        _running += 1
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        with _running_lock:
+            _running -= 1
+        metrics.inc(f"password_{op}_total")
+        metrics.inc(f"password_{op}_seconds_total", time.perf_counter() - start)
+
+
+async def _offload(op: str, fn, *args):
+    global _pending
+    if _pending >= PASSWORD_HASH_MAX_PENDING:
+        metrics.inc(f"password_{op}_rejected_total")
+        raise HTTPException(status_code=503, detail="Server je preopterećen, pokušajte ponovo.",
+                            headers={"Retry-After": "1"})
+
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, _timed, op, fn, *args)
+    finally:
+        _pending -= 1
+
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await _offload("hash", pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str | bytes) -> bool:
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode()
+    return await _offload("verify", pwd_context.verify, plain_password, hashed_password)
@@ -1,16 +1,41 @@
+import copy
+import logging
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from bson import ObjectId
+from bson.errors import InvalidId
 from jose import JWTError, jwt
 
 from database.connection import users_col, organisations_col
 from models.user_models import Role, UserDB
 from auth.jwt_handler import ALGORITHM, SECRET_KEY, decode_access_token
+from auth.principal_cache import principal_cache
+from auth.revocation import revocation_list
+
+logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 oauth2_scheme_org = OAuth2PasswordBearer(tokenUrl="/auth/org/login")
 
 
+def _decode_access(token: str) -> dict:
+    """JWT → claims; refresh token ne vazi kao access, opozvan jti (logout) ili cela familija
+    (fam, posle ponovne upotrebe refresh tokena) se odbija bez upita u bazu"""
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if (payload.get("typ") == "refresh" or revocation_list.is_revoked(payload.get("jti"))
+            or revocation_list.is_revoked(payload.get("fam"))):
+        raise JWTError("Token je opozvan")
+    return payload
+
+
+async def get_token_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    try:
+        return _decode_access(token)
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Neispravan token", headers={"WWW-Authenticate": "Bearer"})
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserDB:
     credentials_exception = HTTPException(
         status_code=401,
@@ -19,19 +44,29 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserDB:
     )
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_access(token)
         user_id = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = await users_col.find_one({"_id": ObjectId(user_id)})
-    if not user:
-        raise credentials_exception
+    user = principal_cache.get("user", user_id)
+    cached = user is not None
+    if not cached:
+        try:
+            user = await users_col.find_one({"_id": ObjectId(user_id)})
+        except InvalidId:
+            user = None
+        if not user:
+            logger.debug("get_current_user: korisnik %s ne postoji", user_id)
+            raise credentials_exception
+
+        # Konvertuj ObjectId u string
+        user["_id"] = str(user["_id"])
+        principal_cache.put("user", user_id, user)
 
-    # Konvertuj ObjectId u string
-    user["_id"] = str(user["_id"])
+    logger.debug("get_current_user: user=%s role=%s cache=%s", user_id, user.get("role"), "hit" if cached else "miss")
     return UserDB(**user)
 
 
@@ -47,31 +82,29 @@ async def admin_required(current_user: UserDB = Depends(get_current_user)):
 
 
 async def get_current_org(token: str = Depends(oauth2_scheme_org)):
-    print("🎯 get_current_org pozvan!")
-    print("📦 Primljen token:", token)
-
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print("🎫 PAYLOAD:", payload)
-
-        if payload.get("role") != "organisation":
-            print("🚫 Rola nije organisation:", payload.get("role"))
-            raise HTTPException(status_code=403, detail="Nedozvoljen pristup")
+        payload = _decode_access(token)
+    except JWTError as e:
+        logger.debug("get_current_org: neispravan token (%s)", e)
+        raise HTTPException(status_code=401, detail="Neispravan token")
 
-        email = payload.get("sub")
-        print("📧 Sub/email iz tokena:", email)
+    if payload.get("role") != "organisation":
+        logger.debug("get_current_org: rola %s nije organisation", payload.get("role"))
+        raise HTTPException(status_code=403, detail="Nedozvoljen pristup")
 
+    email = payload.get("sub")
+    org = principal_cache.get("organisation", email)
+    cached = org is not None
+    if not cached:
         org = await organisations_col.find_one({"email": email})
         if not org:
-            print("❌ Organizacija nije pronađena u bazi")
+            logger.debug("get_current_org: organizacija %s nije pronađena", email)
             raise HTTPException(status_code=404, detail="Organizacija nije pronađena")
+        principal_cache.put("organisation", email, org)
 
-        print("✅ Organizacija pronađena:", org)
-        return org
-
-    except JWTError as e:
-        print("❌ JWT error:", e)
-        raise HTTPException(status_code=401, detail="Neispravan token")
+    logger.debug("get_current_org: org=%s status=%s cache=%s", org["_id"], org.get("status"), "hit" if cached else "miss")
+    # kopija: pozivaoci smeju da menjaju dokument, a kesirani mora ostati netaknut
+    return copy.deepcopy(org)
 
 
 
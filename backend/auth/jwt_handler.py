@@ -1,13 +1,18 @@
 from jose import jwt, JWTError
 from datetime import datetime, timedelta, timezone
+import logging
 import os
+import uuid
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+REFRESH_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
 
 MONGO_URL = os.getenv("MONGO_URL")
 MONGO_DB = os.getenv("MONGO_DB")
@@ -15,11 +20,21 @@ MONGO_DB = os.getenv("MONGO_DB")
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
-    print("TOKEN PAYLOAD:", to_encode)  # ovde vidiš šta zaista ide u token
+    # jti omogucava opoziv pojedinacnog tokena (logout), typ razlikuje access od refresh tokena
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex, "typ": "access"})
+    logger.debug("Izdat token: sub=%s role=%s exp=%s", to_encode.get("sub"), to_encode.get("role"), expire)
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def create_refresh_token(sub: str, role: str, family: str,
+                         jti: str | None = None, expire: datetime | None = None) -> tuple[str, dict]:
+    """Vraca (token, claims); family povezuje sve refresh tokene nastale rotacijom iz jednog login-a.
+    Sa zadatim jti/expire ponovo gradi vec izdat token (grace prozor pri rotaciji)."""
+    expire = expire or datetime.now(timezone.utc) + timedelta(days=REFRESH_EXPIRE_DAYS)
+    claims = {"sub": sub, "role": role, "exp": expire, "jti": jti or uuid.uuid4().hex, "fam": family, "typ": "refresh"}
+    return jwt.encode(dict(claims), SECRET_KEY, algorithm=ALGORITHM), claims
+
+
 def decode_access_token(token: str) -> dict | None:
     try:
         return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -0,0 +1,79 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+
+# kratak TTL ogranicava zastarelost u ostalim uvicorn workerima (invalidacija je lokalna za proces)
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "30"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+
+
+class PrincipalCache:
+    """
+    LRU + TTL kes razresenih principala (user / organisation dokument) po subject-u iz tokena.
+    Invalidacija ide po _id principala, jer se org trazi po email-u, a menja po _id-u.
+    """
+
+    def __init__(self, ttl: float = PRINCIPAL_CACHE_TTL, max_size: int = PRINCIPAL_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str, dict]] = OrderedDict()
+        self._keys_by_id: dict[tuple[str, str], set[tuple[str, str]]] = {}
+
+    def get(self, kind: str, subject: str) -> dict | None:
+        if self.ttl <= 0:
+            return None
+        key = (kind, subject)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                metrics.inc(f"principal_cache_misses_total.{kind}")
+                return None
+            self._entries.move_to_end(key)
+        metrics.inc(f"principal_cache_hits_total.{kind}")
+        return entry[2]
+
+    def put(self, kind: str, subject: str, principal: dict):
+        if self.ttl <= 0:
+            return
+        key = (kind, subject)
+        principal_id = str(principal["_id"])
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, principal_id, principal)
+            self._keys_by_id.setdefault((kind, principal_id), set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, kind: str, principal_id):
+        with self._lock:
+            for key in self._keys_by_id.pop((kind, str(principal_id)), set()):
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key: tuple[str, str]):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        id_key = (key[0], entry[1])
+        keys = self._keys_by_id.get(id_key)
+        if keys:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[id_key]
+
+
+principal_cache = PrincipalCache()
+metrics.register_gauge("principal_cache_entries", lambda: len(principal_cache))
@@ -0,0 +1,188 @@
+"""
+Ograničenje pokušaja logovanja (sliding window), pre bilo kakvog Mongo upita ili bcrypt-a.
+
+  - po IP adresi: svi pokušaji (štiti CPU od credential-stuffing naleta)
+  - po nalogu (email): pokušaj se broji odmah, pre provere lozinke (istovremeni
+    pokušaji ne mogu da zaobiđu limit); uspešan login briše brojač, pa ostaju samo neuspešni
+
+Backend (LOGIN_RATE_LIMIT_BACKEND):
+  - memory: u procesu, svaki uvicorn worker broji za sebe (default)
+  - mongo:  brojači u kolekciji `rate_limits`, zajednički za sve workere
+"""
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+from fastapi import HTTPException, Request
+
+import metrics
+
+LOGIN_IP_MAX_ATTEMPTS = int(os.getenv("LOGIN_IP_MAX_ATTEMPTS", "20"))
+LOGIN_IP_WINDOW_SECONDS = float(os.getenv("LOGIN_IP_WINDOW_SECONDS", "60"))
+LOGIN_ACCOUNT_MAX_FAILURES = int(os.getenv("LOGIN_ACCOUNT_MAX_FAILURES", "5"))
+LOGIN_ACCOUNT_WINDOW_SECONDS = float(os.getenv("LOGIN_ACCOUNT_WINDOW_SECONDS", "300"))
+LOGIN_RATE_LIMIT_BACKEND = os.getenv("LOGIN_RATE_LIMIT_BACKEND", "memory")
+# iza reverse proxy-ja prava adresa klijenta je u X-Forwarded-For
+LOGIN_TRUST_FORWARDED_FOR = os.getenv("LOGIN_TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+
+class MemorySlidingWindow:
+    """Tačan sliding window: po ključu najviše `limit` vremena poslednjih pokušaja"""
+
+    def __init__(self, limit: int, window: float, max_keys: int = 100_000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._hits: OrderedDict[str, deque] = OrderedDict()
+
+    def _recent(self, key: str, now: float) -> deque | None:
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+            return None
+        return hits
+
+    def _retry_after(self, hits: deque | None, now: float) -> float | None:
+        if hits is None or len(hits) < self.limit:
+            return None
+        return hits[0] + self.window - now
+
+    async def peek(self, key: str) -> float | None:
+        """Sekunde do sledećeg dozvoljenog pokušaja, ili None ako je dozvoljeno"""
+        now = time.monotonic()
+        return self._retry_after(self._recent(key, now), now)
+
+    async def hit(self, key: str) -> float | None:
+        """Kao peek, ali dozvoljen pokušaj se i broji"""
+        now = time.monotonic()
+        hits = self._recent(key, now)
+        retry_after = self._retry_after(hits, now)
+        if retry_after is not None:
+            return retry_after
+
+        if hits is None:
+            hits = self._hits[key] = deque(maxlen=self.limit)
+        hits.append(now)
+        self._hits.move_to_end(key)
+        while len(self._hits) > self.max_keys:
+            self._hits.popitem(last=False)
+        return None
+
+    async def reset(self, key: str):
+        self._hits.pop(key, None)
+
+
+class MongoSlidingWindow:
+    """
+    Približan sliding window nad dva fiksna prozora (tekući + prethodni, ponderisan
+    delom koji se još preklapa). Dokumenti ističu preko TTL indeksa na expires_at.
+    """
+
+    def __init__(self, collection, limit: int, window: float):
+        self.collection = collection
+        self.limit = limit
+        self.window = window
+
+    def _windows(self, key: str, now: float):
+        start = math.floor(now / self.window) * self.window
+        return f"{key}:{int(start)}", f"{key}:{int(start - self.window)}", start
+
+    async def _estimate(self, key: str, now: float) -> tuple[float, float, str]:
+        current_id, previous_id, start = self._windows(key, now)
+        docs = await self.collection.find({"_id": {"$in": [current_id, previous_id]}}).to_list(length=2)
+        counts = {doc["_id"]: doc["count"] for doc in docs}
+        overlap = 1 - (now - start) / self.window
+        estimate = counts.get(current_id, 0) + counts.get(previous_id, 0) * overlap
+        return estimate, start, current_id
+
+    def _retry_after(self, estimate: float, start: float, now: float) -> float | None:
+        if estimate < self.limit:
+            return None
+        return start + self.window - now
+
+    async def peek(self, key: str) -> float | None:
+        now = time.time()
+        estimate, start, _ = await self._estimate(key, now)
+        return self._retry_after(estimate, start, now)
+
+    async def hit(self, key: str) -> float | None:
+        # prvo $inc pa provera: istovremeni zahtevi (i drugi workeri) vide i tudje pokusaje
+        now = time.time()
+        current_id, _, start = self._windows(key, now)
+        await self.collection.update_one(
+            {"_id": current_id},
+            {"$inc": {"count": 1},
+             "$setOnInsert": {"key": key, "expires_at": datetime.utcfromtimestamp(start + 2 * self.window)}},
+            upsert=True
+        )
+
+        estimate, start, _ = await self._estimate(key, now)
+        retry_after = self._retry_after(estimate - 1, start, now)
+        if retry_after is not None:
+            # odbijen pokusaj se ne broji
+            await self.collection.update_one({"_id": current_id}, {"$inc": {"count": -1}})
+        return retry_after
+
+    async def reset(self, key: str):
+        await self.collection.delete_many({"key": key})
+
+
+def _create_window(limit: int, window: float):
+    if LOGIN_RATE_LIMIT_BACKEND == "memory":
+        return MemorySlidingWindow(limit, window)
+    if LOGIN_RATE_LIMIT_BACKEND == "mongo":
+        from database.connection import rate_limits_col
+        return MongoSlidingWindow(rate_limits_col, limit, window)
+    raise ValueError(f"Nepoznat LOGIN_RATE_LIMIT_BACKEND: {LOGIN_RATE_LIMIT_BACKEND}")
+
+
+def client_ip(request: Request) -> str:
+    if LOGIN_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="Previše pokušaja prijave. Pokušajte ponovo kasnije.",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class LoginLimiter:
+
+    def __init__(self):
+        self.by_ip = _create_window(LOGIN_IP_MAX_ATTEMPTS, LOGIN_IP_WINDOW_SECONDS)
+        self.by_account = _create_window(LOGIN_ACCOUNT_MAX_FAILURES, LOGIN_ACCOUNT_WINDOW_SECONDS)
+
+    async def check(self, request: Request, scope: str, account: str):
+        """Poziva se na samom početku login handlera; 429 + Retry-After ako je limit prekoračen.
+        Pokušaj se odmah broji i po nalogu; succeeded() taj brojač briše."""
+        retry_after = await self.by_ip.hit(f"ip:{client_ip(request)}")
+        if retry_after is not None:
+            metrics.inc(f"login_throttled_total.{scope}.ip")
+            raise _too_many(retry_after)
+
+        retry_after = await self.by_account.hit(f"{scope}:{account.lower()}")
+        if retry_after is not None:
+            metrics.inc(f"login_throttled_total.{scope}.account")
+            raise _too_many(retry_after)
+
+    async def failed(self, scope: str, account: str):
+        # pokušaj je već izbrojan u check()
+        metrics.inc(f"login_failed_total.{scope}")
+
+    async def succeeded(self, scope: str, account: str):
+        await self.by_account.reset(f"{scope}:{account.lower()}")
+
+
+login_limiter = LoginLimiter()
@@ -0,0 +1,60 @@
+import logging
+import os
+from datetime import datetime, timedelta
+
+import metrics
+from repositories.token_repository import TokenRepository
+
+logger = logging.getLogger(__name__)
+
+# koliko cesto worker povlaci opozive napravljene u drugim workerima
+TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "5"))
+
+
+class RevocationList:
+    """
+    Opozvani jti-jevi: izvor istine je `revoked_tokens` u Mongo-u, a svaki worker drzi
+    kopiju u memoriji (dict jti → expires_at) pa je provera u get_current_* O(1) bez upita.
+    Opoziv iz drugog workera postaje vidljiv posle najvise TOKEN_REVOCATION_SYNC_SECONDS.
+    """
+
+    def __init__(self):
+        self.repo = TokenRepository()
+        self._revoked: dict[str, datetime] = {}
+        self._synced_at: datetime | None = None
+
+    def is_revoked(self, jti: str | None) -> bool:
+        if not jti:
+            return False
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= datetime.utcnow():
+            # token je ionako istekao, ne treba ga vise pamtiti
+            self._revoked.pop(jti, None)
+            return False
+        return True
+
+    async def revoke(self, jti: str, expires_at: datetime):
+        self._revoked[jti] = expires_at
+        await self.repo.revoke(jti, expires_at)
+        metrics.inc("tokens_revoked_total")
+
+    async def sync(self):
+        started = datetime.utcnow()
+        # malo preklapanje prozora pokriva upise koji su stigli tik pre prethodnog sync-a
+        since = self._synced_at - timedelta(seconds=1) if self._synced_at else None
+        for doc in await self.repo.find_revoked_since(since):
+            self._revoked[doc["_id"]] = doc["expires_at"]
+        self._synced_at = started
+
+        now = datetime.utcnow()
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+    def __len__(self):
+        return len(self._revoked)
+
+
+revocation_list = RevocationList()
+metrics.register_gauge("revoked_tokens_cached", lambda: len(revocation_list))
@@ -0,0 +1,13 @@
+import asyncio
+from services.rollup_service import RollupService
+
+
+#skripta koja ponovo gradi dnevne/mesecne buckete (stats_rollups) iz events i applications kolekcija
+#pokretati jednom posle uvodjenja rollup-a ili nakon rucnih izmena u bazi, kada nema saobracaja
+async def backfill_rollups():
+    result = await RollupService().backfill()
+    print(f"Rollup bucketi ponovo izgrađeni: {result['buckets']} bucketa "
+          f"({result['events']} eventova, {result['applications']} prijava).")
+
+if __name__ == "__main__":
+    asyncio.run(backfill_rollups())
@@ -0,0 +1,107 @@
+"""
+Load benchmark: latencija javnih GET endpointa dok paralelno traju login-i.
+
+Pokrenuti server (uvicorn main:app), napraviti korisnika za login, pa (iz backend/):
+    python -m benchmarks.login_load_bench --email user@x.com --password Lozinka123!
+
+Faza 1 meri samo GET-ove, faza 2 iste GET-ove uz --login-threads niti koje se
+stalno loguju. Pre offload-a bcrypt-a na thread pool p99 GET-a u fazi 2 raste za
+~250 ms po login-u u redu; posle treba da ostane blizu faze 1.
+Koristi samo stdlib (urllib + niti), bez dodatnih zavisnosti.
+"""
+import argparse
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def request(url: str, data: bytes | None = None, headers: dict | None = None) -> float:
+    start = time.perf_counter()
+    req = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            response.read()
+    except urllib.error.HTTPError as e:
+        e.read()
+    return time.perf_counter() - start
+
+
+def get_worker(url: str, stop: threading.Event, latencies: list[float]):
+    while not stop.is_set():
+        latencies.append(request(url))
+
+
+def login_worker(base_url: str, email: str, password: str, stop: threading.Event, latencies: list[float]):
+    body = urllib.parse.urlencode({"username": email, "password": password}).encode()
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    while not stop.is_set():
+        latencies.append(request(f"{base_url}/auth/login", body, headers))
+
+
+def run_phase(args, with_logins: bool) -> tuple[list[float], list[float]]:
+    stop = threading.Event()
+    get_latencies: list[float] = []
+    login_latencies: list[float] = []
+
+    threads = [
+        threading.Thread(target=get_worker, args=(f"{args.base_url}{args.get_path}", stop, get_latencies))
+        for _ in range(args.get_threads)
+    ]
+    if with_logins:
+        threads += [
+            threading.Thread(target=login_worker, args=(args.base_url, args.email, args.password, stop, login_latencies))
+            for _ in range(args.login_threads)
+        ]
+
+    for t in threads:
+        t.start()
+    time.sleep(args.duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return get_latencies, login_latencies
+
+
+def report(name: str, latencies: list[float], duration: float):
+    if not latencies:
+        print(f"{name:<28} nema zahteva")
+        return
+    print(
+        f"{name:<28} {len(latencies) / duration:8.1f} req/s | "
+        f"p50 {percentile(latencies, 50) * 1000:8.1f} ms  p99 {percentile(latencies, 99) * 1000:8.1f} ms  "
+        f"max {max(latencies) * 1000:8.1f} ms  avg {statistics.mean(latencies) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--get-path", default="/public/events/all")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--get-threads", type=int, default=8)
+    parser.add_argument("--login-threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+
+    baseline, _ = run_phase(args, with_logins=False)
+    report("GET (bez login-a)", baseline, args.duration)
+
+    loaded, logins = run_phase(args, with_logins=True)
+    report("GET (uz login-e)", loaded, args.duration)
+    report("POST /auth/login", logins, args.duration)
+    print(f"p99 GET uz login-e / bez login-a: {percentile(loaded, 99) / percentile(baseline, 99):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
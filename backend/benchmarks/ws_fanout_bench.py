@@ -0,0 +1,115 @@
+"""
+Benchmark WS fan-out-a: 1000 konekcija jedne organizacije, deo njih namerno spor.
+
+Poredi staru sekvencijalnu petlju (await send_text za svaki socket redom) sa
+ConnectionManager-om (red po konekciji + writer task). Meri:
+  - koliko dugo je pozivalac (npr. ApplicationService.apply) blokiran u send_to_org
+  - latenciju isporuke do BRZIH konekcija (p50 / p99 / max)
+
+Pokretanje (iz backend/):  python -m benchmarks.ws_fanout_bench
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from ws_manager import ConnectionManager, OverflowPolicy
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.latencies: list[float] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.latencies.append(time.perf_counter() - float(message))
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def report(name: str, blocked: list[float], sockets: list[FakeWebSocket]):
+    fast = [lat for ws in sockets if not ws.delay for lat in ws.latencies]
+    print(
+        f"{name:<32} caller blocked avg {statistics.mean(blocked) * 1000:8.2f} ms | "
+        f"fast delivery p50 {percentile(fast, 50) * 1000:8.2f} ms  "
+        f"p99 {percentile(fast, 99) * 1000:8.2f} ms  max {max(fast, default=0) * 1000:8.2f} ms  "
+        f"(delivered {len(fast)})"
+    )
+
+
+def make_sockets(n: int, slow_ratio: float, slow_delay: float) -> list[FakeWebSocket]:
+    slow_every = int(1 / slow_ratio) if slow_ratio else 0
+    return [
+        FakeWebSocket(slow_delay if slow_every and i % slow_every == 0 else 0)
+        for i in range(n)
+    ]
+
+
+async def bench_sequential(args):
+    sockets = make_sockets(args.connections, args.slow_ratio, args.slow_delay)
+    blocked = []
+    for _ in range(args.messages):
+        start = time.perf_counter()
+        for ws in sockets:
+            await ws.send_text(repr(start))
+        blocked.append(time.perf_counter() - start)
+        await asyncio.sleep(args.interval)
+    report("sequential (staro)", blocked, sockets)
+
+
+async def bench_manager(args, policy: OverflowPolicy):
+    manager = ConnectionManager(queue_size=args.queue_size, overflow_policy=policy, send_timeout=args.send_timeout)
+    sockets = make_sockets(args.connections, args.slow_ratio, args.slow_delay)
+    for ws in sockets:
+        await manager.connect("org", ws)
+
+    blocked = []
+    for _ in range(args.messages):
+        start = time.perf_counter()
+        await manager.send_to_org("org", repr(start))
+        blocked.append(time.perf_counter() - start)
+        await asyncio.sleep(args.interval)
+
+    # sacekaj da brze konekcije isprazne redove
+    await asyncio.sleep(0.2)
+    report(f"ConnectionManager ({policy.value})", blocked, sockets)
+
+    for ws in sockets:
+        manager.disconnect("org", ws)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--slow-ratio", type=float, default=0.05)
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="sekunde po send_text za spore sokete")
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--queue-size", type=int, default=8)
+    parser.add_argument("--send-timeout", type=float, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{args.connections} konekcija, {args.slow_ratio:.0%} sporih ({args.slow_delay * 1000:.0f} ms/poruka), "
+        f"{args.messages} poruka"
+    )
+    await bench_sequential(args)
+    await bench_manager(args, OverflowPolicy.drop_oldest)
+    await bench_manager(args, OverflowPolicy.disconnect)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,4 +16,17 @@ organisations_col = db["organisations"]
 events_col = db["events"]
 applications_col = db["applications"]
 reviews_col = db["reviews"]
-notifications_col =db["notifications"]
+notifications_col = db["notifications"]
+notification_state_col = db["notification_state"]  # po organizaciji: seq (redni broj notifikacija) + unread
+notification_buckets_col = db["notification_buckets"]  # naleti notifikacija koji cekaju spajanje (services/notification_coalescer.py)
+leaderboards_col = db["leaderboards"]
+platform_stats_col = db["platform_stats"]  # globalni brojaci za admin pregled, stanje reconcile-a + shardovi (repositories/platform_stats_repository.py)
+org_stats_col = db["org_stats"]  # materijalizovana javna statistika po organizaciji (services/statistics_service.py)
+rollups_col = db["stats_rollups"]  # dnevni/mesecni bucketi brojaca po organizaciji i eventu (services/rollup_service.py)
+jobs_col = db["jobs"]  # trajni red pozadinskih poslova (services/job_queue.py)
+outbox_col = db["outbox"]  # dogadjaji domena upisani u istoj transakciji (services/outbox.py)
+media_blobs_col = db["media_blobs"]  # uploadovani fajlovi adresirani sadrzajem (sha256), osnova za GC fajlova bez referenci
+images_col = db["images"]  # izvedene velicine uploadovanih slika, _id = putanja originala u uploads/
+refresh_tokens_col = db["refresh_tokens"]  # izdati refresh tokeni (jti), za rotaciju i detekciju ponovne upotrebe
+revoked_tokens_col = db["revoked_tokens"]  # opozvani jti-jevi do isteka tokena
+rate_limits_col = db["rate_limits"]  # brojaci pokusaja logovanja kada je LOGIN_RATE_LIMIT_BACKEND=mongo
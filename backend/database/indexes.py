@@ -0,0 +1,125 @@
+import os
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+from database.connection import (
+    applications_col, db, images_col, jobs_col, leaderboards_col, media_blobs_col, notification_buckets_col,
+    notifications_col, org_stats_col, outbox_col, rate_limits_col, refresh_tokens_col, reviews_col,
+    revoked_tokens_col, rollups_col,
+)
+
+# pročitane notifikacije Mongo sam briše posle ovoliko dana (TTL na read_at)
+NOTIFICATION_READ_TTL_DAYS = float(os.getenv("NOTIFICATION_READ_TTL_DAYS", "30"))
+
+# zavrseni poslovi / isporuceni outbox dogadjaji se brisu posle ovoliko dana ("dead"/"failed" ostaju za pregled)
+JOB_RETENTION_DAYS = float(os.getenv("JOB_RETENTION_DAYS", "7"))
+OUTBOX_RETENTION_DAYS = float(os.getenv("OUTBOX_RETENTION_DAYS", "7"))
+
+INDEX_OPTIONS_CONFLICT = 85
+
+
+#indeksi se kreiraju pri startu aplikacije (create_index je idempotentan)
+async def ensure_indexes():
+    # --- leaderboards: jedan unos po (kind, subject_id), citanje je range upit po score ---
+    await leaderboards_col.create_index(
+        [("kind", ASCENDING), ("subject_id", ASCENDING)], unique=True
+    )
+    await leaderboards_col.create_index([("kind", ASCENDING), ("score", DESCENDING)])
+    await leaderboards_col.create_index(
+        [("kind", ASCENDING), ("city_key", ASCENDING), ("score", DESCENDING)]
+    )
+    await leaderboards_col.create_index(
+        [("kind", ASCENDING), ("categories", ASCENDING), ("score", DESCENDING)]
+    )
+
+    # --- reviews: keyset paginacija javnih listi (sort po created_at ili rating, _id tie-breaker) ---
+    for owner in ("organisation_id", "user_id"):
+        await reviews_col.create_index(
+            [(owner, ASCENDING), ("direction", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+        )
+        await reviews_col.create_index(
+            [(owner, ASCENDING), ("direction", ASCENDING), ("rating", DESCENDING),
+             ("created_at", DESCENDING), ("_id", DESCENDING)]
+        )
+
+    # --- notifications: replay propustenih poruka po (organisation_id, seq) ---
+    await notifications_col.create_index(
+        [("organisation_id", ASCENDING), ("seq", ASCENDING)],
+        unique=True,
+        partialFilterExpression={"seq": {"$exists": True}},  # stare notifikacije nemaju seq
+    )
+
+    # --- notification_buckets: najvise jedan otvoren bucket po (organizacija, grupa) ---
+    await notification_buckets_col.create_index(
+        [("organisation_id", ASCENDING), ("group", ASCENDING)],
+        unique=True,
+        partialFilterExpression={"open": True},
+    )
+
+    # --- notifications: istorija (keyset po created_at, _id), cela ili samo neprocitane ---
+    await notifications_col.create_index(
+        [("organisation_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+    )
+    await notifications_col.create_index(
+        [("organisation_id", ASCENDING), ("is_read", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+    )
+
+    # --- notifications: TTL za pročitane (nepročitane nemaju read_at pa ne ističu) ---
+    ttl_seconds = int(NOTIFICATION_READ_TTL_DAYS * 24 * 3600)
+    try:
+        await notifications_col.create_index("read_at", expireAfterSeconds=ttl_seconds)
+    except OperationFailure as e:
+        if e.code != INDEX_OPTIONS_CONFLICT:
+            raise
+        # promenjen NOTIFICATION_READ_TTL_DAYS → izmeni postojeći indeks umesto ponovnog kreiranja
+        await db.command("collMod", notifications_col.name, index={"keyPattern": {"read_at": 1}, "expireAfterSeconds": ttl_seconds})
+
+    # --- jobs: lease upit (spremni po run_at + istekli lease-ovi) i TTL za zavrsene ---
+    await jobs_col.create_index([("status", ASCENDING), ("run_at", ASCENDING)])
+    await jobs_col.create_index([("status", ASCENDING), ("lease_until", ASCENDING)])
+    await jobs_col.create_index(
+        "finished_at",
+        expireAfterSeconds=int(JOB_RETENTION_DAYS * 24 * 3600),
+        partialFilterExpression={"status": "done"},
+    )
+
+    # --- outbox: dispatcher cita spremne po redosledu (_id), TTL za isporucene ---
+    await outbox_col.create_index([("status", ASCENDING), ("available_at", ASCENDING), ("_id", ASCENDING)])
+    await outbox_col.create_index([("status", ASCENDING), ("lease_until", ASCENDING)])
+    await outbox_col.create_index("claim", sparse=True)
+    await outbox_col.create_index(
+        "dispatched_at",
+        expireAfterSeconds=int(OUTBOX_RETENTION_DAYS * 24 * 3600),
+        partialFilterExpression={"status": "dispatched"},
+    )
+
+    # --- rate_limits: prozori brojaca logovanja sami isticu ---
+    await rate_limits_col.create_index("expires_at", expireAfterSeconds=0)
+    await rate_limits_col.create_index("key")
+
+    # --- refresh / opozvani tokeni: brisu se kada token ionako istekne ---
+    await refresh_tokens_col.create_index("family")
+    await refresh_tokens_col.create_index("expires_at", expireAfterSeconds=0)
+    await revoked_tokens_col.create_index("expires_at", expireAfterSeconds=0)
+    await revoked_tokens_col.create_index("revoked_at")
+
+    # --- images: izvedene velicine se traze po URL-u originala ---
+    await images_col.create_index("url")
+
+    # --- media_blobs: GC prolazi kroz blobove koje tekuci prolaz jos nije proverio ---
+    await media_blobs_col.create_index([("gc_checked_at", ASCENDING), ("_id", ASCENDING)])
+    await media_blobs_col.create_index("last_uploaded_at")
+    await media_blobs_col.create_index("source", sparse=True)  # izvedene slike jednog originala
+
+    # --- applications: $lookup iz statistike organizacije grupise prijave po eventu i statusu ---
+    await applications_col.create_index([("event_id", ASCENDING), ("status", ASCENDING)])
+
+    # --- org_stats: javna statistika se cita po username-u organizacije ---
+    await org_stats_col.create_index("organisation_username")
+
+    # --- stats_rollups: jedan dokument po (scope, scope_id, granularity, bucket); $inc upsert ga nalazi ili pravi ---
+    await rollups_col.create_index(
+        [("scope", ASCENDING), ("scope_id", ASCENDING), ("granularity", ASCENDING), ("bucket", ASCENDING)],
+        unique=True,
+    )
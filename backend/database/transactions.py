@@ -0,0 +1,37 @@
+import logging
+import os
+from typing import Awaitable, Callable
+
+from database.connection import client
+
+logger = logging.getLogger(__name__)
+
+# auto: transakcije samo ako je Mongo replica set / mongos; off: uvek bez transakcije
+MONGO_TRANSACTIONS = os.getenv("MONGO_TRANSACTIONS", "auto")
+
+_supported: bool | None = None
+
+
+async def transactions_supported() -> bool:
+    global _supported
+    if _supported is None:
+        if MONGO_TRANSACTIONS == "off":
+            _supported = False
+        else:
+            hello = await client.admin.command("hello")
+            _supported = "setName" in hello or hello.get("msg") == "isdbgrid"
+            if not _supported:
+                logger.warning("Mongo nije replica set: upisi se izvrsavaju bez transakcije")
+    return _supported
+
+
+async def run_in_transaction(fn: Callable[[object], Awaitable[object]]):
+    """
+    Izvrsi fn(session) kao jednu transakciju (with_transaction ponavlja prolazne greske).
+    Na standalone Mongo-u fn dobija session=None i upisi idu redom, bez atomicnosti.
+    """
+    if not await transactions_supported():
+        return await fn(None)
+
+    async with await client.start_session() as session:
+        return await session.with_transaction(fn)
@@ -14,3 +14,15 @@ def get_current_week_range():
     start = now - timedelta(days=now.weekday())  # ponedeljak
     end = start + timedelta(days=7)
     return start, end
+
+
+#pocetak dnevnog / mesecnog bucketa u koji pada trenutak (rollup statistike)
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    if granularity == "month":
+        return datetime(moment.year, moment.month, 1)
+    return datetime(moment.year, moment.month, moment.day)
+
+def next_bucket(start: datetime, granularity: str) -> datetime:
+    if granularity == "month":
+        return datetime(start.year + 1, 1, 1) if start.month == 12 else datetime(start.year, start.month + 1, 1)
+    return start + timedelta(days=1)
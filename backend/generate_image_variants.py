@@ -0,0 +1,16 @@
+import asyncio
+from repositories.image_repository import ImageRepository
+from services.image_service import ImageService
+
+
+#skripta koja zakazuje izvedene velicine (thumb/card/full, WebP + JPEG) za sve vec postojece slike
+#same slike pravi job worker (API u JOB_WORKER_MODE=inprocess ili `python job_worker.py`)
+async def generate_image_variants():
+    urls = await ImageRepository().find_referenced_urls()
+    service = ImageService()
+    for url in urls:
+        await service.enqueue(url)
+    print(f"Zakazano pravljenje izvedenih slika za {len(urls)} slika.")
+
+if __name__ == "__main__":
+    asyncio.run(generate_image_variants())
@@ -0,0 +1,64 @@
+import os
+
+from PIL import Image, ImageOps
+
+# ciljne sirine izvedenih slika (visina prati odnos stranica; manje slike se ne uvecavaju)
+IMAGE_SIZES = {"thumb": 160, "card": 480, "full": 1280}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+
+def derivative_filename(filename: str, size: str, ext: str) -> str:
+    """event_x.jpg → event_x.card.webp (pored originala)"""
+    return f"{os.path.splitext(filename)[0]}.{size}.{ext}"
+
+
+def derivative_filenames(filename: str) -> list[str]:
+    return [derivative_filename(filename, size, ext) for size in IMAGE_SIZES for ext in ("webp", "jpg")]
+
+
+def is_derivative(filename: str) -> bool:
+    parts = filename.rsplit(".", 2)
+    return len(parts) == 3 and parts[1] in IMAGE_SIZES
+
+
+def _flatten(img: Image.Image) -> Image.Image:
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def _save_atomic(img: Image.Image, path: str, **options):
+    tmp_path = f"{path}.part"
+    img.save(tmp_path, **options)
+    os.replace(tmp_path, path)
+
+
+def render_derivatives(src_path: str) -> dict:
+    """
+    Izvrsava se u process pool-u (CPU posao, van event loop-a i GIL-a).
+    Vraca {velicina: {width, height, webp, jpeg}} sa imenima fajlova u istom folderu.
+    """
+    directory, filename = os.path.split(src_path)
+    result = {}
+
+    with Image.open(src_path) as original:
+        img = _flatten(ImageOps.exif_transpose(original))
+
+    for size, width in IMAGE_SIZES.items():
+        resized = img.copy()
+        if resized.width > width:
+            resized.thumbnail((width, width * 10), Image.Resampling.LANCZOS)
+
+        webp_name = derivative_filename(filename, size, "webp")
+        jpeg_name = derivative_filename(filename, size, "jpg")
+        _save_atomic(resized, os.path.join(directory, webp_name), format="WEBP", quality=WEBP_QUALITY, method=4)
+        _save_atomic(resized, os.path.join(directory, jpeg_name), format="JPEG", quality=JPEG_QUALITY,
+                     optimize=True, progressive=True)
+
+        result[size] = {"width": resized.width, "height": resized.height, "webp": webp_name, "jpeg": jpeg_name}
+
+    return result
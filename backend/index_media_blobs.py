@@ -0,0 +1,12 @@
+import asyncio
+from services.media_service import MediaService
+
+
+#skripta koja upisuje u media_blobs slike uploadovane pre content-addressed imena (uuid / id vlasnika)
+#posle toga media GC brise i stare fajlove na koje vise nista ne pokazuje
+async def index_media_blobs():
+    count = await MediaService().register_existing_files()
+    print(f"Indeksirano {count} postojećih fajlova.")
+
+if __name__ == "__main__":
+    asyncio.run(index_media_blobs())
@@ -1,5 +1,6 @@
 import bcrypt
 from database.connection import users_col
+from repositories.user_repository import UserRepository
 from models.user_models import Role
 import asyncio
 
@@ -28,7 +29,7 @@ async def init_admin():
     }
 
 
-    await users_col.insert_one(admin_data)
+    await UserRepository().create(admin_data)
     print("Kreiran admin nalog: admin@gmail.com / Admin123!")
 
 if __name__ == "__main__":
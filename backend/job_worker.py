@@ -0,0 +1,36 @@
+import asyncio
+import logging
+import os
+import signal
+
+from services.job_queue import job_pool
+import services.notification_service  # noqa: F401  (registruje handlere notify_org i flush_notifications)
+from services.outbox import outbox_dispatcher
+from services.image_service import shutdown_pool as shutdown_image_pool  # registruje image_derivatives
+import services.outbox_handlers  # noqa: F401  (registruje handlere outbox dogadjaja)
+
+
+#zaseban proces za pozadinske poslove i outbox (API tada ide sa JOB_WORKER_MODE=external)
+#WS notifikacije do soketa u API workerima stizu samo preko WS_BACKPLANE=mongo
+async def run_worker():
+    if os.getenv("WS_BACKPLANE", "memory") != "mongo":
+        logging.warning("WS_BACKPLANE nije mongo: notifikacije ce biti upisane, ali nece stici preko WebSocket-a")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    job_pool.start()
+    outbox_dispatcher.start()
+    print(f"Job worker pokrenut ({job_pool.concurrency} workera).")
+    await stop.wait()
+
+    await outbox_dispatcher.stop()
+    await job_pool.stop()
+    shutdown_image_pool()
+    print("Job worker zaustavljen.")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_worker())
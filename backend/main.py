@@ -1,6 +1,7 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
@@ -16,14 +17,100 @@ from routers import (
     public_event_routes,
     uploads,
     notifications_router,
+    public_leaderboard_routes,
 )
+from database.indexes import ensure_indexes
+from auth.revocation import TOKEN_REVOCATION_SYNC_SECONDS, revocation_list
+from scheduler import start_periodic, stop_tasks
+from services.leaderboard_service import LeaderboardService
+from services.job_queue import job_pool
+from services.image_service import shutdown_pool as shutdown_image_pool
+from services.media_service import MediaService
+from services.statistics_service import StatisticsService
+from services.platform_stats_service import PlatformStatsService
+from services.notification_service import NotificationService
+from services.outbox import outbox_dispatcher
+import services.outbox_handlers  # noqa: F401  (registruje handlere outbox dogadjaja)
+from ws_manager import ws_manager
+from upload_helpers import reject_oversized_request
+from storage import UPLOAD_ROOT, storage
+from storage.static import MediaStaticFiles
 
 
 # Učitaj .env
 load_dotenv()
 
+LEADERBOARD_REFRESH_SECONDS = int(os.getenv("LEADERBOARD_REFRESH_SECONDS", "3600"))
+UNREAD_RECONCILE_SECONDS = int(os.getenv("NOTIFICATION_UNREAD_RECONCILE_SECONDS", "3600"))
+MEDIA_GC_INTERVAL_SECONDS = int(os.getenv("MEDIA_GC_INTERVAL_SECONDS", "21600"))
+ORG_STATS_RECONCILE_SECONDS = int(os.getenv("ORG_STATS_RECONCILE_SECONDS", "21600"))
+PLATFORM_STATS_RECONCILE_SECONDS = int(os.getenv("PLATFORM_STATS_RECONCILE_SECONDS", "21600"))
+# inprocess: job workeri i outbox dispatcher rade u ovom procesu; external: pokrece ih `python job_worker.py`
+JOB_WORKER_MODE = os.getenv("JOB_WORKER_MODE", "inprocess")
+
+
+# --- Startup / shutdown: indeksi + periodični jobovi ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await ensure_indexes()
+    await ws_manager.start()
+    if JOB_WORKER_MODE == "inprocess":
+        job_pool.start()
+        outbox_dispatcher.start()
+
+    tasks = [
+        # opozvani tokeni (logout / ukradeni refresh) iz svih workera u lokalnu kopiju
+        start_periodic(
+            "token-revocations",
+            TOKEN_REVOCATION_SYNC_SECONDS,
+            revocation_list.sync,
+            run_immediately=True,
+        ),
+        start_periodic(
+            "leaderboards",
+            LEADERBOARD_REFRESH_SECONDS,
+            LeaderboardService().rebuild_all,
+            run_immediately=True,
+        ),
+        # prvi prolaz popunjava brojače nepročitanih za postojeće notifikacije
+        start_periodic(
+            "notification-unread-counts",
+            UNREAD_RECONCILE_SECONDS,
+            NotificationService().reconcile_unread_counts,
+            run_immediately=True,
+        ),
+        # uploadovani fajlovi na koje nista ne pokazuje (napusteni draftovi, zamenjene slike)
+        start_periodic(
+            "media-gc",
+            MEDIA_GC_INTERVAL_SECONDS,
+            MediaService().collect_garbage,
+        ),
+        # materijalizovana statistika organizacija: ispravka drift-a inkrementalnih brojaca
+        start_periodic(
+            "org-stats",
+            ORG_STATS_RECONCILE_SECONDS,
+            StatisticsService().reconcile_all,
+        ),
+        # admin statistika platforme: prvi prolaz popunjava brojace, kasniji ispravljaju drift
+        start_periodic(
+            "platform-stats",
+            PLATFORM_STATS_RECONCILE_SECONDS,
+            PlatformStatsService().reconcile,
+            run_immediately=True,
+        ),
+    ]
+
+    yield
+
+    await stop_tasks(tasks)
+    await outbox_dispatcher.stop()
+    await job_pool.stop()
+    shutdown_image_pool()
+    await ws_manager.stop()
+
+
 # FastAPI app
-app = FastAPI(title="Diplomski Backend",debug=True)
+app = FastAPI(title="Diplomski Backend",debug=True, lifespan=lifespan)
 
 
 # --- CORS Middleware ---
@@ -37,8 +124,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],            # dozvoli sve metode (GET, POST, PUT, DELETE...)
     allow_headers=["*"],            # dozvoli sve headere
+    expose_headers=["X-Next-Cursor"],  # cursor sledece strane kod paginiranih listi
 )
 
+# --- Upload: odbij preveliko telo po Content-Length pre nego sto se multipart uopste parsira ---
+@app.middleware("http")
+async def limit_upload_size(request: Request, call_next):
+    if request.url.path.startswith("/upload/"):
+        try:
+            reject_oversized_request(request.headers.get("content-length"), uploads.MAX_FILE_SIZE)
+        except HTTPException as e:
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+    return await call_next(request)
+
+
 # --- Mongo konekcija ---
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 MONGO_DB = os.getenv("MONGO_DB", "diplomski_db")
@@ -60,6 +159,7 @@ app.include_router(public_org_routes.router)
 app.include_router(public_event_routes.router)
 app.include_router(uploads.router)
 app.include_router(notifications_router.router)
+app.include_router(public_leaderboard_routes.router)
 
 
 
@@ -74,7 +174,9 @@ async def health_check():
     except Exception as e:
         return {"status": "error", "db": str(e)}
     
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# sa S3 skladistem slike idu direktno iz bucket-a / CDN-a, mimo API workera
+if storage.serves_locally:
+    app.mount("/uploads", MediaStaticFiles(directory=UPLOAD_ROOT), name="uploads")
 
 
 def custom_openapi():
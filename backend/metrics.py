@@ -0,0 +1,24 @@
+import threading
+from typing import Callable, Dict
+
+#jednostavan in-process registar metrika (brojaci + gauge-ovi), izlaze na /admin/metrics
+_lock = threading.Lock()
+_counters: Dict[str, float] = {}
+_gauges: Dict[str, Callable[[], float]] = {}
+
+
+def inc(name: str, value: float = 1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def register_gauge(name: str, fn: Callable[[], float]):
+    """Gauge se racuna tek pri citanju (npr. trenutni broj konekcija)"""
+    _gauges[name] = fn
+
+
+def snapshot() -> dict:
+    with _lock:
+        counters = dict(_counters)
+    gauges = {name: fn() for name, fn in _gauges.items()}
+    return {"counters": counters, "gauges": gauges}
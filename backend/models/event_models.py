@@ -5,6 +5,7 @@ from enum import Enum
 from bson import ObjectId
 from pydantic import BaseModel, Field, ConfigDict
 from .user_models import PyObjectId  # isti helper kao kod users/orgs
+from .media_models import ImageVariants, MediaUrl
 
 
 
@@ -48,10 +49,11 @@ class EventPublic(BaseModel):
     location: str
     category: EventCategory
     max_volunteers: Optional[int] = None
-    image: Optional[str] = None
+    image: Optional[MediaUrl] = None
     tags: List[str] = Field(default_factory=list)
     organisation_name: Optional[str] = None
-    image_url: Optional[str] = None
+    image_url: Optional[MediaUrl] = None
+    image_variants: Optional[ImageVariants] = None  # thumb/card/full + srcset, kada ih job napravi
 
     
     model_config = ConfigDict(
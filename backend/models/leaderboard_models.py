@@ -0,0 +1,21 @@
+from typing import List, Optional
+from enum import Enum
+from pydantic import BaseModel, Field
+
+
+class LeaderboardKind(str, Enum):
+    organisation = "organisation"
+    volunteer = "volunteer"
+
+
+#jedan red rang liste (organizacija ili volonter)
+class LeaderboardEntry(BaseModel):
+    rank: int
+    id: str
+    username: Optional[str] = None
+    name: Optional[str] = None
+    city: Optional[str] = None
+    categories: List[str] = Field(default_factory=list)
+    avg_rating: float
+    rating_count: int
+    score: float  # Bayes-ovski prilagodjen prosek, po njemu se rangira
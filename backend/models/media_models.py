@@ -0,0 +1,51 @@
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, PlainSerializer, computed_field
+
+from image_derivatives import IMAGE_SIZES
+from storage import media_url
+
+
+#URL uploadovanog fajla: u odgovoru se prepisuje na trenutni MEDIA_PUBLIC_BASE_URL / presigned GET
+#(samo JSON serijalizacija, model_dump() za upis u bazu ostaje nepromenjen)
+MediaUrl = Annotated[str, PlainSerializer(media_url, return_type=str, when_used="json")]
+
+
+#jedna velicina slike u oba formata (WebP za moderne browsere, JPEG kao fallback)
+class ImageVariant(BaseModel):
+    width: int
+    height: int
+    webp: MediaUrl
+    jpeg: MediaUrl
+
+
+#izvedene velicine originalne slike; srcset stringovi idu direktno u <img srcset> / <source srcset>
+class ImageVariants(BaseModel):
+    thumb: Optional[ImageVariant] = None
+    card: Optional[ImageVariant] = None
+    full: Optional[ImageVariant] = None
+
+    def _srcset(self, fmt: str) -> str:
+        # mala originalna slika daje iste sirine za vise velicina; srcset ne sme da ponavlja deskriptor
+        by_width = {v.width: v for v in (getattr(self, size) for size in IMAGE_SIZES) if v is not None}
+        return ", ".join(f"{media_url(getattr(v, fmt))} {width}w" for width, v in by_width.items())
+
+    @computed_field
+    @property
+    def webp_srcset(self) -> str:
+        return self._srcset("webp")
+
+    @computed_field
+    @property
+    def jpeg_srcset(self) -> str:
+        return self._srcset("jpeg")
+
+
+#direktan upload u storage: klijent prijavljuje tip, velicinu i sha256 sadrzaja
+class PresignUploadRequest(BaseModel):
+    content_type: str
+    size: Annotated[int, Field(gt=0)]
+    sha256: Annotated[str, Field(pattern=r"^[0-9a-f]{64}$")]
+
+
+class CompleteUploadRequest(BaseModel):
+    key: str
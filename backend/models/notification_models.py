@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 class NotificationIn(BaseModel):
@@ -12,3 +12,28 @@ class NotificationDB(NotificationIn):
     id: str = Field(..., alias="_id")
     created_at: datetime
     is_read: bool
+
+
+#poruke koje idu preko WebSocket-a (tipizovani JSON umesto golog stringa)
+class NotificationEnvelope(BaseModel):
+    type: Literal["notification"] = "notification"
+    id: str
+    seq: int  # rastuci redni broj notifikacije unutar organizacije
+    message: str
+    created_at: datetime
+    count: int = 1  # >1 kada je nalet dogadjaja spojen u jednu notifikaciju
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "NotificationEnvelope":
+        return cls(
+            id=str(doc["_id"]),
+            seq=doc["seq"],
+            message=doc["message"],
+            created_at=doc["created_at"],
+            count=doc.get("count", 1),
+        )
+
+
+#server ne moze da odigra propusteno (nepoznat resume_from ili previse poruka) → klijent ucitava sve iznova
+class ResyncEnvelope(BaseModel):
+    type: Literal["resync"] = "resync"
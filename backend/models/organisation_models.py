@@ -4,7 +4,8 @@ from enum import Enum
 
 from bson import ObjectId
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from .user_models import PyObjectId  # koristimo isti helper
+from .user_models import PyObjectId, RatingHistogram  # koristimo isti helper
+from .media_models import ImageVariants, MediaUrl
 
 
 #admin
@@ -57,8 +58,11 @@ class OrganisationPublic(BaseModel):
     phone: Optional[str] = None
     website: Optional[str] = None
     status: OrganisationStatus = OrganisationStatus.pending
-    logo: Optional[str] = None
+    logo: Optional[MediaUrl] = None
+    logo_variants: Optional[ImageVariants] = None
     org_type: OrganisationType = OrganisationType.official
+    rating_count: int = 0
+    rating_histogram: RatingHistogram = Field(default_factory=dict, validate_default=True)
 
 
 #login
@@ -74,7 +78,7 @@ class OrganisationDB(OrganisationIn):
     status: OrganisationStatus = OrganisationStatus.pending
     created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
     updated_at: Optional[datetime.datetime] = None
-    logo: Optional[str] = None
+    logo: Optional[MediaUrl] = None
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -69,4 +69,10 @@ class PublicReview(BaseModel):
     organisation_name: str
     rating: ReviewRating
     comment: Optional[str]
-    #created_at: datetime.datetime
+    created_at: Optional[datetime.datetime] = None
+
+
+# ---- sortiranje javnih listi review-a (uvek opadajuce) ----
+class ReviewSort(str, Enum):
+    newest = "created_at"
+    rating = "rating"
@@ -0,0 +1,63 @@
+import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Union
+from pydantic import BaseModel
+
+
+class TimeseriesMetric(str, Enum):
+    applications = "applications"                      # broj prijava po danu/mesecu
+    acceptance_rate = "acceptance_rate"                # prihvaceni / (prihvaceni + odbijeni) medju odlukama u bucketu
+    volunteers_by_category = "volunteers_by_category"  # prihvaceni volonteri po kategoriji eventa
+    events = "events"                                  # broj kreiranih eventova
+
+
+class Granularity(str, Enum):
+    day = "day"
+    month = "month"
+
+
+#jedna tacka serije; value je broj, udeo (None kada u bucketu nema odluka) ili {kategorija: broj}
+class TimeseriesPoint(BaseModel):
+    bucket: datetime.date
+    value: Union[int, float, Dict[str, int], None]
+
+
+class TimeseriesResponse(BaseModel):
+    metric: TimeseriesMetric
+    granularity: Granularity
+    date_from: datetime.date
+    date_to: datetime.date
+    event_id: Optional[str] = None
+    points: List[TimeseriesPoint]
+
+
+#admin pregled platforme: globalni brojaci i raspodele (grad / kategorija / status → broj)
+class UserCounts(BaseModel):
+    total: int = 0
+    by_city: Dict[str, int] = {}
+
+
+class OrganisationCounts(BaseModel):
+    total: int = 0
+    by_status: Dict[str, int] = {}
+
+
+class EventCounts(BaseModel):
+    total: int = 0
+    by_city: Dict[str, int] = {}
+    by_category: Dict[str, int] = {}
+
+
+class ApplicationCounts(BaseModel):
+    total: int = 0
+    by_status: Dict[str, int] = {}
+
+
+class PlatformStats(BaseModel):
+    users: UserCounts
+    organisations: OrganisationCounts
+    events: EventCounts
+    applications: ApplicationCounts
+    reviews: int = 0
+    updated_at: Optional[datetime.datetime] = None
+    reconciled_at: Optional[datetime.datetime] = None
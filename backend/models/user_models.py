@@ -1,9 +1,10 @@
 import datetime
 from enum import Enum
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, GetCoreSchemaHandler
-from typing import Annotated, List, Optional
+from pydantic import BaseModel, BeforeValidator, EmailStr, Field, ConfigDict, GetCoreSchemaHandler
+from typing import Annotated, Dict, List, Optional
 from bson import ObjectId
 from pydantic_core import core_schema
+from .media_models import ImageVariants, MediaUrl
 
 
 
@@ -24,6 +25,15 @@ class PyObjectId(ObjectId):
             return v
         raise ValueError("Invalid ObjectId")
 
+#histogram ocena 1-5 koji se cuva na user/org dokumentu; dopunjavamo kljuceve koji fale nulama
+def _fill_rating_histogram(v):
+    v = v or {}
+    return {str(i): int(v.get(str(i), 0)) for i in range(1, 6)}
+
+
+RatingHistogram = Annotated[Dict[str, int], BeforeValidator(_fill_rating_histogram)]
+
+
 class Role(str, Enum):
     user = "user"
     admin = "admin"
@@ -60,7 +70,10 @@ class UserPublic(BaseModel):
     about: Optional[str] = None
     skills: List[str] = Field(default_factory=list)
     experience: Optional[str] = None
-    profile_image: Optional[str] = None
+    profile_image: Optional[MediaUrl] = None
+    profile_image_variants: Optional[ImageVariants] = None
+    rating_count: int = 0
+    rating_histogram: RatingHistogram = Field(default_factory=dict, validate_default=True)
      
     
 class UserLogin(BaseModel):
@@ -74,7 +87,7 @@ class UserDB(UserIn):
     role: Role = Role.user
     created_at: datetime.datetime = Field(default_factory=datetime.datetime.utcnow)
     updated_at: Optional[datetime.datetime] = None
-    profile_image: Optional[str] = None
+    profile_image: Optional[MediaUrl] = None
 
     model_config = ConfigDict(
         populate_by_name=True,
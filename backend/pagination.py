@@ -0,0 +1,50 @@
+import base64
+from bson import json_util
+
+
+#keyset (cursor) paginacija: cursor nosi vrednosti sort polja poslednjeg vracenog dokumenta
+def encode_cursor(doc: dict, sort_fields: list[str]) -> str:
+    values = [doc.get(f) for f in sort_fields]
+    raw = json_util.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_fields: list[str]) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json_util.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != len(sort_fields):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def keyset_filter(sort_fields: list[str], values: list) -> dict:
+    """Uslov "posle cursor-a" za opadajuci sort po sort_fields (poslednje polje je tie-breaker, npr. _id)"""
+    branches = []
+    for i, field in enumerate(sort_fields):
+        branch = {f: values[j] for j, f in enumerate(sort_fields[:i])}
+        branch[field] = {"$lt": values[i]}
+        branches.append(branch)
+    return {"$or": branches}
+
+
+async def fetch_page(collection, query: dict, sort_fields: list[str], limit: int,
+                     cursor: str | None = None, projection: dict | None = None):
+    """Vraca (dokumenti, next_cursor); next_cursor je None na poslednjoj strani"""
+    if cursor:
+        query = {"$and": [query, keyset_filter(sort_fields, decode_cursor(cursor, sort_fields))]}
+
+    docs = await collection.find(query, projection) \
+        .sort([(f, -1) for f in sort_fields]) \
+        .limit(limit + 1) \
+        .to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1], sort_fields)
+
+    return docs, next_cursor
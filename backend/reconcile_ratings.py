@@ -0,0 +1,12 @@
+import asyncio
+from services.review_service import ReviewService
+
+
+#skripta koja ponovo racuna rating_sum / rating_count / rating_histogram iz reviews kolekcije
+#pokretati povremeno (cron) ili nakon rucnih izmena u bazi
+async def reconcile_ratings():
+    result = await ReviewService().reconcile_rating_aggregates()
+    print(f"Agregati ocena osveženi: {result['organisations']} organizacija, {result['users']} korisnika.")
+
+if __name__ == "__main__":
+    asyncio.run(reconcile_ratings())
@@ -1,5 +1,8 @@
+from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 from database.connection import applications_col
+from repositories.platform_stats_repository import platform_stats
 
 
 class ApplicationRepository:
@@ -7,8 +10,10 @@ class ApplicationRepository:
     # -------------------------------------------------
     # CREATE APPLICATION
     # -------------------------------------------------
-    async def create(self, application_data: dict):
-        result = await applications_col.insert_one(application_data)
+    async def create(self, application_data: dict, session=None):
+        result = await applications_col.insert_one(application_data, session=session)
+        await platform_stats.increment(platform_stats.application_fields(application_data.get("status"), 1),
+                                       session=session)
         return str(result.inserted_id)
 
     # -------------------------------------------------
@@ -69,11 +74,34 @@ class ApplicationRepository:
     # -------------------------------------------------
     # UPDATE STATUS
     # -------------------------------------------------
-    async def update_status(self, application_id: str, update_data: dict):
-        await applications_col.update_one(
-            {"_id": ObjectId(application_id)},
-            {"$set": update_data}
-        )
+    async def update_status(self, application_id: str, update_data: dict, session=None):
+        """Vraca prijavu PRE izmene (atomski), da bi brojaci znali iz kog statusa (i kada odlucenog) je presla.
+        decided_at (trenutak poslednje promene statusa) se upisuje samo kada se status zaista menja."""
+        projection = {"status": 1, "created_at": 1, "updated_at": 1, "decided_at": 1}
+        previous = None
+        if "status" in update_data:
+            previous = await applications_col.find_one_and_update(
+                {"_id": ObjectId(application_id), "status": {"$ne": update_data["status"]}},
+                {"$set": {**update_data, "decided_at": update_data.get("updated_at") or datetime.utcnow()}},
+                projection=projection,
+                return_document=ReturnDocument.BEFORE,
+                session=session
+            )
+        if previous is None:
+            # isti status (ili izmena bez statusa): decided_at ostaje kakav je bio
+            previous = await applications_col.find_one_and_update(
+                {"_id": ObjectId(application_id)},
+                {"$set": update_data},
+                projection=projection,
+                return_document=ReturnDocument.BEFORE,
+                session=session
+            )
+        if previous and "status" in update_data:
+            await platform_stats.increment(platform_stats.combine(
+                platform_stats.application_fields(previous.get("status"), -1),
+                platform_stats.application_fields(update_data["status"], 1),
+            ), session=session)
+        return previous
 
     # -------------------------------------------------
     # FIND BY ID (KORISTI SE U CANCEL)
@@ -106,3 +134,20 @@ class ApplicationRepository:
 
         return apps
 
+
+    # -------------------------------------------------
+    # KATEGORIJE EVENTOVA NA KOJIMA JE USER VOLONTIRAO
+    # -------------------------------------------------
+    async def accepted_categories_by_user(self, user_ids: list[ObjectId]):
+        rows = await applications_col.aggregate([
+            {"$match": {"user_id": {"$in": user_ids}, "status": "accepted"}},
+            {"$lookup": {
+                "from": "events",
+                "localField": "event_id",
+                "foreignField": "_id",
+                "as": "event",
+            }},
+            {"$unwind": "$event"},
+            {"$group": {"_id": "$user_id", "categories": {"$addToSet": "$event.category"}}},
+        ]).to_list(length=None)
+        return {r["_id"]: r["categories"] for r in rows}
@@ -1,6 +1,7 @@
 from bson import ObjectId
 from fastapi import HTTPException
 from database.connection import events_col, organisations_col
+from repositories.platform_stats_repository import platform_stats
 
 
 class EventRepository:
@@ -8,6 +9,7 @@ class EventRepository:
    
     async def create_event(self, event_data: dict):
         result = await events_col.insert_one(event_data)
+        await platform_stats.increment(platform_stats.event_fields(event_data, 1))
         return str(result.inserted_id)
 
     async def find_by_id(self, event_id: str):
@@ -62,16 +64,27 @@ class EventRepository:
 
 
     async def update(self, event_id: str, update_data: dict):
-        result = await events_col.update_one(
+        # dokument PRE izmene: grad/kategorija za admin statistiku
+        previous = await events_col.find_one_and_update(
             {"_id": ObjectId(event_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"location": 1, "category": 1}
         )
-        return result.modified_count > 0
+        if previous and ("location" in update_data or "category" in update_data):
+            await platform_stats.increment(platform_stats.combine(
+                platform_stats.event_fields(previous, -1),
+                platform_stats.event_fields({**previous, **update_data}, 1),
+            ))
+        return previous is not None
 
 
     async def delete(self, event_id: str):
-        result = await events_col.delete_one({"_id": ObjectId(event_id)})
-        return result.deleted_count > 0
+        event = await events_col.find_one_and_delete(
+            {"_id": ObjectId(event_id)}, projection={"location": 1, "category": 1}
+        )
+        if event:
+            await platform_stats.increment(platform_stats.event_fields(event, -1))
+        return event is not None
     
 
     async def filter_events(self, query: dict):
@@ -113,16 +126,22 @@ class EventRepository:
 
 
     async def delete_by_id(self, event_id: str):
-        result = await events_col.delete_one({"_id": ObjectId(event_id)})
-        if result.deleted_count == 0:
+        event = await events_col.find_one_and_delete(
+            {"_id": ObjectId(event_id)}, projection={"location": 1, "category": 1}
+        )
+        if event is None:
             raise HTTPException(status_code=404, detail="Event nije pronađen")
+        await platform_stats.increment(platform_stats.event_fields(event, -1))
         
     #ovo je neki cudan helper koji nam treba da izvlaci eventove po id-jevima        
-    async def find_by_ids(self, ids: list[str]):
-        events = await events_col.find({"_id": {"$in": [ObjectId(i) for i in ids]}}).to_list(length=None)
+    async def find_by_ids(self, ids: list[str], projection: dict | None = None):
+        events = await events_col.find(
+            {"_id": {"$in": [ObjectId(i) for i in ids]}}, projection
+        ).to_list(length=None)
         for e in events:
             e["_id"] = str(e["_id"])
-            e["organisation_id"] = str(e["organisation_id"])
+            if "organisation_id" in e:
+                e["organisation_id"] = str(e["organisation_id"])
         return events
     
     
@@ -137,3 +156,13 @@ class EventRepository:
             ev["organisation_id"] = str(ev["organisation_id"])
 
         return events
+
+
+
+    #kategorije eventova po organizaciji: {organisation_id: [kategorije]}
+    async def categories_by_organisation(self, organisation_ids: list[ObjectId]):
+        rows = await events_col.aggregate([
+            {"$match": {"organisation_id": {"$in": organisation_ids}}},
+            {"$group": {"_id": "$organisation_id", "categories": {"$addToSet": "$category"}}},
+        ]).to_list(length=None)
+        return {r["_id"]: r["categories"] for r in rows}
@@ -0,0 +1,37 @@
+from datetime import datetime
+from database.connection import events_col, images_col, organisations_col, users_col
+
+
+class ImageRepository:
+
+    async def save_variants(self, path: str, url: str, variants: dict):
+        await images_col.update_one(
+            {"_id": path},
+            {"$set": {"url": url, "variants": variants, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def find_variants_by_url(self, url: str) -> dict | None:
+        doc = await images_col.find_one({"url": url}, {"variants": 1})
+        return doc["variants"] if doc else None
+
+    async def delete_variants(self, path: str):
+        await images_col.delete_one({"_id": path})
+
+    async def attach_to_owners(self, url: str, variants: dict):
+        """Upisi varijante na sve dokumente koji vec pokazuju na original"""
+        await users_col.update_many({"profile_image": url}, {"$set": {"profile_image_variants": variants}})
+        await organisations_col.update_many({"logo": url}, {"$set": {"logo_variants": variants}})
+        await events_col.update_many(
+            {"$or": [{"image_url": url}, {"image": url}]},
+            {"$set": {"image_variants": variants}}
+        )
+
+    async def find_referenced_urls(self) -> set[str]:
+        """Sve slike na koje pokazuju korisnici, organizacije i eventi (za backfill)"""
+        urls = set()
+        for col, fields in ((users_col, ["profile_image"]), (organisations_col, ["logo"]),
+                            (events_col, ["image_url", "image"])):
+            for field in fields:
+                urls.update(u for u in await col.distinct(field) if u)
+        return urls
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ReturnDocument
+from database.connection import jobs_col
+
+
+# stanja posla: queued → running → done | (queued ponovo uz backoff) | dead
+class JobRepository:
+
+    async def enqueue(self, kind: str, payload: dict, run_at: datetime | None = None, session=None) -> str:
+        now = datetime.utcnow()
+        result = await jobs_col.insert_one({
+            "kind": kind,
+            "payload": payload,
+            "status": "queued",
+            "attempts": 0,
+            "run_at": run_at or now,
+            "created_at": now,
+        }, session=session)
+        return str(result.inserted_id)
+
+    async def lease(self, worker_id: str, lease_seconds: float):
+        """Atomski preuzmi najstariji spreman posao (ili onaj ciji je lease istekao jer je worker pao)"""
+        now = datetime.utcnow()
+        return await jobs_col.find_one_and_update(
+            {"$or": [
+                {"status": "queued", "run_at": {"$lte": now}},
+                {"status": "running", "lease_until": {"$lt": now}},
+            ]},
+            {
+                "$set": {
+                    "status": "running",
+                    "worker": worker_id,
+                    "leased_at": now,
+                    "lease_until": now + timedelta(seconds=lease_seconds),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def complete(self, job_id: ObjectId, worker_id: str):
+        await jobs_col.update_one(
+            {"_id": job_id, "worker": worker_id},
+            {"$set": {"status": "done", "finished_at": datetime.utcnow()}, "$unset": {"lease_until": ""}}
+        )
+
+    async def retry(self, job_id: ObjectId, worker_id: str, error: str, run_at: datetime):
+        await jobs_col.update_one(
+            {"_id": job_id, "worker": worker_id},
+            {"$set": {"status": "queued", "run_at": run_at, "last_error": error}, "$unset": {"lease_until": ""}}
+        )
+
+    async def bury(self, job_id: ObjectId, worker_id: str, error: str):
+        """Dead-letter: posao je potrosio sve pokusaje i ostaje u bazi za pregled"""
+        await jobs_col.update_one(
+            {"_id": job_id, "worker": worker_id},
+            {"$set": {"status": "dead", "last_error": error, "finished_at": datetime.utcnow()},
+             "$unset": {"lease_until": ""}}
+        )
+
+    async def count_by_status(self) -> dict:
+        rows = await jobs_col.aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]).to_list(length=None)
+        return {row["_id"]: row["count"] for row in rows}
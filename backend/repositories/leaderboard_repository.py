@@ -0,0 +1,70 @@
+from datetime import datetime
+from pymongo import UpdateOne
+from database.connection import leaderboards_col
+
+
+class LeaderboardRepository:
+
+    # -------------------------------------------------
+    # META (globalni prosek po vrsti rang liste)
+    # -------------------------------------------------
+    async def get_meta(self, kind: str):
+        return await leaderboards_col.find_one({"kind": f"meta:{kind}"})
+
+    async def set_meta(self, kind: str, global_mean: float, total_ratings: int):
+        await leaderboards_col.update_one(
+            {"kind": f"meta:{kind}", "subject_id": None},
+            {"$set": {
+                "global_mean": global_mean,
+                "total_ratings": total_ratings,
+                "refreshed_at": datetime.utcnow(),
+            }},
+            upsert=True
+        )
+
+    # -------------------------------------------------
+    # UPSERT JEDNOG UNOSA (inkrementalno osvezavanje)
+    # -------------------------------------------------
+    async def upsert_entry(self, kind: str, subject_id: str, data: dict, category: str | None = None):
+        update = {"$set": {**data, "updated_at": datetime.utcnow()}}
+        if category:
+            update["$addToSet"] = {"categories": category}
+
+        await leaderboards_col.update_one(
+            {"kind": kind, "subject_id": subject_id},
+            update,
+            upsert=True
+        )
+
+    # -------------------------------------------------
+    # MATERIJALIZACIJA CELE RANG LISTE (periodicni job)
+    # -------------------------------------------------
+    async def replace_kind(self, kind: str, entries: list[dict]):
+        refreshed_at = datetime.utcnow()
+
+        ops = [
+            UpdateOne(
+                {"kind": kind, "subject_id": e["subject_id"]},
+                {"$set": {**e, "kind": kind, "updated_at": refreshed_at}},
+                upsert=True
+            )
+            for e in entries
+        ]
+        if ops:
+            await leaderboards_col.bulk_write(ops, ordered=False)
+
+        # obrisi unose koji vise ne postoje (npr. obrisan user, odbijena organizacija)
+        await leaderboards_col.delete_many({"kind": kind, "updated_at": {"$lt": refreshed_at}})
+
+    # -------------------------------------------------
+    # TOP N (jedan indeksiran range upit)
+    # -------------------------------------------------
+    async def find_top(self, kind: str, city_key: str | None = None, category: str | None = None, limit: int = 20):
+        query = {"kind": kind}
+        if city_key:
+            query["city_key"] = city_key
+        if category:
+            query["categories"] = category
+
+        cursor = leaderboards_col.find(query, {"_id": 0}).sort("score", -1).limit(limit)
+        return await cursor.to_list(length=limit)
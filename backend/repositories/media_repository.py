@@ -0,0 +1,67 @@
+from datetime import datetime
+from database.connection import media_blobs_col
+
+
+# indeks uploadovanih fajlova: _id = putanja u uploads/ (npr. events/<sha256>.jpg)
+class MediaRepository:
+
+    async def touch_blob(self, path: str, sha256: str, size: int, content_type: str | None):
+        """Novi blob ili ponovni upload istog sadrzaja; last_uploaded_at pomera GC grace period"""
+        now = datetime.utcnow()
+        await media_blobs_col.update_one(
+            {"_id": path},
+            {
+                "$set": {"last_uploaded_at": now},
+                "$setOnInsert": {"sha256": sha256, "size": size, "content_type": content_type, "created_at": now},
+                "$inc": {"uploads": 1},
+            },
+            upsert=True
+        )
+
+    async def register_existing(self, path: str, sha256: str, size: int, uploaded_at: datetime):
+        """Fajl uploadovan pre indeksa blobova (postojeci zapis se ne dira)"""
+        await media_blobs_col.update_one(
+            {"_id": path},
+            {"$setOnInsert": {"sha256": sha256, "size": size, "content_type": None,
+                              "created_at": uploaded_at, "last_uploaded_at": uploaded_at, "uploads": 1}},
+            upsert=True
+        )
+
+    async def register_derivative(self, path: str, source: str, sha256: str, size: int, content_type: str):
+        """Izvedena slika: bez last_uploaded_at (GC je ne bira), brise se zajedno sa originalom"""
+        await media_blobs_col.update_one(
+            {"_id": path},
+            {"$set": {"source": source, "sha256": sha256, "size": size, "content_type": content_type,
+                      "created_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def delete_derivatives(self, source: str):
+        await media_blobs_col.delete_many({"source": source})
+
+    async def find_meta(self, path: str) -> dict | None:
+        """Unapred izracunati sha256 i velicina (za ETag), bez citanja fajla"""
+        return await media_blobs_col.find_one({"_id": path}, {"sha256": 1, "size": 1})
+
+    async def find_gc_candidates(self, uploaded_before: datetime, checked_before: datetime, limit: int):
+        """Blobovi van grace perioda koje ovaj prolaz GC-a jos nije proverio (gc_checked_at < checked_before)"""
+        return await media_blobs_col.find(
+            {
+                "last_uploaded_at": {"$lt": uploaded_before},
+                "$or": [{"gc_checked_at": None}, {"gc_checked_at": {"$lt": checked_before}}],
+            },
+            {"last_uploaded_at": 1}
+        ).sort([("gc_checked_at", 1), ("_id", 1)]).limit(limit).to_list(length=limit)
+
+    async def mark_gc_checked(self, paths: list[str], checked_at: datetime):
+        """Provereni (zadrzani) blobovi: sledeca strana GC-a ide dalje umesto da ih uzme ponovo"""
+        if paths:
+            await media_blobs_col.update_many({"_id": {"$in": paths}}, {"$set": {"gc_checked_at": checked_at}})
+
+    async def delete_if_unchanged(self, path: str, last_uploaded_at: datetime) -> bool:
+        """Brisanje samo ako u medjuvremenu nije bilo ponovnog upload-a"""
+        result = await media_blobs_col.delete_one({"_id": path, "last_uploaded_at": last_uploaded_at})
+        return result.deleted_count == 1
+
+    async def exists(self, path: str) -> bool:
+        return await media_blobs_col.count_documents({"_id": path}, limit=1) > 0
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ReturnDocument
+from database.connection import notification_buckets_col
+
+
+# bucket spajanja notifikacija: open → zatvoren (flush u toku, flushed_by = vlasnik) → obrisan kada je
+# zbirna poruka upisana
+class NotificationBucketRepository:
+
+    async def add(self, organisation_id: str, group: str, message: str, summary: str, now: datetime):
+        """Dodaj dogadjaj u otvoreni bucket (organizacija, grupa); vraca bucket posle izmene"""
+        return await notification_buckets_col.find_one_and_update(
+            {"organisation_id": organisation_id, "group": group, "open": True},
+            {
+                "$inc": {"count": 1},
+                "$set": {"summary": summary, "last_at": now},
+                "$setOnInsert": {"message": message, "first_at": now, "flush_scheduled": False},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def claim_flush(self, bucket_id: ObjectId, session=None) -> bool:
+        """Samo jedan add() (onaj koji prvi prebaci flush_scheduled) zakazuje flush posao"""
+        result = await notification_buckets_col.update_one(
+            {"_id": bucket_id, "flush_scheduled": False},
+            {"$set": {"flush_scheduled": True}},
+            session=session
+        )
+        return result.modified_count == 1
+
+    async def close_if_due(self, bucket_id: ObjectId, flush_id: str, now: datetime, window: float,
+                           max_delay: float):
+        """Atomski zatvori bucket ako mu je istekao prozor; flush posao koji ga zatvori postaje vlasnik
+        (flushed_by), a novi dogadjaji posle toga idu u novi bucket"""
+        return await notification_buckets_col.find_one_and_update(
+            {
+                "_id": bucket_id,
+                "open": True,
+                "$or": [
+                    {"last_at": {"$lte": now - timedelta(seconds=window)}},
+                    {"first_at": {"$lte": now - timedelta(seconds=max_delay)}},
+                ],
+            },
+            {"$set": {"open": False, "closed_at": now, "flushed_by": flush_id}},
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def find_by_id(self, bucket_id: ObjectId):
+        return await notification_buckets_col.find_one({"_id": bucket_id})
+
+    async def delete(self, bucket_id: ObjectId):
+        await notification_buckets_col.delete_one({"_id": bucket_id})
@@ -1,5 +1,11 @@
+from datetime import datetime
 from bson import ObjectId
-from database.connection import notifications_col
+from pymongo import ReturnDocument, UpdateOne
+from database.connection import notifications_col, notification_state_col
+from pagination import fetch_page
+
+# najnovije prvo; _id razbija izjednacenja kada dve notifikacije imaju isti created_at
+HISTORY_SORT_FIELDS = ["created_at", "_id"]
 
 
 class NotificationRepository:
@@ -9,21 +15,97 @@ class NotificationRepository:
         result = await notifications_col.insert_one(data)
         return str(result.inserted_id)
 
-    async def get_by_org(self, organisation_id: str):
-        """Vrati sve notifikacije organizacije"""
-        cursor = notifications_col.find({
-            "organisation_id": ObjectId(organisation_id)
-        }).sort("created_at", -1)
+    async def get_by_org(self, organisation_id: str, limit: int, before: str | None = None,
+                         unread_only: bool = False):
+        """Jedna strana istorije (najnovije prvo); vraca (notifikacije, next_cursor)"""
+        query = {"organisation_id": ObjectId(organisation_id)}
+        if unread_only:
+            query["is_read"] = False
+
+        docs, next_cursor = await fetch_page(notifications_col, query, HISTORY_SORT_FIELDS, limit, before)
 
-        result = []
-        async for doc in cursor:
+        for doc in docs:
             doc["_id"] = str(doc["_id"])
             doc["organisation_id"] = str(doc["organisation_id"])
-            result.append(doc)
-        return result
+        return docs, next_cursor
+
+    async def mark_as_read(self, notification_id: str, organisation_id: str) -> bool:
+        """True samo ako je notifikacija upravo prešla iz nepročitane u pročitanu"""
+        result = await notifications_col.update_one(
+            {"_id": ObjectId(notification_id), "organisation_id": ObjectId(organisation_id), "is_read": False},
+            {"$set": {"is_read": True, "read_at": datetime.utcnow()}}  # read_at pokreće TTL brisanje
+        )
+        return result.modified_count == 1
+
+    async def mark_all_as_read(self, organisation_id: str) -> int:
+        result = await notifications_col.update_many(
+            {"organisation_id": ObjectId(organisation_id), "is_read": False},
+            {"$set": {"is_read": True, "read_at": datetime.utcnow()}}
+        )
+        return result.modified_count
+
+    # --- brojač nepročitanih u notification_state (jedan dokument po organizaciji) ---
+
+    async def inc_unread(self, organisation_id: str, delta: int):
+        await notification_state_col.update_one(
+            {"_id": ObjectId(organisation_id)},
+            {"$inc": {"unread": delta}},
+            upsert=True
+        )
 
-    async def mark_as_read(self, notification_id: str):
-        await notifications_col.update_one(
-            {"_id": ObjectId(notification_id)},
-            {"$set": {"is_read": True}}
+    async def get_unread(self, organisation_id: str) -> int:
+        state = await notification_state_col.find_one({"_id": ObjectId(organisation_id)}, {"unread": 1})
+        return max(0, state.get("unread", 0)) if state else 0
+
+    async def recount_unread(self) -> int:
+        """Prebroji nepročitane iz notifications i prepiše brojače (backfill + ispravka drift-a)"""
+        counts = {
+            row["_id"]: row["count"]
+            async for row in notifications_col.aggregate([
+                {"$match": {"is_read": False}},
+                {"$group": {"_id": "$organisation_id", "count": {"$sum": 1}}},
+            ])
+        }
+
+        ops = [UpdateOne({"_id": org_id}, {"$set": {"unread": count}}, upsert=True) for org_id, count in counts.items()]
+        if ops:
+            await notification_state_col.bulk_write(ops, ordered=False)
+        await notification_state_col.update_many(
+            {"_id": {"$nin": list(counts)}, "unread": {"$ne": 0}},
+            {"$set": {"unread": 0}}
         )
+        return len(counts)
+
+    async def backfill_read_at(self) -> int:
+        """Pročitane notifikacije od pre TTL-a nemaju read_at pa nikad ne bi istekle"""
+        result = await notifications_col.update_many(
+            {"is_read": True, "read_at": {"$exists": False}},
+            {"$set": {"read_at": datetime.utcnow()}}
+        )
+        return result.modified_count
+
+    async def next_seq(self, organisation_id: str) -> int:
+        """Atomski sledeci redni broj notifikacije organizacije"""
+        state = await notification_state_col.find_one_and_update(
+            {"_id": ObjectId(organisation_id)},
+            {"$inc": {"seq": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return state["seq"]
+
+    async def find_seq(self, organisation_id: str, notification_id: str):
+        if not ObjectId.is_valid(notification_id):
+            return None
+        doc = await notifications_col.find_one(
+            {"_id": ObjectId(notification_id), "organisation_id": ObjectId(organisation_id)},
+            {"seq": 1}
+        )
+        return doc.get("seq") if doc else None
+
+    async def find_after_seq(self, organisation_id: str, seq: int, limit: int):
+        """Range upit po (organisation_id, seq) indeksu, redom kako su nastale"""
+        return await notifications_col.find(
+            {"organisation_id": ObjectId(organisation_id), "seq": {"$gt": seq}},
+            {"message": 1, "seq": 1, "created_at": 1, "count": 1, "group": 1}
+        ).sort("seq", 1).limit(limit).to_list(length=limit)
@@ -0,0 +1,135 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+from database.connection import events_col, org_stats_col
+
+APPLICATION_STATUSES = ("pending", "accepted", "rejected", "cancelled")
+
+
+class OrgStatsRepository:
+
+    # -------------------------------------------------
+    # CITANJE (jedan upit po username-u)
+    # -------------------------------------------------
+    async def find_by_username(self, username: str):
+        return await org_stats_col.find_one({"organisation_username": username})
+
+    async def find_organisation_ids(self):
+        return await org_stats_col.distinct("_id")
+
+    async def find_version(self, organisation_id: ObjectId):
+        """Verzija dokumenta (None ako ne postoji); svaka izmena je povecava"""
+        doc = await org_stats_col.find_one({"_id": organisation_id}, {"version": 1})
+        return doc.get("version") if doc else None
+
+    # -------------------------------------------------
+    # PUNO PRERACUNAVANJE: jedna agregacija nad events + $lookup na applications
+    # -------------------------------------------------
+    async def compute(self, organisation_id: ObjectId, now: datetime) -> dict:
+        is_active = {"$gte": ["$end_date", now]}
+        rows = await events_col.aggregate([
+            {"$match": {"organisation_id": organisation_id}},
+            {"$facet": {
+                "events": [
+                    {"$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "active": {"$sum": {"$cond": [is_active, 1, 0]}},
+                        # najraniji kraj aktivnog eventa: tada active_events prvi put zastareva
+                        "active_until": {"$min": {"$cond": [is_active, "$end_date", None]}},
+                    }},
+                ],
+                "last_event": [
+                    {"$sort": {"created_at": -1}},
+                    {"$limit": 1},
+                    {"$project": {"_id": 0, "title": 1, "start_date": 1, "created_at": 1}},
+                ],
+                "applications": [
+                    {"$project": {"_id": 1}},
+                    # obican equality $lookup (indeks event_id; localField + pipeline trazi MongoDB 5.0+);
+                    # $unwind odmah posle $lookup-a Mongo spaja s njim, pa se niz prijava ne gradi
+                    {"$lookup": {
+                        "from": "applications",
+                        "localField": "_id",
+                        "foreignField": "event_id",
+                        "as": "application",
+                    }},
+                    {"$unwind": "$application"},
+                    {"$group": {"_id": "$application.status", "count": {"$sum": 1}}},
+                ],
+            }},
+        ]).to_list(length=1)
+
+        facet = rows[0] if rows else {"events": [], "last_event": [], "applications": []}
+        events = facet["events"][0] if facet["events"] else {"total": 0, "active": 0, "active_until": None}
+        status_counts = {status: 0 for status in APPLICATION_STATUSES}
+        for row in facet["applications"]:
+            status_counts[row["_id"]] = row["count"]
+
+        return {
+            "total_events": events["total"],
+            "active_events": events["active"],
+            "active_until": events["active_until"],
+            "last_event": facet["last_event"][0] if facet["last_event"] else None,
+            "total_applications": sum(status_counts.values()),
+            "status_counts": status_counts,
+        }
+
+    async def replace(self, organisation_id: ObjectId, username: str, stats: dict, version) -> bool:
+        """Upis preracunate statistike samo ako se verzija nije menjala od pocetka compute-a
+        (compare-and-set); False znaci da je izmena stigla u medjuvremenu i da rezultat nije upisan"""
+        stats = dict(stats)
+        update = {}
+        if stats.get("active_until") is None:
+            # polje izostaje (ne null) da bi $min u event_created upisao prvi datum
+            stats.pop("active_until", None)
+            update["$unset"] = {"active_until": ""}
+        update["$set"] = {**stats, "organisation_username": username, "stale": False,
+                          "refreshed_at": datetime.utcnow()}
+        update["$inc"] = {"version": 1}
+        # bez verzije: dokument ne postoji (ili je iz vremena pre verzija); $exists se ne prepisuje u upsert
+        query = {"_id": organisation_id, "version": version if version is not None else {"$exists": False}}
+        try:
+            result = await org_stats_col.update_one(query, update, upsert=True)
+        except DuplicateKeyError:
+            return False  # dokument je u medjuvremenu nastao (ili dobio novu verziju) → upsert se sudario sa _id
+        return result.matched_count == 1 or result.upserted_id is not None
+
+    # -------------------------------------------------
+    # INKREMENTALNE IZMENE (u istoj transakciji kao upis prijave / eventa)
+    # svaka povecava version (pa preracunavanje koje je u toku ne pregazi izmenu) i radi upsert:
+    # izmena pre prvog preracunavanja ostavlja trag, a dokument bez organisation_username se
+    # pri citanju ionako preracunava u celosti
+    # -------------------------------------------------
+    async def application_created(self, organisation_id: ObjectId, status: str, session=None):
+        await org_stats_col.update_one(
+            {"_id": organisation_id},
+            {"$inc": {"total_applications": 1, f"status_counts.{status}": 1, "version": 1}},
+            upsert=True,
+            session=session
+        )
+
+    async def application_status_changed(self, organisation_id: ObjectId, old_status: str, new_status: str,
+                                         session=None):
+        await org_stats_col.update_one(
+            {"_id": organisation_id},
+            {"$inc": {f"status_counts.{old_status}": -1, f"status_counts.{new_status}": 1, "version": 1}},
+            upsert=True,
+            session=session
+        )
+
+    async def event_created(self, organisation_id: ObjectId, event: dict, now: datetime):
+        update = {
+            "$inc": {"total_events": 1, "version": 1},
+            "$set": {"last_event": {k: event[k] for k in ("title", "start_date", "created_at")}},
+        }
+        if event["end_date"] >= now:
+            update["$inc"]["active_events"] = 1
+            update["$min"] = {"active_until": event["end_date"]}
+        await org_stats_col.update_one({"_id": organisation_id}, update, upsert=True)
+
+    async def mark_stale(self, organisation_id: ObjectId):
+        """Izmena/brisanje eventa menja datume i prijave → sledece citanje preracunava sve"""
+        await org_stats_col.update_one(
+            {"_id": organisation_id}, {"$set": {"stale": True}, "$inc": {"version": 1}}, upsert=True
+        )
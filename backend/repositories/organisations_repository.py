@@ -1,6 +1,9 @@
 from bson import ObjectId
 from database.connection import organisations_col, events_col
 from bson.errors import InvalidId
+from pymongo import UpdateOne
+from auth.principal_cache import principal_cache
+from repositories.platform_stats_repository import platform_stats
 
 
 class OrganisationRepository:
@@ -15,14 +18,24 @@ class OrganisationRepository:
         
 
     async def update_status(self, org_id: str, new_status: str):
-        result = await organisations_col.update_one(
-            {"username": org_id},
-            {"$set": {"status": new_status}}
+        org = await organisations_col.find_one_and_update(
+            {"username": org_id, "status": {"$ne": new_status}},
+            {"$set": {"status": new_status}},
+            projection={"_id": 1, "status": 1}
         )
-        return result.modified_count
+        if not org:
+            return 0
+        principal_cache.invalidate("organisation", org["_id"])
+        # vraceni dokument je stanje PRE izmene → stari status
+        await platform_stats.increment(platform_stats.combine(
+            platform_stats.organisation_fields(org.get("status"), -1),
+            platform_stats.organisation_fields(new_status, 1),
+        ))
+        return 1
 
     async def create_organisation(self, org_data: dict):
         result = await organisations_col.insert_one(org_data)
+        await platform_stats.increment(platform_stats.organisation_fields(org_data.get("status"), 1))
         return str(result.inserted_id)
 
     async def find_by_email(self, email: str):
@@ -50,7 +63,7 @@ class OrganisationRepository:
         return events
     
     
-    async def find_many_by_ids(self, ids: list):
+    async def find_many_by_ids(self, ids: list, projection: dict | None = None):
         if not ids:
             return []
 
@@ -59,7 +72,7 @@ class OrganisationRepository:
         if not valid_ids:
             return []
 
-        orgs = await organisations_col.find({"_id": {"$in": valid_ids}}).to_list(length=None)
+        orgs = await organisations_col.find({"_id": {"$in": valid_ids}}, projection).to_list(length=None)
 
         for o in orgs:
             o["_id"] = str(o["_id"])
@@ -89,6 +102,7 @@ class OrganisationRepository:
             {"_id": ObjectId(org_id)},
             {"$set": update_data}
         )
+        principal_cache.invalidate("organisation", org_id)
         return result
             
             
@@ -99,4 +113,43 @@ class OrganisationRepository:
         return org
 
 
+    # ============================
+    # RATING AGREGATI (rating_sum, rating_count, histogram)
+    # ============================
+    async def inc_rating(self, organisation_id, rating: int, session=None):
+        """Atomski $inc agregata ocena nakon novog review-a"""
+        await organisations_col.update_one(
+            {"_id": ObjectId(organisation_id)},
+            {"$inc": {
+                "rating_sum": rating,
+                "rating_count": 1,
+                f"rating_histogram.{rating}": 1,
+            }},
+            session=session
+        )
+
+    async def find_rating_aggregates(self, organisation_id: str):
+        return await organisations_col.find_one(
+            {"_id": ObjectId(organisation_id)},
+            {"rating_sum": 1, "rating_count": 1, "rating_histogram": 1}
+        )
+
+    async def set_rating_aggregates(self, aggregates: dict):
+        """Reconcile: upisuje agregate izracunate iz reviews, ostale resetuje na nulu"""
+        empty = {"rating_sum": 0, "rating_count": 0, "rating_histogram": {str(i): 0 for i in range(1, 6)}}
+
+        ops = [UpdateOne({"_id": _id}, {"$set": values}) for _id, values in aggregates.items()]
+        if ops:
+            await organisations_col.bulk_write(ops, ordered=False)
+
+        await organisations_col.update_many(
+            {"_id": {"$nin": list(aggregates.keys())}, "rating_count": {"$ne": 0}},
+            {"$set": empty}
+        )
 
+    #organizacije koje imaju bar jednu ocenu (za rang listu)
+    async def find_rated(self):
+        return await organisations_col.find(
+            {"status": "approved", "rating_count": {"$gt": 0}},
+            {"username": 1, "name": 1, "location": 1, "rating_sum": 1, "rating_count": 1}
+        ).to_list(length=None)
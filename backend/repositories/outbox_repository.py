@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime, timedelta
+from bson import ObjectId
+from database.connection import outbox_col
+
+
+# outbox dogadjaj: pending → dispatched | (pending ponovo uz backoff) | failed
+class OutboxRepository:
+
+    async def add(self, type: str, payload: dict, session=None):
+        """Upisuje se u istoj transakciji kao i promena domena"""
+        await outbox_col.insert_one({
+            "type": type,
+            "payload": payload,
+            "status": "pending",
+            "attempts": 0,
+            "available_at": datetime.utcnow(),
+            "created_at": datetime.utcnow(),
+        }, session=session)
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> list[dict]:
+        """Preuzmi do `limit` najstarijih dogadjaja; istekli lease znaci da je dispatcher pao"""
+        now = datetime.utcnow()
+        ready = {"$or": [
+            {"status": "pending", "available_at": {"$lte": now}},
+            {"status": "dispatching", "lease_until": {"$lt": now}},
+        ]}
+        ids = [doc["_id"] for doc in await outbox_col.find(ready, {"_id": 1}).sort("_id", 1).limit(limit).to_list(length=limit)]
+        if not ids:
+            return []
+
+        token = uuid.uuid4().hex
+        await outbox_col.update_many(
+            {"$and": [{"_id": {"$in": ids}}, ready]},
+            {"$set": {"status": "dispatching", "claim": token, "lease_until": now + timedelta(seconds=lease_seconds)},
+             "$inc": {"attempts": 1}}
+        )
+        # drugi dispatcher je mozda preuzeo deo istih id-jeva → vrati samo svoje
+        return await outbox_col.find({"claim": token}).sort("_id", 1).to_list(length=limit)
+
+    async def mark_dispatched(self, ids: list[ObjectId]):
+        if ids:
+            await outbox_col.update_many(
+                {"_id": {"$in": ids}},
+                {"$set": {"status": "dispatched", "dispatched_at": datetime.utcnow()}, "$unset": {"lease_until": "", "claim": ""}}
+            )
+
+    async def retry(self, event_id: ObjectId, error: str, available_at: datetime):
+        await outbox_col.update_one(
+            {"_id": event_id},
+            {"$set": {"status": "pending", "available_at": available_at, "last_error": error},
+             "$unset": {"lease_until": "", "claim": ""}}
+        )
+
+    async def mark_failed(self, event_id: ObjectId, error: str):
+        await outbox_col.update_one(
+            {"_id": event_id},
+            {"$set": {"status": "failed", "last_error": error}, "$unset": {"lease_until": "", "claim": ""}}
+        )
@@ -0,0 +1,177 @@
+import os
+import random
+from datetime import datetime
+from typing import Optional
+from database.connection import (
+    applications_col, events_col, organisations_col, platform_stats_col, reviews_col, users_col,
+)
+from database.transactions import run_in_transaction
+
+PLATFORM_STATS_ID = "global"
+# broj shard dokumenata za inkremente: istovremeni upisi ne udaraju u isti dokument (WriteConflict u transakciji)
+PLATFORM_STATS_SHARDS = max(1, int(os.getenv("PLATFORM_STATS_SHARDS", "16")))
+SHARD_IDS = [f"{PLATFORM_STATS_ID}:{n}" for n in range(PLATFORM_STATS_SHARDS)]
+
+
+def _add(total: dict, doc: dict):
+    """Sabira brojace iz doc u total (ugnjezdene mape po kljucu)"""
+    for key, value in doc.items():
+        if isinstance(value, dict):
+            _add(total.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[key] = total.get(key, 0) + value
+
+
+def _flatten(doc: dict, prefix: str = "") -> dict:
+    """Brojaci iz doc kao $inc mapa sa putanjama sa tackom ("users.by_city.beograd": 3)"""
+    fields = {}
+    for key, value in doc.items():
+        if isinstance(value, dict):
+            fields.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            fields[f"{prefix}{key}"] = value
+    return fields
+
+
+def breakdown_key(value) -> Optional[str]:
+    """Grad / kategorija kao kljuc mape: bez razlike u velikim slovima, bez '.' i '$' (nedozvoljeni u kljucu)"""
+    value = getattr(value, "value", value)
+    if not value or not isinstance(value, str):
+        return None
+    key = value.strip().casefold().replace(".", "").replace("$", "")
+    return key or None
+
+
+class PlatformStatsRepository:
+    """
+    Globalni brojaci platforme u kolekciji `platform_stats`: _id = "global" drzi stanje iz
+    poslednjeg reconcile-a, a "global:<n>" shardovi promene posle njega. Repozitorijumi uz svaki
+    upis rade $inc u nasumicno izabran shard, citanje sabira sve dokumente, a reconcile()
+    periodicno preracunava sve iz kolekcija i od shardova oduzima ono sto je preracunavanje obuhvatilo.
+    """
+
+    async def get(self):
+        docs = await platform_stats_col.find(
+            {"_id": {"$in": [PLATFORM_STATS_ID, *SHARD_IDS]}}
+        ).to_list(length=None)
+        if not docs:
+            return None
+
+        stats = {}
+        updated = []
+        for doc in docs:
+            if doc.get("updated_at"):
+                updated.append(doc["updated_at"])
+            if doc["_id"] == PLATFORM_STATS_ID and doc.get("reconciled_at"):
+                stats["reconciled_at"] = doc["reconciled_at"]
+            _add(stats, {k: v for k, v in doc.items() if k not in ("_id", "updated_at", "reconciled_at")})
+        stats["updated_at"] = max(updated) if updated else None
+        return stats
+
+    async def shards(self) -> list[dict]:
+        """Trenutne promene u shardovima; reconcile ih cita PRE compute() i posle oduzima samo njih"""
+        return await platform_stats_col.find({"_id": {"$in": SHARD_IDS}}).to_list(length=None)
+
+    async def increment(self, inc: dict, session=None):
+        inc = {field: amount for field, amount in inc.items() if amount}
+        if not inc:
+            return
+        await platform_stats_col.update_one(
+            {"_id": random.choice(SHARD_IDS)},
+            {"$inc": inc, "$set": {"updated_at": datetime.utcnow()}},
+            upsert=True,
+            session=session
+        )
+
+    # -------------------------------------------------
+    # POMOCNE: koja polja menja jedan dokument
+    # -------------------------------------------------
+    @staticmethod
+    def combine(*incs: dict) -> dict:
+        """Sabira vise $inc mapa (npr. -1 za staro i +1 za novo stanje; isto polje se ponisti)"""
+        total = {}
+        for inc in incs:
+            for field, amount in inc.items():
+                total[field] = total.get(field, 0) + amount
+        return total
+
+    @staticmethod
+    def user_fields(user: dict, amount: int) -> dict:
+        inc = {"users.total": amount}
+        city = breakdown_key(user.get("location"))
+        if city:
+            inc[f"users.by_city.{city}"] = amount
+        return inc
+
+    @staticmethod
+    def organisation_fields(status, amount: int) -> dict:
+        status = breakdown_key(status)
+        return {f"organisations.by_status.{status}": amount} if status else {}
+
+    @staticmethod
+    def event_fields(event: dict, amount: int) -> dict:
+        inc = {"events.total": amount}
+        city = breakdown_key(event.get("location"))
+        category = breakdown_key(event.get("category"))
+        if city:
+            inc[f"events.by_city.{city}"] = amount
+        if category:
+            inc[f"events.by_category.{category}"] = amount
+        return inc
+
+    @staticmethod
+    def application_fields(status, amount: int) -> dict:
+        status = breakdown_key(status)
+        return {f"applications.by_status.{status}": amount} if status else {}
+
+    # -------------------------------------------------
+    # RECONCILE: ponovo broji sve iz izvornih kolekcija
+    # -------------------------------------------------
+    async def compute(self) -> dict:
+        async def grouped(col, field):
+            counts = {}
+            async for row in col.aggregate([{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]):
+                key = breakdown_key(row["_id"])
+                if key:
+                    counts[key] = counts.get(key, 0) + row["count"]
+            return counts
+
+        return {
+            "users": {
+                "total": await users_col.count_documents({}),
+                "by_city": await grouped(users_col, "location"),
+            },
+            "organisations": {"by_status": await grouped(organisations_col, "status")},
+            "events": {
+                "total": await events_col.count_documents({}),
+                "by_city": await grouped(events_col, "location"),
+                "by_category": await grouped(events_col, "category"),
+            },
+            "applications": {"by_status": await grouped(applications_col, "status")},
+            "reviews": {"total": await reviews_col.count_documents({})},
+        }
+
+    async def replace(self, stats: dict, shards: list[dict]):
+        """
+        Upisuje preracunato stanje i od shardova oduzima promene procitane pre compute() (shards).
+        Inkrement koji stigne izmedju compute() i upisa ostaje u shardu, umesto da ga brisanje shardova izgubi.
+        """
+        now = datetime.utcnow()
+
+        # novo stanje + oduzimanje iz shardova zajedno, da citanje ne vidi brojace dvaput (ili nijednom)
+        async def write(session):
+            await platform_stats_col.replace_one(
+                {"_id": PLATFORM_STATS_ID},
+                {**stats, "updated_at": now, "reconciled_at": now},
+                upsert=True,
+                session=session
+            )
+            for shard in shards:
+                inc = {field: -amount for field, amount in _flatten(shard).items() if amount}
+                if inc:
+                    await platform_stats_col.update_one({"_id": shard["_id"]}, {"$inc": inc}, session=session)
+
+        await run_in_transaction(write)
+
+
+platform_stats = PlatformStatsRepository()
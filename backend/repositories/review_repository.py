@@ -2,6 +2,18 @@
 
 from bson import ObjectId
 from database.connection import reviews_col
+from pagination import fetch_page
+from repositories.platform_stats_repository import platform_stats
+
+# polja potrebna za javni prikaz review-a
+PUBLIC_PROJECTION = {
+    "event_id": 1,
+    "user_id": 1,
+    "organisation_id": 1,
+    "rating": 1,
+    "comment": 1,
+    "created_at": 1,
+}
 
 
 class ReviewRepository:
@@ -12,8 +24,9 @@ class ReviewRepository:
     # ============================
     # CREATE
     # ============================
-    async def create_review(self, data: dict):
-        result = await self.col.insert_one(data)
+    async def create_review(self, data: dict, session=None):
+        result = await self.col.insert_one(data, session=session)
+        await platform_stats.increment({"reviews.total": 1}, session=session)
         return result.inserted_id
 
     # ============================
@@ -50,6 +63,21 @@ class ReviewRepository:
         cursor = self.col.find(filter)
         return await cursor.to_list(length=None)
 
+    # ============================
+    # FIND PAGE (keyset paginacija, sort opadajuce po sort_fields)
+    # ============================
+    async def find_page(self, filter: dict, sort_fields: list[str], limit: int, cursor: str | None = None):
+        return await fetch_page(self.col, filter, sort_fields, limit, cursor, PUBLIC_PROJECTION)
+
+    # ============================
+    # organisation_id string → ObjectId (popravka starih dokumenata)
+    # ============================
+    async def normalize_organisation_ids(self):
+        await self.col.update_many(
+            {"organisation_id": {"$type": "string"}},
+            [{"$set": {"organisation_id": {"$toObjectId": "$organisation_id"}}}]
+        )
+
     # ============================
     # AGGREGATE
     # ============================
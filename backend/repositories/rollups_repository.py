@@ -0,0 +1,52 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+from database.connection import applications_col, events_col, rollups_col
+from date_helpers import bucket_start
+
+GRANULARITIES = ("day", "month")
+BACKFILL_BATCH = 1000
+
+
+class RollupRepository:
+
+    # -------------------------------------------------
+    # INKREMENT: $inc upsert u dnevni i mesecni bucket svakog scope-a (jedan bulk_write)
+    # -------------------------------------------------
+    async def increment(self, scopes: list[tuple[str, ObjectId]], moment: datetime, inc: dict, session=None):
+        ops = [
+            UpdateOne(
+                {"scope": scope, "scope_id": scope_id, "granularity": granularity,
+                 "bucket": bucket_start(moment, granularity)},
+                {"$inc": inc},
+                upsert=True,
+            )
+            for scope, scope_id in scopes
+            for granularity in GRANULARITIES
+        ]
+        await rollups_col.bulk_write(ops, ordered=False, session=session)
+
+    # -------------------------------------------------
+    # CITANJE: bucketi jednog scope-a u opsegu [start, end)
+    # -------------------------------------------------
+    async def find_range(self, scope: str, scope_id: ObjectId, granularity: str, start: datetime, end: datetime):
+        return await rollups_col.find(
+            {"scope": scope, "scope_id": scope_id, "granularity": granularity,
+             "bucket": {"$gte": start, "$lt": end}},
+            {"_id": 0, "scope": 0, "scope_id": 0, "granularity": 0},
+        ).sort("bucket", 1).to_list(length=None)
+
+    # -------------------------------------------------
+    # BACKFILL: sirovi podaci + zamena svih bucketa
+    # -------------------------------------------------
+    def iter_events(self):
+        return events_col.find({}, {"organisation_id": 1, "category": 1, "created_at": 1})
+
+    def iter_applications(self):
+        return applications_col.find({}, {"event_id": 1, "status": 1, "created_at": 1, "updated_at": 1,
+                                          "decided_at": 1})
+
+    async def replace_all(self, docs: list[dict]):
+        await rollups_col.delete_many({})
+        for i in range(0, len(docs), BACKFILL_BATCH):
+            await rollups_col.bulk_write([InsertOne(doc) for doc in docs[i:i + BACKFILL_BATCH]], ordered=False)
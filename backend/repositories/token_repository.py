@@ -0,0 +1,53 @@
+from datetime import datetime
+from pymongo.errors import DuplicateKeyError
+from database.connection import refresh_tokens_col, revoked_tokens_col
+
+
+class TokenRepository:
+
+    # ============================
+    # REFRESH TOKENI
+    # ============================
+    async def create_refresh(self, claims: dict):
+        await refresh_tokens_col.insert_one({
+            "_id": claims["jti"],
+            "family": claims["fam"],
+            "sub": claims["sub"],
+            "role": claims["role"],
+            "expires_at": claims["exp"].replace(tzinfo=None),
+            "created_at": datetime.utcnow(),
+            "used_at": None,
+        })
+
+    async def use_refresh(self, jti: str, successor: dict):
+        """Atomski oznaci refresh token kao iskoriscen i zapamti naslednika (jti, expires_at);
+        None ako ne postoji ili je vec iskoriscen"""
+        return await refresh_tokens_col.find_one_and_update(
+            {"_id": jti, "used_at": None},
+            {"$set": {"used_at": datetime.utcnow(), "successor": successor}}
+        )
+
+    async def find_refresh(self, jti: str):
+        return await refresh_tokens_col.find_one({"_id": jti})
+
+    async def find_family(self, family: str):
+        return await refresh_tokens_col.find({"family": family}, {"expires_at": 1}).to_list(length=None)
+
+    # ============================
+    # OPOZVANI TOKENI
+    # ============================
+    async def revoke(self, jti: str, expires_at: datetime):
+        try:
+            await revoked_tokens_col.insert_one({
+                "_id": jti,
+                "expires_at": expires_at,
+                "revoked_at": datetime.utcnow(),
+            })
+        except DuplicateKeyError:
+            pass
+
+    async def find_revoked_since(self, since: datetime | None):
+        query = {"expires_at": {"$gt": datetime.utcnow()}}
+        if since is not None:
+            query["revoked_at"] = {"$gte": since}
+        return await revoked_tokens_col.find(query, {"expires_at": 1, "revoked_at": 1}).to_list(length=None)
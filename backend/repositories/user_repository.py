@@ -1,11 +1,15 @@
 from database.connection import users_col  
 from bson import ObjectId
+from auth.principal_cache import principal_cache
+from repositories.platform_stats_repository import platform_stats
+from pymongo import ReturnDocument, UpdateOne
 
 
 #ovaj sloj zaduzen je samo za crud operacije - za komunikaciju sa bazom 
 class UserRepository:
     async def create(self, user_data: dict):
         result = await users_col.insert_one(user_data)
+        await platform_stats.increment(platform_stats.user_fields(user_data, 1))
         return str(result.inserted_id)
 
     async def find_all(self):
@@ -28,21 +32,86 @@ class UserRepository:
             user["_id"] = str(user["_id"])
         return user
 
+    #bulk dohvatanje korisnika (npr. za hidrataciju review-a)
+    async def find_many_by_ids(self, ids: list, projection: dict | None = None):
+        valid_ids = [ObjectId(i) for i in ids if ObjectId.is_valid(i)]
+        if not valid_ids:
+            return []
+
+        users = await users_col.find({"_id": {"$in": valid_ids}}, projection).to_list(length=None)
+        for u in users:
+            u["_id"] = str(u["_id"])
+        return users
+
     async def update(self, user_id: str, update_data: dict):
-        result = await users_col.update_one(
+        # dokument PRE izmene: promena grada pomera brojac u admin statistici po gradovima
+        previous = await users_col.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"location": 1},
+            return_document=ReturnDocument.BEFORE
         )
-        return result  # <- bitno: servis proverava matched_count
+        if previous and "location" in update_data:
+            await platform_stats.increment(platform_stats.combine(
+                platform_stats.user_fields(previous, -1),
+                platform_stats.user_fields(update_data, 1),
+            ))
+        principal_cache.invalidate("user", user_id)
+        return previous is not None  # <- bitno: servis proverava da li korisnik postoji
     
     
     async def delete(self, user_id: str):
-        result = await users_col.delete_one({"_id": ObjectId(user_id)})
-        return result.deleted_count > 0
+        user = await users_col.find_one_and_delete({"_id": ObjectId(user_id)}, projection={"location": 1})
+        principal_cache.invalidate("user", user_id)
+        if user:
+            await platform_stats.increment(platform_stats.user_fields(user, -1))
+        return user is not None
     
     
     async def find_by_username1(self, username: str):
         user = await users_col.find_one({"username": username})
         if user:
             user["_id"] = str(user["_id"])
-        return user
\ No newline at end of file
+        return user
+
+
+    # ============================
+    # RATING AGREGATI (rating_sum, rating_count, histogram)
+    # ============================
+    async def inc_rating(self, user_id, rating: int, session=None):
+        """Atomski $inc agregata ocena nakon novog review-a"""
+        await users_col.update_one(
+            {"_id": ObjectId(user_id)},
+            {"$inc": {
+                "rating_sum": rating,
+                "rating_count": 1,
+                f"rating_histogram.{rating}": 1,
+            }},
+            session=session
+        )
+
+    async def find_rating_aggregates(self, user_id: str):
+        return await users_col.find_one(
+            {"_id": ObjectId(user_id)},
+            {"rating_sum": 1, "rating_count": 1, "rating_histogram": 1}
+        )
+
+    async def set_rating_aggregates(self, aggregates: dict):
+        """Reconcile: upisuje agregate izracunate iz reviews, ostale resetuje na nulu"""
+        empty = {"rating_sum": 0, "rating_count": 0, "rating_histogram": {str(i): 0 for i in range(1, 6)}}
+
+        ops = [UpdateOne({"_id": _id}, {"$set": values}) for _id, values in aggregates.items()]
+        if ops:
+            await users_col.bulk_write(ops, ordered=False)
+
+        await users_col.update_many(
+            {"_id": {"$nin": list(aggregates.keys())}, "rating_count": {"$ne": 0}},
+            {"$set": empty}
+        )
+
+    #korisnici koji imaju bar jednu ocenu (za rang listu volontera)
+    async def find_rated(self):
+        return await users_col.find(
+            {"rating_count": {"$gt": 0}},
+            {"username": 1, "first_name": 1, "last_name": 1, "location": 1, "rating_sum": 1, "rating_count": 1}
+        ).to_list(length=None)
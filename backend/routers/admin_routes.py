@@ -1,8 +1,11 @@
 from fastapi import APIRouter, Depends
+import metrics
 from auth.dependencies import admin_required
 from models.user_models import UserDB
 from services.organisation_service import OrganisationService
 from models.organisation_models import OrganisationPublic
+from models.stats_models import PlatformStats
+from services.platform_stats_service import PlatformStatsService
 from typing import List
 
 router = APIRouter(
@@ -12,6 +15,7 @@ router = APIRouter(
 )
 
 service = OrganisationService()
+platform_stats_service = PlatformStatsService()
 
 #funckije su: 
 
@@ -20,6 +24,12 @@ async def get_pending_orgs(current_admin: UserDB = Depends(admin_required)):
     return await service.list_pending()
 
 
+#pregled platforme iz unapred agregiranih brojaca (jedan dokument, bez skeniranja kolekcija)
+@router.get("/stats", response_model=PlatformStats)
+async def get_platform_stats(current_admin: UserDB = Depends(admin_required)):
+    return await platform_stats_service.get_stats()
+
+
 @router.patch("/{org_name}/approve", dependencies=[Depends(admin_required)])
 async def approve_org(org_name: str, current_admin: UserDB = Depends(admin_required)):
     return await service.approve_organisation(org_name)
@@ -28,3 +38,9 @@ async def approve_org(org_name: str, current_admin: UserDB = Depends(admin_requi
 @router.patch("/{org_name}/reject", dependencies=[Depends(admin_required)])
 async def reject_org(org_name: str, current_admin: UserDB = Depends(admin_required)):
     return await service.reject_organisation(org_name)
+
+
+#brojaci i gauge-ovi procesa (WS konekcije, evikcije...)
+@router.get("/metrics")
+async def get_metrics(current_admin: UserDB = Depends(admin_required)):
+    return metrics.snapshot()
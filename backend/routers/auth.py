@@ -1,17 +1,21 @@
-import bcrypt
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from datetime import datetime, timedelta
+from datetime import datetime
 from bson import ObjectId
 
 from database.connection import users_col, organisations_col
 from models.organisation_models import OrganisationIn, OrganisationLogin, OrganisationRole
 from models.user_models import UserIn, UserDB, UserPublic, Role
+from models.auth_models import LogoutRequest, RefreshRequest, TokenResponse
+from repositories.user_repository import UserRepository
+from services.token_service import TokenService
 from auth.auth_utils import hash_password, verify_password
-from auth.jwt_handler import create_access_token, EXPIRE_MINUTES
-from auth.dependencies import get_current_user
+from auth.dependencies import get_current_user, get_token_claims
+from auth.rate_limiter import login_limiter
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
+token_service = TokenService()
+user_repo = UserRepository()
 
 
 # --- Registracija korisnika ---
@@ -26,12 +30,11 @@ async def register(user: UserIn):
 
     # Priprema i hash lozinke
     user_dict = user.model_dump()
-    user_dict["password"] = hash_password(user.password)
+    user_dict["password"] = await hash_password(user.password)
     user_dict["created_at"] = datetime.utcnow()
     user_dict["role"] = Role.user.value  # koristi Enum vrednost "user"
 
-    result = await users_col.insert_one(user_dict)
-    user_dict["_id"] = str(result.inserted_id)
+    user_dict["_id"] = await user_repo.create(user_dict)  # repozitorijum azurira i admin statistiku
 
     # Vraćamo UserPublic (bez passworda)
     return UserPublic(**user_dict)
@@ -39,18 +42,17 @@ async def register(user: UserIn):
 
 # --- Login korisnika ---
 @router.post("/login")
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login(request: Request, form_data: OAuth2PasswordRequestForm = Depends()):
+    await login_limiter.check(request, "user", form_data.username)
+
     user = await users_col.find_one({"email": form_data.username})
-    if not user or not verify_password(form_data.password, user["password"]):
+    if not user or not await verify_password(form_data.password, user["password"]):
+        await login_limiter.failed("user", form_data.username)
         raise HTTPException(status_code=400, detail="Neispravni kredencijali")
+    await login_limiter.succeeded("user", form_data.username)
 
-    # Token uključuje rolu iz baze (user ili admin)
-    token = create_access_token(
-        {"sub": str(user["_id"]), "role": user.get("role", Role.user.value)},
-        expires_delta=timedelta(minutes=EXPIRE_MINUTES),
-    )
-
-    return {"access_token": token, "token_type": "bearer"}
+    # Token uključuje rolu iz baze (user ili admin); uz access ide i refresh token
+    return await token_service.issue(str(user["_id"]), user.get("role", Role.user.value))
 
 
 # --- Dohvatanje trenutnog korisnika ---
@@ -62,29 +64,30 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
 
 # --- Login organizacije ---
 @router.post("/org/login")
-async def login_org(org_login: OrganisationLogin):
-    org = await organisations_col.find_one({"email": org_login.email})
-    if not org:
-        raise HTTPException(status_code=401, detail="Neispravni podaci")
-
-    stored_pw = org["password"]
-    if isinstance(stored_pw, str):
-        stored_pw = stored_pw.encode()
+async def login_org(request: Request, org_login: OrganisationLogin):
+    await login_limiter.check(request, "org", org_login.email)
 
-    is_valid = bcrypt.checkpw(org_login.password.encode(), stored_pw)
-    if not is_valid:
+    org = await organisations_col.find_one({"email": org_login.email})
+    if not org or not await verify_password(org_login.password, org["password"]):
+        await login_limiter.failed("org", org_login.email)
         raise HTTPException(status_code=401, detail="Neispravni podaci")
+    await login_limiter.succeeded("org", org_login.email)
 
     if org["status"] != "approved":
         raise HTTPException(status_code=403, detail="Organizacija nije odobrena od strane administratora")
 
     # Token za organizaciju sadrži rolu iz OrganisationRole enuma
-    token = create_access_token(
-        data={
-            "sub": org["email"],
-            "role": OrganisationRole.organisation.value  # "organisation"
-        },
-        expires_delta=timedelta(minutes=EXPIRE_MINUTES),
-    )
-
-    return {"access_token": token, "token_type": "bearer"}
+    return await token_service.issue(org["email"], OrganisationRole.organisation.value)
+
+
+# --- Obnova sesije: refresh token → novi access + refresh (rotacija, bez lozinke i bcrypt-a) ---
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_tokens(body: RefreshRequest):
+    return await token_service.refresh(body.refresh_token)
+
+
+# --- Logout: opoziv access tokena i cele familije refresh tokena ---
+@router.post("/logout")
+async def logout(body: LogoutRequest = LogoutRequest(), claims: dict = Depends(get_token_claims)):
+    await token_service.logout(claims, body.refresh_token)
+    return {"message": "Uspešno ste se odjavili."}
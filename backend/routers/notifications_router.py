@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, WebSocket
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Response, WebSocket, WebSocketDisconnect
 from auth.dependencies import get_current_org
 from services.notification_service import NotificationService
 from ws_manager import ws_manager
@@ -6,27 +7,43 @@ from ws_manager import ws_manager
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 service = NotificationService()
 
-# 1) GET - lista svih notifikacija orga
+# 1) GET - istorija notifikacija orga, strana po strana (before = X-Next-Cursor prethodne strane)
 @router.get("/me")
-async def get_my_notifications(current_org=Depends(get_current_org)):
-    return await service.get_notifications(str(current_org["_id"]))
+async def get_my_notifications(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    before: Optional[str] = None,
+    unread_only: bool = False,
+    current_org=Depends(get_current_org)
+):
+    notifications, next_cursor = await service.get_notifications(
+        str(current_org["_id"]), limit, before, unread_only
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return notifications
 
 
 # 2) WebSocket kanal za real-time notifikacije
+# resume_from = _id poslednje primljene notifikacije → server odigra samo propusteno
 @router.websocket("/ws/{org_id}")
-async def notifications_ws(websocket: WebSocket, org_id: str):
-    await ws_manager.connect(org_id, websocket)
+async def notifications_ws(websocket: WebSocket, org_id: str, resume_from: Optional[str] = None):
+    replay = (lambda: service.replay_missed(org_id, resume_from)) if resume_from else None
 
     try:
+        await ws_manager.connect(org_id, websocket, replay=replay)
         while True:
-            await websocket.receive_text()  # client ping or ignore
-    except:
+            await websocket.receive_text()  # pong ili bilo koja poruka klijenta
+            ws_manager.touch(org_id, websocket)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
         ws_manager.disconnect(org_id, websocket)
 
 
 @router.patch("/read/{notification_id}")
 async def mark_notification_read(notification_id: str, current_org = Depends(get_current_org)):
-    return await service.mark_read(notification_id)
+    return await service.mark_read(notification_id, str(current_org["_id"]))
 
 
 @router.patch("/read-all")
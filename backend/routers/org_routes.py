@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
-from typing import List
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from typing import List, Optional
 from auth.dependencies import get_current_org
 from models.application_models import ApplicationPublic, ApplicationStatus, ApplicationUpdate, OrgDecision
 from models.review_models import ReviewOrgToUserDB, ReviewOrgToUserIn
+from models.stats_models import Granularity, TimeseriesMetric, TimeseriesResponse
 from services.application_service import ApplicationService
 from services.event_service import EventService
 from services.organisation_service import OrganisationService
 from models.event_models import EventIn, EventUpdate, EventPublic
 from models.organisation_models import OrganisationPublic, OrganisationUpdate
 from services.review_service import ReviewService
+from services.rollup_service import RollupService
 
 router = APIRouter(
     prefix="/org",
@@ -20,6 +23,7 @@ org_service = OrganisationService()
 event_service = EventService()
 app_service = ApplicationService()
 reviewservice = ReviewService()
+rollup_service = RollupService()
 
 
 # 🏢 Info o ulogovanoj organizaciji
@@ -30,6 +34,22 @@ async def get_me(current_org=Depends(get_current_org)):
     return current_org
 
 
+# 📈 Vremenske serije za dashboard (iz dnevnih/mesecnih bucketa, bez citanja sirovih prijava)
+@router.get("/stats/timeseries", response_model=TimeseriesResponse)
+async def get_stats_timeseries(
+    metric: TimeseriesMetric,
+    granularity: Granularity = Granularity.day,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    event_id: Optional[str] = None,
+    current_org=Depends(get_current_org)
+):
+    """📈 Prijave po danu, stopa prihvatanja po mesecu, volonteri po kategoriji... (opciono za jedan event)."""
+    return await rollup_service.get_timeseries(
+        str(current_org["_id"]), metric.value, granularity.value, date_from, date_to, event_id
+    )
+
+
 # 🏗️ Kreiranje eventa
 @router.post("/events/create", response_model=dict)
 async def create_event(event: EventIn, current_org=Depends(get_current_org)):
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Query
+from typing import List, Optional
+from models.event_models import EventCategory
+from models.leaderboard_models import LeaderboardEntry, LeaderboardKind
+from services.leaderboard_service import LeaderboardService
+
+router = APIRouter(prefix="/public/leaderboards", tags=["Public - Leaderboards"])
+service = LeaderboardService()
+
+
+@router.get("/organisations", response_model=List[LeaderboardEntry])
+async def top_organisations(
+    city: Optional[str] = None,
+    category: Optional[EventCategory] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """🏆 Najbolje ocenjene organizacije (Bayes-ovski prosek ocena)."""
+    return await service.get_leaderboard(
+        LeaderboardKind.organisation, city, category.value if category else None, limit
+    )
+
+
+@router.get("/volunteers", response_model=List[LeaderboardEntry])
+async def top_volunteers(
+    city: Optional[str] = None,
+    category: Optional[EventCategory] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """🏆 Najpouzdaniji volonteri (Bayes-ovski prosek ocena organizacija)."""
+    return await service.get_leaderboard(
+        LeaderboardKind.volunteer, city, category.value if category else None, limit
+    )
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
 from models.event_models import EventPublic
 from models.organisation_models import OrganisationIn, OrganisationPublic
+from models.review_models import PublicReview, ReviewSort
 from services import statistics_service
 from services.organisation_service import OrganisationService
 from services.review_service import ReviewService
@@ -45,17 +46,34 @@ async def get_org_stats(organisation_id: str):
     return stats
 
 
-@router.get("/org/{org_id}/received", tags=["Reviews"])
+@router.get("/org/{org_id}/received", tags=["Reviews"], response_model=List[PublicReview])
 async def public_get_reviews_received_by_org(
     org_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.newest,
     service: ReviewService = Depends()
 ):
-    return await service.get_reviews_received_by_org(org_id)
+    reviews, next_cursor = await service.get_reviews_received_by_org(org_id, limit, cursor, sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reviews
 
 
-@router.get("/org/{org_id}/reviews", tags=["Reviews"])
-async def public_reviews_for_org(org_id: str, service: ReviewService = Depends()):
-    return await service.get_public_reviews_for_org(org_id)
+@router.get("/org/{org_id}/reviews", tags=["Reviews"], response_model=List[PublicReview])
+async def public_reviews_for_org(
+    org_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.newest,
+    service: ReviewService = Depends()
+):
+    reviews, next_cursor = await service.get_public_reviews_for_org(org_id, limit, cursor, sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reviews
 
 @router.get("/org/{org_id}/avg-rating", tags=["Reviews"])
 async def public_org_avg_rating(org_id: str, service: ReviewService = Depends()):
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
+from models.review_models import PublicReview, ReviewSort
 from models.user_models import UserPublic
 from services.review_service import ReviewService
 from services.user_service import UserService
@@ -26,16 +27,33 @@ async def get_user_by_username(username: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("/org/{org_id}/given", tags=["Reviews"])
+@router.get("/org/{org_id}/given", tags=["Reviews"], response_model=List[PublicReview])
 async def public_get_reviews_given_by_org(
     org_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.newest,
     service: ReviewService = Depends()
 ):
-    return await service.get_reviews_given_by_org(org_id)
+    reviews, next_cursor = await service.get_reviews_given_by_org(org_id, limit, cursor, sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reviews
 
-@router.get("/user/{user_id}/reviews", tags=["Reviews"])
-async def public_reviews_for_user(user_id: str, service: ReviewService = Depends()):
-    return await service.get_public_reviews_for_user(user_id)
+@router.get("/user/{user_id}/reviews", tags=["Reviews"], response_model=List[PublicReview])
+async def public_reviews_for_user(
+    user_id: str,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.newest,
+    service: ReviewService = Depends()
+):
+    reviews, next_cursor = await service.get_public_reviews_for_user(user_id, limit, cursor, sort)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reviews
 
 
 @router.get("/user/{user_id}/avg-rating", tags=["Reviews"])
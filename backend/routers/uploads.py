@@ -1,14 +1,20 @@
 import os
-import uuid
 from bson import ObjectId
 from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Depends
 from fastapi.responses import JSONResponse
 from database.connection import db
 from auth.dependencies import get_current_user, get_current_org
+from auth.principal_cache import principal_cache
+from models.media_models import CompleteUploadRequest, PresignUploadRequest
+from services.image_service import ImageService
+from services.media_service import MediaService
+from storage import UPLOAD_ROOT, media_url, url_for_key
 
 router = APIRouter(prefix="/upload", tags=["Uploads"])
+image_service = ImageService()
+media_service = MediaService()
 
-UPLOAD_DIR = "uploads"
+UPLOAD_DIR = UPLOAD_ROOT
 USER_DIR = os.path.join(UPLOAD_DIR, "users")
 ORG_DIR = os.path.join(UPLOAD_DIR, "orgs")
 
@@ -16,12 +22,33 @@ os.makedirs(USER_DIR, exist_ok=True)
 os.makedirs(ORG_DIR, exist_ok=True)
 
 MAX_FILE_SIZE_MB = 5
+MAX_FILE_SIZE = MAX_FILE_SIZE_MB * 1024 * 1024
 ALLOWED_TYPES = {"image/jpeg", "image/png", "image/jpg"}
 
 EVENT_DIR = os.path.join(UPLOAD_DIR, "events")
 os.makedirs(EVENT_DIR, exist_ok=True)
 
 
+# zajednicko za upload kroz API i direktan (presigned) upload
+async def _set_profile_image(user_id: str, url: str):
+    # varijante nove slike (ili None dok ih job ne napravi), nikad srcset prethodne slike
+    await db["users"].update_one(
+        {"_id": ObjectId(user_id)},
+        {"$set": {"profile_image": url, "profile_image_variants": await image_service.variants_for(url)}}
+    )
+    principal_cache.invalidate("user", user_id)
+    await image_service.enqueue(url)  # thumb/card/full u WebP + JPEG prave job workeri
+
+
+async def _set_logo(org_id: str, url: str):
+    await db["organisations"].update_one(
+        {"_id": ObjectId(org_id)},
+        {"$set": {"logo": url, "logo_variants": await image_service.variants_for(url)}}
+    )
+    principal_cache.invalidate("organisation", org_id)
+    await image_service.enqueue(url)
+
+
 # =====================================
 # 📸 Upload slika SAMO za current user
 # =====================================
@@ -34,27 +61,12 @@ async def upload_my_image(
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(status_code=400, detail="Dozvoljeni su samo JPEG i PNG fajlovi")
 
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE_MB * 1024 * 1024:
-        raise HTTPException(status_code=400, detail=f"Fajl je prevelik (maksimalno {MAX_FILE_SIZE_MB}MB)")
+    # ime fajla je sha256 sadrzaja; stara slika ostaje bez reference i brise je media GC
+    key = await media_service.store(file, "users", MAX_FILE_SIZE)
+    url = url_for_key(key, str(request.base_url))
+    await _set_profile_image(str(current_user.id), url)
 
-    user_id = str(current_user.id)
-
-    file_ext = os.path.splitext(file.filename)[1]
-    file_path = os.path.join(USER_DIR, f"{user_id}{file_ext}")
-
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    base_url = str(request.base_url).rstrip("/")
-    url = f"{base_url}/uploads/users/{user_id}{file_ext}"
-
-    await db["users"].update_one(
-        {"_id": ObjectId(user_id)},
-        {"$set": {"profile_image": url}}
-    )
-
-    return JSONResponse(content={"url": url, "message": "Tvoja slika je uspešno uploadovana"})
+    return JSONResponse(content={"url": media_url(url), "message": "Tvoja slika je uspešno uploadovana"})
 
 
 # ===========================================
@@ -69,27 +81,11 @@ async def upload_my_org_logo(
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(status_code=400, detail="Dozvoljeni su samo JPEG i PNG fajlovi")
 
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE_MB * 1024 * 1024:
-        raise HTTPException(status_code=400, detail=f"Fajl je prevelik (maksimalno {MAX_FILE_SIZE_MB}MB)")
-
-    org_id = str(current_org["_id"])
+    key = await media_service.store(file, "orgs", MAX_FILE_SIZE)
+    url = url_for_key(key, str(request.base_url))
+    await _set_logo(str(current_org["_id"]), url)
 
-    file_ext = os.path.splitext(file.filename)[1]
-    file_path = os.path.join(ORG_DIR, f"{org_id}{file_ext}")
-
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    base_url = str(request.base_url).rstrip("/")
-    url = f"{base_url}/uploads/orgs/{org_id}{file_ext}"
-
-    await db["organisations"].update_one(
-        {"_id": ObjectId(org_id)},
-        {"$set": {"logo": url}}
-    )
-
-    return JSONResponse(content={"url": url, "message": "Logo tvoje organizacije je uspešno uploadovan"})
+    return JSONResponse(content={"url": media_url(url), "message": "Logo tvoje organizacije je uspešno uploadovan"})
 
 
 
@@ -103,22 +99,55 @@ async def upload_event_image(
     if file.content_type not in ALLOWED_TYPES:
         raise HTTPException(status_code=400, detail="Dozvoljeni su samo JPEG i PNG fajlovi")
 
-    # Validacija veličine
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE_MB * 1024 * 1024:
-        raise HTTPException(status_code=400, detail=f"Fajl je prevelik (maksimalno {MAX_FILE_SIZE_MB}MB)")
+    # Snimanje fajla u komadima pod imenom sha256 sadrzaja (isti fajl → isti URL)
+    key = await media_service.store(file, "events", MAX_FILE_SIZE)
 
-    # Generisanje imena fajla
-    ext = os.path.splitext(file.filename)[1]
-    filename = f"event_{uuid.uuid4()}{ext}"
-    file_path = os.path.join(EVENT_DIR, filename)
+    # Formiranje apsolutnog URL-a
+    url = url_for_key(key, str(request.base_url))
+    await image_service.enqueue(url)
 
-    # Snimanje fajla
-    with open(file_path, "wb") as f:
-        f.write(content)
+    return {"url": media_url(url), "message": "Slika događaja uspešno uploadovana"}
+
+
+# ======================================================
+# ☁️ Direktan upload u storage (STORAGE_BACKEND=s3)
+# 1) presign → klijent PUT-uje fajl na upload_url (preskace ako je exists)
+# 2) complete → backend proveri objekat i upise URL kao i kod multipart upload-a
+# ======================================================
+@router.post("/user/me/presign")
+async def presign_my_image(body: PresignUploadRequest, current_user=Depends(get_current_user)):
+    return await media_service.presign_upload("users", body.content_type, body.size, body.sha256, MAX_FILE_SIZE)
+
+
+@router.post("/user/me/complete")
+async def complete_my_image(request: Request, body: CompleteUploadRequest, current_user=Depends(get_current_user)):
+    key = await media_service.complete_upload("users", body.key, MAX_FILE_SIZE)
+    url = url_for_key(key, str(request.base_url))
+    await _set_profile_image(str(current_user.id), url)
+    return {"url": media_url(url), "message": "Tvoja slika je uspešno uploadovana"}
+
+
+@router.post("/org/me/presign")
+async def presign_my_org_logo(body: PresignUploadRequest, current_org=Depends(get_current_org)):
+    return await media_service.presign_upload("orgs", body.content_type, body.size, body.sha256, MAX_FILE_SIZE)
+
+
+@router.post("/org/me/complete")
+async def complete_my_org_logo(request: Request, body: CompleteUploadRequest, current_org=Depends(get_current_org)):
+    key = await media_service.complete_upload("orgs", body.key, MAX_FILE_SIZE)
+    url = url_for_key(key, str(request.base_url))
+    await _set_logo(str(current_org["_id"]), url)
+    return {"url": media_url(url), "message": "Logo tvoje organizacije je uspešno uploadovan"}
+
+
+@router.post("/event-image/presign")
+async def presign_event_image(body: PresignUploadRequest, current_org=Depends(get_current_org)):
+    return await media_service.presign_upload("events", body.content_type, body.size, body.sha256, MAX_FILE_SIZE)
 
-    # Formiranje apsolutnog URL-a
-    base_url = str(request.base_url).rstrip("/")
-    url = f"{base_url}/uploads/events/{filename}"
 
-    return {"url": url, "message": "Slika događaja uspešno uploadovana"}
\ No newline at end of file
+@router.post("/event-image/complete")
+async def complete_event_image(request: Request, body: CompleteUploadRequest, current_org=Depends(get_current_org)):
+    key = await media_service.complete_upload("events", body.key, MAX_FILE_SIZE)
+    url = url_for_key(key, str(request.base_url))
+    await image_service.enqueue(url)
+    return {"url": media_url(url), "message": "Slika događaja uspešno uploadovana"}
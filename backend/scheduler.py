@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+#pokrece job na svakih `interval` sekundi dok se task ne otkaze (shutdown aplikacije)
+async def _run_periodically(name: str, interval: float, job, run_immediately: bool):
+    if not run_immediately:
+        await asyncio.sleep(interval)
+
+    while True:
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Periodični job %s nije uspeo", name)
+        await asyncio.sleep(interval)
+
+
+def start_periodic(name: str, interval: float, job, run_immediately: bool = False) -> asyncio.Task:
+    return asyncio.create_task(
+        _run_periodically(name, interval, job, run_immediately), name=f"periodic:{name}"
+    )
+
+
+async def stop_tasks(tasks: list[asyncio.Task]):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -8,8 +8,13 @@ from repositories.applications_repository import ApplicationRepository
 from models.application_models import ApplicationIn, ApplicationUpdate, ApplicationStatus
 from repositories.events_repository import EventRepository
 from database.connection import applications_col
+from database.transactions import run_in_transaction
 from repositories.organisations_repository import OrganisationRepository
 from services.notification_service import NotificationService
+from services.rollup_service import RollupService
+from services.statistics_service import StatisticsService
+from services import outbox
+from services.outbox import outbox_dispatcher
 
 from mongo_cleaner import clean_doc   # ✅ DODATO
 
@@ -20,6 +25,8 @@ class ApplicationService:
         self.event_repo = EventRepository()
         self.org_repo = OrganisationRepository()
         self.notif_service = NotificationService()
+        self.stats_service = StatisticsService()
+        self.rollup_service = RollupService()
 
     # -------------------------------------------------------
     # 1. USER APPLY
@@ -53,11 +60,21 @@ class ApplicationService:
             "user_info": user_snapshot
         })
 
-        inserted_id = await self.repo.create(app_data)
+        # prijava + brojac u statistici organizacije + dnevni/mesecni bucket u jednoj transakciji
+        async def write(session):
+            inserted_id = await self.repo.create(app_data, session=session)
+            await self.stats_service.application_created(event["organisation_id"], ApplicationStatus.pending,
+                                                         session=session)
+            await self.rollup_service.application_created(event, app_data["created_at"], session=session)
+            return inserted_id
 
-        await self.notif_service.notify_org(
+        inserted_id = await run_in_transaction(write)
+
+        await self.notif_service.enqueue_notification(
             organisation_id=str(event["organisation_id"]),
-            message=f"New volunteer applied for your event: {event['title']}"
+            group=f"applications:{event['_id']}",
+            message=f"New volunteer applied for your event: {event['title']}",
+            summary=f"{{count}} new volunteers applied for your event: {event['title']}",
         )
 
         return clean_doc({
@@ -165,7 +182,28 @@ class ApplicationService:
         update_data = update.model_dump(exclude_none=True)
         update_data["updated_at"] = datetime.utcnow()
 
-        await self.repo.update_status(app_id, update_data)
+        # promena statusa + outbox dogadjaj u jednoj transakciji; efekte radi dispatcher
+        async def write(session):
+            previous = await self.repo.update_status(app_id, update_data, session=session) or application
+            old_status = previous.get("status")
+            await self.stats_service.application_status_changed(
+                event["organisation_id"], old_status, update_data.get("status"), session=session
+            )
+            await self.rollup_service.application_status_changed(
+                event, previous, update_data.get("status"), update_data["updated_at"], session=session
+            )
+            await outbox.record(outbox.APPLICATION_STATUS_CHANGED, {
+                "application_id": app_id,
+                "user_id": str(application["user_id"]),
+                "event_id": str(application["event_id"]),
+                "organisation_id": str(event["organisation_id"]),
+                "category": event.get("category"),
+                "old_status": old_status,
+                "status": update_data.get("status"),
+            }, session=session)
+
+        await run_in_transaction(write)
+        outbox_dispatcher.wake()
         return clean_doc({"message": "Status prijave je uspešno ažuriran."})
 
     # -------------------------------------------------------
@@ -187,8 +225,27 @@ class ApplicationService:
             "status": "cancelled",
             "updated_at": datetime.utcnow()
         }
+        event = await self.event_repo.find_by_id(application["event_id"])
 
-        await self.repo.update_status(app_id, update_data)
+        async def write(session):
+            previous = await self.repo.update_status(app_id, update_data, session=session) or application
+            old_status = previous.get("status")
+            if event:
+                await self.stats_service.application_status_changed(
+                    event["organisation_id"], old_status, "cancelled", session=session
+                )
+                await self.rollup_service.application_status_changed(
+                    event, previous, "cancelled", update_data["updated_at"], session=session
+                )
+            await outbox.record(outbox.APPLICATION_CANCELLED, {
+                "application_id": app_id,
+                "user_id": str(application["user_id"]),
+                "event_id": str(application["event_id"]),
+                "old_status": old_status,
+            }, session=session)
+
+        await run_in_transaction(write)
+        outbox_dispatcher.wake()
         return clean_doc({"message": "Prijava je uspešno povučena."})
 
     # -------------------------------------------------------
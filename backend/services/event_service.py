@@ -7,12 +7,19 @@ from mongo_cleaner import clean_doc
 from repositories.organisations_repository import OrganisationRepository
 from repositories.events_repository import EventRepository
 from models.event_models import EventCategory, EventIn, EventUpdate
+from services.image_service import ImageService
+from services.rollup_service import RollupService
+from services.statistics_service import StatisticsService
+from storage import canonical_media_url
 
 
 class EventService:
     def __init__(self):
         self.repo = EventRepository()
         self.org_repo = OrganisationRepository()  # mora biti self!
+        self.image_service = ImageService()
+        self.stats_service = StatisticsService()
+        self.rollup_service = RollupService()
 
     # 🔹 pomoćna funkcija za dodavanje organisation_name
     async def _attach_organisation_names(self, events: list[dict]) -> list[dict]:
@@ -40,8 +47,14 @@ class EventService:
         event_data = event.model_dump()
         event_data["organisation_id"] = ObjectId(organisation_id)  # ✅ ovo dodaj
         event_data["created_at"] = datetime.utcnow()
+        for field in ("image_url", "image"):
+            event_data[field] = canonical_media_url(event_data[field])
+        # izvedene velicine slike, ako ih je job vec napravio (inace ih job sam upise kasnije)
+        event_data["image_variants"] = await self.image_service.variants_for(event_data["image_url"] or event_data["image"])
 
         result_id = await self.repo.create_event(event_data)
+        await self.stats_service.event_created(organisation_id, event_data)
+        await self.rollup_service.event_created(organisation_id, event_data["created_at"])
         return {"message": "Uspesno kreiran event", "id": result_id}
 
 
@@ -136,9 +149,15 @@ class EventService:
     async def update_event(self, event_id: str, update_data: EventUpdate):
         update_dict = update_data.model_dump(exclude_unset=True, exclude_none=True)
         update_dict["updated_at"] = datetime.utcnow()
+        if "image" in update_dict:
+            update_dict["image"] = canonical_media_url(update_dict["image"])
+            update_dict["image_variants"] = await self.image_service.variants_for(update_dict["image"])
         success = await self.repo.update(event_id, update_dict)
         if not success:
             raise ValueError("Event not found or not updated")
+        event = await self.repo.find_by_id(event_id)
+        if event:
+            await self.stats_service.event_changed(event["organisation_id"])
         return {"message": "Event successfully updated"}
 
     # 8️⃣ Brisanje eventa
@@ -199,6 +218,7 @@ class EventService:
             raise HTTPException(status_code=403, detail="Nemate dozvolu da obrišete ovaj event")
 
         await self.repo.delete_by_id(event_id)
+        await self.stats_service.event_changed(event["organisation_id"])
         return {"message": "Event uspešno obrisan"}
     
     
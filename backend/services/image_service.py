@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import posixpath
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import UnidentifiedImageError
+
+import metrics
+from image_derivatives import derivative_filenames, render_derivatives
+from models.media_models import ImageVariants
+from repositories.image_repository import ImageRepository
+from repositories.media_repository import MediaRepository
+from services import job_queue
+from storage import media_key, storage
+from upload_helpers import file_sha256
+
+logger = logging.getLogger(__name__)
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", "2"))
+IMAGE_DERIVATIVES_JOB = "image_derivatives"
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: dete uvozi samo image_derivatives (Pillow), ne nasledjuje niti/konekcije roditelja
+        _pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+class ImageService:
+
+    def __init__(self):
+        self.repo = ImageRepository()
+        self.media_repo = MediaRepository()
+
+    async def enqueue(self, url: str):
+        """Poziva se posle upload-a; izvedene slike pravi job worker, ne request"""
+        path = media_key(url)
+        if not path:
+            return
+        variants = await self.repo.find_variants_by_url(url)
+        if variants:
+            # isti sadrzaj je vec uploadovan (ime = sha256) → izvedene slike vec postoje
+            await self.repo.attach_to_owners(url, variants)
+            return
+        await job_queue.enqueue(IMAGE_DERIVATIVES_JOB, {"path": path, "url": url})
+
+    async def generate(self, path: str, url: str):
+        try:
+            async with storage.local_copy(path) as src_path:
+                files = await asyncio.get_running_loop().run_in_executor(_executor(), render_derivatives, src_path)
+                # izvedeni fajlovi su napisani pored lokalne kopije; local storage ih vec ima na mestu
+                directory, local_dir = posixpath.dirname(path), os.path.dirname(src_path)
+                for info in files.values():
+                    for name, content_type in ((info["webp"], "image/webp"), (info["jpeg"], "image/jpeg")):
+                        local_path = os.path.join(local_dir, name)
+                        # sha256 i velicina unapred, za ETag pri serviranju
+                        sha256, size = await asyncio.to_thread(file_sha256, local_path)
+                        await storage.put_file(f"{directory}/{name}", local_path, content_type)
+                        await self.media_repo.register_derivative(f"{directory}/{name}", path, sha256, size, content_type)
+        except (FileNotFoundError, UnidentifiedImageError) as e:
+            # trajna greska, ponovni pokusaj ne bi pomogao
+            logger.warning("Izvedene slike za %s nisu napravljene: %s", path, e)
+            metrics.inc("image_derivatives_skipped_total")
+            return
+
+        variants = self.build_variants(url, files)
+        await self.repo.save_variants(path, url, variants)
+        await self.repo.attach_to_owners(url, variants)
+        metrics.inc("image_derivatives_total")
+
+    async def delete_derivatives(self, path: str):
+        directory, filename = posixpath.split(path)
+        for name in derivative_filenames(filename):
+            await storage.delete(f"{directory}/{name}")
+        await self.media_repo.delete_derivatives(path)
+        await self.repo.delete_variants(path)
+
+    async def variants_for(self, url: str | None) -> dict | None:
+        if not url:
+            return None
+        return await self.repo.find_variants_by_url(url)
+
+    @staticmethod
+    def build_variants(url: str, files: dict) -> dict:
+        base_url = url.rsplit("/", 1)[0]
+        sizes = {
+            size: {**info, "webp": f"{base_url}/{info['webp']}", "jpeg": f"{base_url}/{info['jpeg']}"}
+            for size, info in files.items()
+        }
+        return ImageVariants(**sizes).model_dump(exclude={"webp_srcset", "jpeg_srcset"})
+
+
+async def _run_image_job(payload: dict):
+    await ImageService().generate(payload["path"], payload["url"])
+
+
+job_queue.register(IMAGE_DERIVATIVES_JOB, _run_image_job)
@@ -0,0 +1,146 @@
+"""
+Trajni red pozadinskih poslova nad Mongo kolekcijom `jobs`.
+
+Request handler samo upise posao (enqueue) i odmah odgovara; posao izvrsava
+pool async workera koji ga atomski preuzima (find_one_and_update lease).
+Neuspeh → ponovni pokusaj uz eksponencijalni backoff, posle JOB_MAX_ATTEMPTS
+posao prelazi u "dead" i ostaje u bazi za pregled.
+
+Isporuka je "at least once": ako worker padne usred posla, lease istekne i posao
+preuzima drugi worker, pa handleri moraju da podnesu ponovno izvrsavanje.
+
+Pool radi u procesu API-ja (JOB_WORKER_MODE=inprocess, default) ili kao zaseban
+proces:  JOB_WORKER_MODE=external uvicorn main:app  +  python job_worker.py
+"""
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import metrics
+from repositories.jobs_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_BACKOFF_BASE = float(os.getenv("JOB_BACKOFF_BASE", "2"))
+JOB_BACKOFF_MAX = float(os.getenv("JOB_BACKOFF_MAX", "300"))
+
+Handler = Callable[[dict], Awaitable[object]]
+
+_handlers: dict[str, Handler] = {}
+
+
+def register(kind: str, handler: Handler):
+    """Handler prima payload posla; izuzetak znaci neuspeh i novi pokusaj"""
+    _handlers[kind] = handler
+
+
+def backoff_delay(attempts: int) -> float:
+    return min(JOB_BACKOFF_BASE ** attempts, JOB_BACKOFF_MAX)
+
+
+class JobWorkerPool:
+
+    def __init__(self, concurrency: int = JOB_WORKERS, poll_interval: float = JOB_POLL_INTERVAL,
+                 lease_seconds: float = JOB_LEASE_SECONDS, max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.repo = JobRepository()
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self.in_flight = 0
+
+    def wake(self):
+        """Novi posao u istom procesu → ne cekaj sledeci poll"""
+        self._wakeup.set()
+
+    def start(self):
+        self._stopping = False
+        self._tasks = [
+            asyncio.create_task(self._run(i), name=f"job-worker-{i}") for i in range(self.concurrency)
+        ]
+
+    async def stop(self, timeout: float = 10):
+        """Zavrsi zapocete poslove (najvise `timeout` sekundi), pa ugasi workere"""
+        self._stopping = True
+        self.wake()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self, index: int):
+        worker_id = f"{self.worker_id}:{index}"
+        while not self._stopping:
+            try:
+                job = await self.repo.lease(worker_id, self.lease_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Preuzimanje posla nije uspelo")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._execute(job, worker_id)
+
+    async def _execute(self, job: dict, worker_id: str):
+        kind = job["kind"]
+        handler = _handlers.get(kind)
+
+        self.in_flight += 1
+        try:
+            if handler is None:
+                raise LookupError(f"Nema handlera za posao {kind}")
+            await asyncio.wait_for(handler(job["payload"]), self.lease_seconds)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if handler is None or job["attempts"] >= self.max_attempts:
+                logger.exception("Posao %s (%s) je odbacen posle %s pokusaja", job["_id"], kind, job["attempts"])
+                await self.repo.bury(job["_id"], worker_id, error)
+                metrics.inc(f"jobs_dead_total.{kind}")
+            else:
+                run_at = datetime.utcnow() + timedelta(seconds=backoff_delay(job["attempts"]))
+                logger.warning("Posao %s (%s) nije uspeo, novi pokusaj u %s: %s", job["_id"], kind, run_at, error)
+                await self.repo.retry(job["_id"], worker_id, error, run_at)
+                metrics.inc(f"jobs_retried_total.{kind}")
+        else:
+            await self.repo.complete(job["_id"], worker_id)
+            metrics.inc(f"jobs_completed_total.{kind}")
+        finally:
+            self.in_flight -= 1
+
+
+job_pool = JobWorkerPool()
+metrics.register_gauge("jobs_in_flight", lambda: job_pool.in_flight)
+
+
+async def enqueue(kind: str, payload: dict, delay: float = 0, session=None) -> str:
+    """session: posao se upisuje u istoj transakciji kao i izmena koja ga pokrece"""
+    run_at = datetime.utcnow() + timedelta(seconds=delay) if delay else None
+    job_id = await JobRepository().enqueue(kind, payload, run_at, session=session)
+    metrics.inc(f"jobs_enqueued_total.{kind}")
+    if not delay:
+        job_pool.wake()
+    return job_id
@@ -0,0 +1,137 @@
+import os
+import unicodedata
+
+from models.leaderboard_models import LeaderboardEntry, LeaderboardKind
+from repositories.applications_repository import ApplicationRepository
+from repositories.events_repository import EventRepository
+from repositories.leaderboard_repository import LeaderboardRepository
+from repositories.organisations_repository import OrganisationRepository
+from repositories.user_repository import UserRepository
+
+# koliko "virtuelnih" ocena globalnog proseka dodajemo svakome (Bayes-ovski prior)
+PRIOR_WEIGHT = float(os.getenv("LEADERBOARD_PRIOR_WEIGHT", "5"))
+# ako jos nema nijedne ocene, prior je sredina skale
+DEFAULT_MEAN = 3.0
+
+
+#normalizovan kljuc grada: "Niš", "nis " i "NIS" daju isti kljuc
+def city_key(city: str | None) -> str | None:
+    if not city:
+        return None
+    city = city.strip().lower().replace("đ", "dj")
+    city = unicodedata.normalize("NFKD", city)
+    return "".join(c for c in city if not unicodedata.combining(c)) or None
+
+
+def bayesian_score(rating_sum: float, rating_count: int, global_mean: float) -> float:
+    return round((PRIOR_WEIGHT * global_mean + rating_sum) / (PRIOR_WEIGHT + rating_count), 4)
+
+
+class LeaderboardService:
+    def __init__(self):
+        self.repo = LeaderboardRepository()
+        self.org_repo = OrganisationRepository()
+        self.user_repo = UserRepository()
+        self.event_repo = EventRepository()
+        self.app_repo = ApplicationRepository()
+
+    # 🔹 jedan unos rang liste iz agregata ocena (rating_sum / rating_count sa dokumenta)
+    def _entry(self, doc: dict, name: str, global_mean: float) -> dict:
+        return {
+            "subject_id": str(doc["_id"]),
+            "username": doc.get("username"),
+            "name": name,
+            "city": doc.get("location"),
+            "city_key": city_key(doc.get("location")),
+            "avg_rating": round(doc["rating_sum"] / doc["rating_count"], 2),
+            "rating_count": doc["rating_count"],
+            "score": bayesian_score(doc["rating_sum"], doc["rating_count"], global_mean),
+        }
+
+    @staticmethod
+    def _global_mean(docs: list[dict]):
+        total_sum = sum(d["rating_sum"] for d in docs)
+        total_count = sum(d["rating_count"] for d in docs)
+        mean = total_sum / total_count if total_count else DEFAULT_MEAN
+        return mean, total_count
+
+    async def _current_mean(self, kind: LeaderboardKind) -> float:
+        meta = await self.repo.get_meta(kind.value)
+        return meta["global_mean"] if meta else DEFAULT_MEAN
+
+    # ===============================
+    # PERIODICNI JOB: materijalizacija obe rang liste
+    # ===============================
+    async def rebuild_all(self):
+        await self.rebuild_organisations()
+        await self.rebuild_volunteers()
+
+    async def rebuild_organisations(self):
+        kind = LeaderboardKind.organisation
+        orgs = await self.org_repo.find_rated()
+        mean, total = self._global_mean(orgs)
+
+        categories = await self.event_repo.categories_by_organisation([o["_id"] for o in orgs])
+
+        entries = []
+        for org in orgs:
+            entry = self._entry(org, org.get("name"), mean)
+            entry["categories"] = categories.get(org["_id"], [])
+            entries.append(entry)
+
+        await self.repo.replace_kind(kind.value, entries)
+        await self.repo.set_meta(kind.value, mean, total)
+
+    async def rebuild_volunteers(self):
+        kind = LeaderboardKind.volunteer
+        users = await self.user_repo.find_rated()
+        mean, total = self._global_mean(users)
+
+        categories = await self.app_repo.accepted_categories_by_user([u["_id"] for u in users])
+
+        entries = []
+        for user in users:
+            entry = self._entry(user, self._full_name(user), mean)
+            entry["categories"] = categories.get(user["_id"], [])
+            entries.append(entry)
+
+        await self.repo.replace_kind(kind.value, entries)
+        await self.repo.set_meta(kind.value, mean, total)
+
+    @staticmethod
+    def _full_name(user: dict) -> str:
+        return f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
+
+    # ===============================
+    # INKREMENTALNO: posle novog review-a osvezi samo ocenjenog
+    # (globalni prosek se menja tek na sledecem periodicnom rebuild-u)
+    # ===============================
+    async def refresh_organisation(self, organisation_id, category: str | None = None):
+        org = await self.org_repo.find_by_id(str(organisation_id))
+        if not org or org.get("status") != "approved" or not org.get("rating_count"):
+            return
+
+        mean = await self._current_mean(LeaderboardKind.organisation)
+        entry = self._entry(org, org.get("name"), mean)
+        await self.repo.upsert_entry(LeaderboardKind.organisation.value, entry.pop("subject_id"), entry, category)
+
+    async def refresh_volunteer(self, user_id, category: str | None = None):
+        user = await self.user_repo.find_by_id(str(user_id))
+        if not user or not user.get("rating_count"):
+            return
+
+        mean = await self._current_mean(LeaderboardKind.volunteer)
+        entry = self._entry(user, self._full_name(user), mean)
+        await self.repo.upsert_entry(LeaderboardKind.volunteer.value, entry.pop("subject_id"), entry, category)
+
+    # ===============================
+    # CITANJE
+    # ===============================
+    async def get_leaderboard(self, kind: LeaderboardKind, city: str | None = None,
+                              category: str | None = None, limit: int = 20):
+        rows = await self.repo.find_top(kind.value, city_key(city), category, limit)
+
+        return [
+            LeaderboardEntry(rank=i, id=row["subject_id"], **row)
+            for i, row in enumerate(rows, start=1)
+        ]
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, UploadFile
+
+import metrics
+from image_derivatives import is_derivative
+from repositories.image_repository import ImageRepository
+from repositories.media_repository import MediaRepository
+from services.image_service import ImageService
+from storage import UPLOAD_ROOT, media_key, storage
+from upload_helpers import discard_temp, file_sha256, stream_to_temp
+
+logger = logging.getLogger(__name__)
+
+# ekstenzija se odredjuje po tipu sadrzaja, ne po imenu fajla → isti bajtovi uvek daju isto ime
+CONTENT_TYPE_EXTENSIONS = {"image/jpeg": ".jpg", "image/jpg": ".jpg", "image/png": ".png"}
+EXTENSION_CONTENT_TYPES = {".jpg": "image/jpeg", ".png": "image/png"}
+MEDIA_DIRECTORIES = ("users", "orgs", "events")
+
+# blob bez reference se brise tek kada je od poslednjeg upload-a proslo ovoliko sati
+# (vreme da klijent posalje URL nazad, npr. u EventIn.image_url)
+MEDIA_GC_GRACE_HOURS = float(os.getenv("MEDIA_GC_GRACE_HOURS", "24"))
+MEDIA_GC_BATCH = int(os.getenv("MEDIA_GC_BATCH", "500"))
+
+
+class MediaService:
+
+    def __init__(self):
+        self.repo = MediaRepository()
+        self.image_service = ImageService()
+
+    async def store(self, file: UploadFile, directory: str, max_bytes: int) -> str:
+        """Upload kroz API: snima se pod kljucem <directory>/<sha256><ext>, vraca kljuc"""
+        ext = CONTENT_TYPE_EXTENSIONS[file.content_type]  # tip je vec proveren u routeru
+        tmp_path, size, sha256 = await stream_to_temp(file, storage.staging_dir(f"{directory}/"), max_bytes)
+        key = f"{directory}/{sha256}{ext}"
+        try:
+            # indeks pre objave fajla, da GC ne bi obrisao fajl koji se upravo ponovo uploaduje
+            await self.repo.touch_blob(key, sha256, size, file.content_type)
+            # i kada fajl vec postoji zamenjuje se (isti bajtovi), pa konkurentni GC ne moze da ga "odnese"
+            await storage.put_file(key, tmp_path, file.content_type)
+        except BaseException:
+            await discard_temp(tmp_path)
+            raise
+        metrics.inc("media_uploads_total")
+        return key
+
+    async def presign_upload(self, directory: str, content_type: str, size: int, sha256: str, max_bytes: int) -> dict:
+        """Direktan upload u storage (presigned PUT); klijent unapred racuna sha256 sadrzaja"""
+        if not storage.supports_presigned_upload:
+            raise HTTPException(status_code=409, detail="Skladište ne podržava direktan upload, koristite multipart upload.")
+        if content_type not in CONTENT_TYPE_EXTENSIONS:
+            raise HTTPException(status_code=400, detail="Dozvoljeni su samo JPEG i PNG fajlovi")
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Fajl je prevelik (maksimalno {max_bytes // (1024 * 1024)}MB)")
+
+        key = f"{directory}/{sha256}{CONTENT_TYPE_EXTENSIONS[content_type]}"
+        if await storage.size(key) == size:
+            # isti sadrzaj je vec u storage-u → klijent preskace PUT i odmah zove complete
+            return {"key": key, "exists": True}
+        return {"key": key, "exists": False, **storage.presign_put(key, content_type, size, sha256)}
+
+    async def complete_upload(self, directory: str, key: str, max_bytes: int) -> str:
+        """Posle presigned PUT-a: proveri da objekat postoji i upisi ga u indeks blobova"""
+        prefix, _, filename = key.partition("/")
+        sha256, ext = os.path.splitext(filename)
+        if prefix != directory or ext not in EXTENSION_CONTENT_TYPES or not _is_sha256(sha256):
+            raise HTTPException(status_code=400, detail="Neispravan ključ fajla.")
+
+        size = await storage.size(key)
+        if size is None:
+            raise HTTPException(status_code=400, detail="Fajl nije uploadovan.")
+        if size > max_bytes:
+            await storage.delete(key)
+            raise HTTPException(status_code=413, detail=f"Fajl je prevelik (maksimalno {max_bytes // (1024 * 1024)}MB)")
+
+        await self.repo.touch_blob(key, sha256, size, EXTENSION_CONTENT_TYPES[ext])
+        metrics.inc("media_direct_uploads_total")
+        return key
+
+    async def register_existing_files(self, directories=MEDIA_DIRECTORIES) -> int:
+        """Upisuje u indeks lokalne fajlove uploadovane pre indeksa blobova, da i na njih dodje GC"""
+        count = 0
+        for directory in directories:
+            root = os.path.join(UPLOAD_ROOT, directory)
+            if not os.path.isdir(root):
+                continue
+            for filename in os.listdir(root):
+                if filename.startswith(".") or is_derivative(filename) or filename.endswith((".part", ".gc")):
+                    continue
+                path = os.path.join(root, filename)
+                sha256, size = await asyncio.to_thread(file_sha256, path)
+                await self.repo.register_existing(
+                    f"{directory}/{filename}", sha256, size, datetime.utcfromtimestamp(os.path.getmtime(path))
+                )
+                count += 1
+        return count
+
+    async def collect_garbage(self) -> int:
+        """Brise blobove na koje ne pokazuje nijedan korisnik, organizacija ni event"""
+        started = datetime.utcnow()
+        cutoff = started - timedelta(hours=MEDIA_GC_GRACE_HOURS)
+        candidates = await self.repo.find_gc_candidates(cutoff, started, MEDIA_GC_BATCH)
+        if not candidates:
+            return 0
+
+        urls = await ImageRepository().find_referenced_urls()
+        referenced = {key for key in map(media_key, urls) if key}
+
+        # strana po strana; zadrzani blobovi dobijaju gc_checked_at pa sledeca strana ide dalje
+        deleted = 0
+        while candidates:
+            kept = []
+            for blob in candidates:
+                if blob["_id"] not in referenced and await self._delete_blob(blob["_id"], blob["last_uploaded_at"]):
+                    deleted += 1
+                else:
+                    kept.append(blob["_id"])
+            await self.repo.mark_gc_checked(kept, started)
+            candidates = await self.repo.find_gc_candidates(cutoff, started, MEDIA_GC_BATCH)
+
+        metrics.inc("media_gc_deleted_total", deleted)
+        if deleted:
+            logger.info("Media GC: obrisano %d fajlova bez referenci", deleted)
+        return deleted
+
+    async def _delete_blob(self, key: str, last_uploaded_at: datetime) -> bool:
+        if not await self.repo.delete_if_unchanged(key, last_uploaded_at):
+            return False  # upravo ponovo uploadovan
+
+        trash = f"{key}.gc"
+        moved = await storage.move(key, trash)
+        if await self.repo.exists(key):
+            # upload istog sadrzaja izmedju brisanja iz indeksa i fajla → fajl se vraca
+            if moved:
+                await storage.move(trash, key)
+            return False
+
+        if moved:
+            await storage.delete(trash)
+        await self.image_service.delete_derivatives(key)
+        return True
+
+
+def _is_sha256(value: str) -> bool:
+    return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
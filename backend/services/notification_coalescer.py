@@ -0,0 +1,87 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from bson import ObjectId
+
+from database.transactions import run_in_transaction
+from repositories.notification_buckets_repository import NotificationBucketRepository
+
+# flush(organisation_id, message, count, group) → jedna notifikacija (jedan insert + jedan push)
+Flush = Callable[[str, str, int, str], Awaitable[object]]
+# schedule(payload, delay, session) → odlozeni posao koji posle `delay` sekundi zove flush_due(payload)
+Schedule = Callable[..., Awaitable[object]]
+
+
+class NotificationCoalescer:
+    """
+    Skuplja nalete notifikacija iste organizacije i grupe (npr. prijave na isti event).
+
+    Bucket se prazni kada `window` sekundi ne stigne nista novo, a najkasnije
+    `max_delay` sekundi posle prvog dogadjaja, pa organizacija dobija jednu poruku
+    tipa "12 new volunteers applied..." umesto dvanaest.
+
+    Bucket-i su u Mongo-u (notification_buckets), a prazni ih odlozeni posao iz reda
+    poslova: pad procesa ne gubi nista, flush se izvrsi posle restarta. Po bucket-u postoji
+    jedan lanac flush poslova, a zbirnu poruku salje samo posao koji je bucket zatvorio.
+    """
+
+    def __init__(self, flush: Flush, schedule: Schedule, window: float, max_delay: float):
+        self.flush = flush
+        self.schedule = schedule
+        self.window = window
+        self.max_delay = max(max_delay, window)
+        self.repo = NotificationBucketRepository()
+
+    async def add(self, organisation_id: str, group: str, message: str, summary: str):
+        if self.window <= 0:
+            await self.flush(organisation_id, message, 1, group)
+            return
+
+        bucket = await self.repo.add(organisation_id, group, message, summary, datetime.utcnow())
+        if bucket.get("flush_scheduled"):
+            return
+
+        # preuzimanje zakazivanja i upis flush posla u istoj transakciji: tacno jedan flush posao po bucket-u
+        async def write(session):
+            if await self.repo.claim_flush(bucket["_id"], session=session):
+                await self._schedule(bucket["_id"], self.window, session=session)
+
+        await run_in_transaction(write)
+
+    async def _schedule(self, bucket_id: ObjectId, delay: float, session=None):
+        # flush_id razlikuje poslove istog bucket-a; ponovni pokusaj istog posla ima isti flush_id
+        await self.schedule({"bucket_id": str(bucket_id), "flush_id": uuid.uuid4().hex}, delay, session=session)
+
+    def _deadline(self, bucket: dict) -> datetime:
+        return min(
+            bucket["last_at"] + timedelta(seconds=self.window),
+            bucket["first_at"] + timedelta(seconds=self.max_delay),
+        )
+
+    async def flush_due(self, payload: dict):
+        """Handler odlozenog posla: posalji zbirnu poruku ako je prozor istekao, inace zakazi ostatak"""
+        bucket_id = ObjectId(payload["bucket_id"])
+        flush_id = payload.get("flush_id")
+        now = datetime.utcnow()
+
+        bucket = await self.repo.close_if_due(bucket_id, flush_id, now, self.window, self.max_delay)
+        if bucket is None:
+            bucket = await self.repo.find_by_id(bucket_id)
+            if bucket is None:
+                return  # vec poslato
+            if bucket["open"]:
+                # u prozoru su stizali novi dogadjaji → sacekaj do novog roka
+                delay = (self._deadline(bucket) - now).total_seconds()
+                await self._schedule(bucket_id, max(delay, 0))
+                return
+            if bucket.get("flushed_by") != flush_id:
+                return  # zatvorio ga je drugi posao; on (ili njegov ponovni pokusaj) salje poruku
+            # nas posao ga je zatvorio, ali je pao pre brisanja → ovo je ponovni pokusaj
+
+        organisation_id, group, count = bucket["organisation_id"], bucket["group"], bucket["count"]
+        message = bucket["message"] if count == 1 else bucket["summary"].replace("{count}", str(count))
+
+        # izuzetak ide redu poslova (novi pokusaj); bucket se brise tek kada je poruka upisana
+        await self.flush(organisation_id, message, count, group)
+        await self.repo.delete(bucket_id)
@@ -1,8 +1,22 @@
+import os
 from datetime import datetime
 from bson import ObjectId
+from fastapi import HTTPException
+from models.notification_models import NotificationEnvelope, ResyncEnvelope
 from repositories.notifications_repository import NotificationRepository
+from services import job_queue
+from services.notification_coalescer import NotificationCoalescer
 from ws_manager import ws_manager
-from database.connection import notifications_col
+
+# koliko propustenih notifikacija najvise odigravamo pri reconnect-u
+REPLAY_LIMIT = int(os.getenv("NOTIFICATION_REPLAY_LIMIT", "100"))
+
+# prozor spajanja naleta notifikacija (0 = bez spajanja) i najduze kasnjenje prve poruke
+COALESCE_WINDOW = float(os.getenv("NOTIFICATION_COALESCE_WINDOW", "5"))
+COALESCE_MAX_DELAY = float(os.getenv("NOTIFICATION_COALESCE_MAX_DELAY", "30"))
+
+NOTIFY_JOB = "notify_org"
+FLUSH_JOB = "flush_notifications"
 
 
 class NotificationService:
@@ -10,44 +24,103 @@ class NotificationService:
     def __init__(self):
         self.repo = NotificationRepository()
 
-    async def notify_org(self, organisation_id: str, message: str):
+    async def notify_org(self, organisation_id: str, message: str, count: int = 1, group: str | None = None):
         """Upiši u bazu + pošalji WebSocket-u"""
 
         data = {
             "organisation_id": ObjectId(organisation_id),
+            "seq": await self.repo.next_seq(organisation_id),
             "message": message,
             "created_at": datetime.utcnow(),
             "is_read": False,
         }
+        if count > 1:
+            # zbirna notifikacija: koliko je dogadjaja spojeno i iz koje grupe
+            data["count"] = count
+            data["group"] = group
 
         # 1. upiši notifikaciju u bazu
         notif_id = await self.repo.create(data)
+        await self.repo.inc_unread(organisation_id, 1)
 
-        # 2. pošalji real-time preko WS
-        await ws_manager.send_to_org(organisation_id, message)
+        # 2. pošalji real-time preko WS (backplane je dostavlja workeru koji drži sokete)
+        await ws_manager.publish({**data, "_id": notif_id})
 
         return notif_id
 
-    async def get_notifications(self, organisation_id: str):
-        return await self.repo.get_by_org(organisation_id)
+    async def enqueue_notification(self, organisation_id: str, message: str,
+                                   group: str | None = None, summary: str | None = None):
+        """Za request handlere: samo upise posao, insert + WS fan-out radi job worker"""
+        await job_queue.enqueue(NOTIFY_JOB, {
+            "organisation_id": organisation_id,
+            "message": message,
+            "group": group,
+            "summary": summary,
+        })
+
+    async def notify_org_coalesced(self, organisation_id: str, group: str, message: str, summary: str):
+        """Kao notify_org, ali se nalet dogadjaja iste grupe spaja u jednu notifikaciju.
+        `summary` sadrzi "{count}", npr. "{count} new volunteers applied for your event: X"."""
+        await coalescer.add(organisation_id, group, message, summary)
 
-    async def mark_read(self, notification_id: str):
-        await self.repo.mark_as_read(notification_id)
+    async def replay_missed(self, organisation_id: str, resume_from: str):
+        """(seq, poruka) za sve sto je organizacija propustila posle notifikacije resume_from"""
+        last_seq = await self.repo.find_seq(organisation_id, resume_from)
+        if last_seq is None:
+            return [(None, ResyncEnvelope().model_dump_json())]
 
+        missed = await self.repo.find_after_seq(organisation_id, last_seq, REPLAY_LIMIT + 1)
+        if len(missed) > REPLAY_LIMIT:
+            return [(None, ResyncEnvelope().model_dump_json())]
 
+        return [(doc["seq"], NotificationEnvelope.from_doc(doc).model_dump_json()) for doc in missed]
+
+    async def get_notifications(self, organisation_id: str, limit: int = 20, before: str | None = None,
+                                unread_only: bool = False):
+        try:
+            return await self.repo.get_by_org(organisation_id, limit, before, unread_only)
+        except ValueError:
+            raise HTTPException(400, "Neispravan cursor.")
+
+    async def mark_read(self, notification_id: str, organisation_id: str):
+        if await self.repo.mark_as_read(notification_id, organisation_id):
+            await self.repo.inc_unread(organisation_id, -1)
 
     async def mark_all_read(self, organisation_id: str):
-        await notifications_col.update_many(
-            {"organisation_id": ObjectId(organisation_id), "is_read": False},
-            {"$set": {"is_read": True}}
-        )
+        modified = await self.repo.mark_all_as_read(organisation_id)
+        if modified:
+            await self.repo.inc_unread(organisation_id, -modified)
         return {"message": "All notifications marked as read"}
 
-
     async def get_unread_count(self, organisation_id: str):
-        count = await notifications_col.count_documents({
-            "organisation_id": ObjectId(organisation_id),
-            "is_read": False
-        })
-        return {"unread": count}
+        return {"unread": await self.repo.get_unread(organisation_id)}
+
+    async def reconcile_unread_counts(self):
+        await self.repo.backfill_read_at()
+        return await self.repo.recount_unread()
+
+
+async def _flush_coalesced(organisation_id: str, message: str, count: int, group: str):
+    await NotificationService().notify_org(organisation_id, message, count=count, group=group)
+
+
+async def _schedule_flush(payload: dict, delay: float, session=None):
+    await job_queue.enqueue(FLUSH_JOB, payload, delay=delay, session=session)
+
+
+coalescer = NotificationCoalescer(_flush_coalesced, _schedule_flush, COALESCE_WINDOW, COALESCE_MAX_DELAY)
+
+
+async def _run_notify_job(payload: dict):
+    service = NotificationService()
+    if payload.get("group") and payload.get("summary"):
+        # posao je gotov kada je dogadjaj upisan u bucket u bazi; zbirnu poruku upisuje FLUSH_JOB
+        await service.notify_org_coalesced(
+            payload["organisation_id"], payload["group"], payload["message"], payload["summary"]
+        )
+    else:
+        await service.notify_org(payload["organisation_id"], payload["message"])
+
 
+job_queue.register(NOTIFY_JOB, _run_notify_job)
+job_queue.register(FLUSH_JOB, coalescer.flush_due)
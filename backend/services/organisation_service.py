@@ -1,9 +1,9 @@
 import datetime
-import bcrypt
 from bson import ObjectId
 from models.organisation_models import OrganisationIn, OrganisationStatus
 from repositories.organisations_repository import OrganisationRepository
 from fastapi import HTTPException
+from auth.auth_utils import hash_password
 
 repo = OrganisationRepository()
 
@@ -31,7 +31,7 @@ class OrganisationService:
             raise HTTPException(status_code=400, detail="Organizacija sa ovim emailom već postoji.")
 
         #hesiranje passworda
-        hashed_pw = bcrypt.hashpw(org_in.password.encode(), bcrypt.gensalt()).decode()
+        hashed_pw = await hash_password(org_in.password)
 
         #mora model dump zbog cuvanja u bazi
         org_data = org_in.model_dump()
@@ -0,0 +1,129 @@
+"""
+Transactional outbox za promene prijava i review-a.
+
+Servis u istoj transakciji upise promenu domena i dogadjaj u `outbox`
+(database.transactions.run_in_transaction), pa request ne ceka nijedan
+sporedni efekat. Dispatcher cita outbox u batch-evima po redosledu nastanka
+i svaki dogadjaj predaje svim registrovanim handlerima.
+
+Isporuka je "at least once": ako handler padne, ceo dogadjaj se ponavlja
+(uz backoff), pa handleri moraju da podnesu ponovno izvrsavanje.
+"""
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import metrics
+from repositories.outbox_repository import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "1"))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", "60"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "10"))
+
+# tipovi dogadjaja
+APPLICATION_STATUS_CHANGED = "application.status_changed"
+APPLICATION_CANCELLED = "application.cancelled"
+REVIEW_CREATED = "review.created"
+
+Handler = Callable[[dict], Awaitable[object]]
+
+_handlers: dict[str, list[Handler]] = defaultdict(list)
+
+
+def subscribe(type: str, handler: Handler):
+    _handlers[type].append(handler)
+
+
+async def record(type: str, payload: dict, session=None):
+    """Poziva se unutar run_in_transaction, sa istim session-om kao i upis domena"""
+    await OutboxRepository().add(type, payload, session=session)
+
+
+class OutboxDispatcher:
+
+    def __init__(self, batch_size: int = OUTBOX_BATCH_SIZE, poll_interval: float = OUTBOX_POLL_INTERVAL,
+                 lease_seconds: float = OUTBOX_LEASE_SECONDS, max_attempts: int = OUTBOX_MAX_ATTEMPTS):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.repo = OutboxRepository()
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def wake(self):
+        """Dogadjaj upisan u istom procesu → ne cekaj sledeci poll"""
+        self._wakeup.set()
+
+    def start(self):
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self, timeout: float = 10):
+        if not self._task:
+            return
+        self._stopping = True
+        self.wake()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                dispatched = await self.dispatch_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Citanje outbox-a nije uspelo")
+                dispatched = 0
+
+            # pun batch → odmah sledeci, inace cekaj novi dogadjaj ili poll
+            if dispatched < self.batch_size:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def dispatch_batch(self) -> int:
+        events = await self.repo.claim_batch(self.batch_size, self.lease_seconds)
+        done = []
+
+        for event in events:
+            try:
+                for handler in _handlers.get(event["type"], []):
+                    await handler(event["payload"])
+            except Exception as e:
+                await self._failed(event, e)
+            else:
+                done.append(event["_id"])
+                metrics.inc(f"outbox_dispatched_total.{event['type']}")
+
+        await self.repo.mark_dispatched(done)
+        return len(events)
+
+    async def _failed(self, event: dict, error: Exception):
+        message = f"{type(error).__name__}: {error}"
+        if event["attempts"] >= self.max_attempts:
+            logger.exception("Outbox dogadjaj %s (%s) odbacen posle %s pokusaja", event["_id"], event["type"], event["attempts"])
+            await self.repo.mark_failed(event["_id"], message)
+            metrics.inc(f"outbox_failed_total.{event['type']}")
+        else:
+            delay = min(2 ** event["attempts"], 300)
+            logger.warning("Outbox dogadjaj %s (%s) nije obradjen, novi pokusaj za %ss: %s",
+                           event["_id"], event["type"], delay, message)
+            await self.repo.retry(event["_id"], message, datetime.utcnow() + timedelta(seconds=delay))
+            metrics.inc(f"outbox_retried_total.{event['type']}")
+
+
+outbox_dispatcher = OutboxDispatcher()
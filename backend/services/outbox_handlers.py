@@ -0,0 +1,34 @@
+from repositories.events_repository import EventRepository
+from services import outbox
+from services.leaderboard_service import LeaderboardService
+from services.notification_service import NotificationService
+
+
+#handleri outbox dogadjaja; registruju se importom (main.py i job_worker.py)
+
+async def refresh_leaderboard_after_review(payload: dict):
+    if payload["direction"] == "user_to_org":
+        await LeaderboardService().refresh_organisation(payload["organisation_id"], payload.get("category"))
+    else:
+        await LeaderboardService().refresh_volunteer(payload["user_id"], payload.get("category"))
+
+
+async def refresh_volunteer_categories(payload: dict):
+    # prihvacena prijava dodaje kategoriju eventa volonterovoj rang listi
+    if payload.get("status") == "accepted":
+        await LeaderboardService().refresh_volunteer(payload["user_id"], payload.get("category"))
+
+
+async def notify_org_about_cancellation(payload: dict):
+    event = await EventRepository().find_by_id(payload["event_id"])
+    if not event:
+        return
+    await NotificationService().enqueue_notification(
+        organisation_id=str(event["organisation_id"]),
+        message=f"A volunteer cancelled their application for your event: {event['title']}",
+    )
+
+
+outbox.subscribe(outbox.REVIEW_CREATED, refresh_leaderboard_after_review)
+outbox.subscribe(outbox.APPLICATION_STATUS_CHANGED, refresh_volunteer_categories)
+outbox.subscribe(outbox.APPLICATION_CANCELLED, notify_org_about_cancellation)
@@ -0,0 +1,49 @@
+from repositories.platform_stats_repository import platform_stats
+
+
+class PlatformStatsService:
+    """
+    Admin pregled platforme iz kolekcije `platform_stats`: citanje je jedan upit po _id-evima
+    (stanje reconcile-a + shardovi), bez obzira na broj korisnika, organizacija, eventova i prijava.
+    """
+
+    def __init__(self):
+        self.repo = platform_stats
+
+    async def get_stats(self) -> dict:
+        stats = await self.repo.get()
+        if stats is None or "reconciled_at" not in stats:
+            # prvi poziv pre nego sto je reconcile ikad prosao
+            stats = await self.reconcile()
+        return self._public(stats)
+
+    async def reconcile(self) -> dict:
+        """Periodicno: broji sve ispocetka i ispravlja drift inkrementalnih brojaca"""
+        # shardove citamo pre brojanja: sve sto je u njima vec je u kolekcijama, pa compute() to obuhvata
+        shards = await self.repo.shards()
+        await self.repo.replace(await self.repo.compute(), shards)
+        return await self.repo.get()
+
+    @staticmethod
+    def _public(stats: dict) -> dict:
+        users = stats.get("users", {})
+        organisations = stats.get("organisations", {}).get("by_status", {})
+        events = stats.get("events", {})
+        applications = stats.get("applications", {}).get("by_status", {})
+
+        def positive(counts: dict) -> dict:
+            return {key: count for key, count in counts.items() if count > 0}
+
+        return {
+            "users": {"total": users.get("total", 0), "by_city": positive(users.get("by_city", {}))},
+            "organisations": {"total": sum(organisations.values()), "by_status": positive(organisations)},
+            "events": {
+                "total": events.get("total", 0),
+                "by_city": positive(events.get("by_city", {})),
+                "by_category": positive(events.get("by_category", {})),
+            },
+            "applications": {"total": sum(applications.values()), "by_status": positive(applications)},
+            "reviews": stats.get("reviews", {}).get("total", 0),
+            "updated_at": stats.get("updated_at"),
+            "reconciled_at": stats.get("reconciled_at"),
+        }
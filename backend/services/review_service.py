@@ -1,15 +1,25 @@
 # services/review_service.py
 
+import asyncio
 import datetime
 from bson import ObjectId
 from fastapi import HTTPException
 
-from models.review_models import PublicReview
+from models.review_models import PublicReview, ReviewSort
 from repositories.organisations_repository import OrganisationRepository
 from repositories.review_repository import ReviewRepository
 from repositories.events_repository import EventRepository
 from repositories.applications_repository import ApplicationRepository
 from repositories.user_repository import UserRepository
+from database.transactions import run_in_transaction
+from services import outbox
+from services.outbox import outbox_dispatcher
+
+# sort polja za keyset paginaciju; _id je tie-breaker
+SORT_FIELDS = {
+    ReviewSort.newest: ["created_at", "_id"],
+    ReviewSort.rating: ["rating", "created_at", "_id"],
+}
 
 
 class ReviewService:
@@ -55,15 +65,29 @@ class ReviewService:
         review_data = {
             "event_id": event_oid,
             "user_id": user_oid,
-            "organisation_id": event["organisation_id"],
+            "organisation_id": ObjectId(event["organisation_id"]),
             "rating": rating,
             "comment": comment,
             "direction": "user_to_org",
             "created_at": datetime.datetime.utcnow()
         }
 
-        # 6️⃣ Sačuvaj review
-        inserted_id = await self.repo.create_review(review_data)
+        # 6️⃣ Review + agregati ocena na organizaciji + outbox dogadjaj, u jednoj transakciji
+        async def write(session):
+            inserted_id = await self.repo.create_review(review_data, session=session)
+            await self.org_repo.inc_rating(event["organisation_id"], int(rating), session=session)
+            await outbox.record(outbox.REVIEW_CREATED, {
+                "review_id": str(inserted_id),
+                "direction": "user_to_org",
+                "organisation_id": str(event["organisation_id"]),
+                "user_id": str(user_oid),
+                "category": event.get("category"),
+                "rating": int(rating),
+            }, session=session)
+            return inserted_id
+
+        inserted_id = await run_in_transaction(write)
+        outbox_dispatcher.wake()
 
         return {
             "message": "Review uspešno dodat.",
@@ -161,7 +185,22 @@ class ReviewService:
             "created_at": datetime.datetime.utcnow()
         }
 
-        new_id = await self.repo.create_review(review_data)
+        # 6️⃣ Review + agregati ocena na korisniku + outbox dogadjaj, u jednoj transakciji
+        async def write(session):
+            new_id = await self.repo.create_review(review_data, session=session)
+            await self.user_repo.inc_rating(user_oid, int(rating), session=session)
+            await outbox.record(outbox.REVIEW_CREATED, {
+                "review_id": str(new_id),
+                "direction": "org_to_user",
+                "organisation_id": str(org_oid),
+                "user_id": str(user_oid),
+                "category": event.get("category"),
+                "rating": int(rating),
+            }, session=session)
+            return new_id
+
+        new_id = await run_in_transaction(write)
+        outbox_dispatcher.wake()
 
         return {
             "message": "Review uspešno dodat.",
@@ -171,29 +210,29 @@ class ReviewService:
 
 
 
-    async def get_reviews_received_by_org(self, org_id: str):
-        org_oid = ObjectId(org_id)
-
-        reviews = await self.repo.find_many({
-            "organisation_id": org_oid,
-            "direction": "user_to_org"
-        })
-
-        # 🔥 KONVERZIJA ObjectId → string
-        return [await self.to_public_review(r) for r in reviews]
+    async def get_reviews_received_by_org(self, org_id: str, limit: int = 20, cursor: str | None = None,
+                                          sort: ReviewSort = ReviewSort.newest):
+        return await self._review_page(
+            {"organisation_id": ObjectId(org_id), "direction": "user_to_org"}, limit, cursor, sort
+        )
     
     
-    async def get_reviews_given_by_org(self, org_id: str):
-        org_oid = ObjectId(org_id)
+    async def get_reviews_given_by_org(self, org_id: str, limit: int = 20, cursor: str | None = None,
+                                       sort: ReviewSort = ReviewSort.newest):
+        return await self._review_page(
+            {"organisation_id": ObjectId(org_id), "direction": "org_to_user"}, limit, cursor, sort
+        )
 
-        # Uzmi sve review-e koje je org dao userima
-        reviews = await self.repo.find_many({
-            "organisation_id": org_oid,
-            "direction": "org_to_user"
-        })
 
-        # Konverzija ObjectId → string (bez ovoga FE puca)
-        return [await self.to_public_review(r) for r in reviews]
+    # 🔹 jedna strana review-a + hidratacija; vraca (reviews, next_cursor)
+    async def _review_page(self, filter: dict, limit: int, cursor: str | None, sort: ReviewSort):
+        sort_fields = SORT_FIELDS[sort]
+        try:
+            reviews, next_cursor = await self.repo.find_page(filter, sort_fields, limit, cursor)
+        except ValueError:
+            raise HTTPException(400, "Neispravan cursor.")
+
+        return await self.to_public_reviews(reviews), next_cursor
 
 
     def serialize_mongo_doc(self, doc):
@@ -205,80 +244,113 @@ class ReviewService:
 
 
     async def to_public_review(self, review):
-    # Event
-        event = await self.event_repo.find_by_id(str(review["event_id"]))
-        event_name = event["title"] if event else "Unknown event"
-
-        # User
-        user = await self.user_repo.find_by_id(str(review["user_id"]))
-        if user:
-            user_name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
-        else:
-            user_name = "Unknown user"
-
-        # Organisation
-        org = await self.org_repo.find_by_id(str(review["organisation_id"]))
-        org_name = org["name"] if org else "Unknown organisation"
-
-        return PublicReview(
-            event_name=event_name,
-            user_name=user_name,
-            organisation_name=org_name,
-            rating=review["rating"],
-            comment=review.get("comment"),
-            #created_at=review["created_at"]
-        )
+        return (await self.to_public_reviews([review]))[0]
 
-    async def get_public_reviews_for_org(self, org_id: str):
-        org_oid = ObjectId(org_id)
+    # 🔹 bulk hidratacija: jedan $in upit po tipu entiteta umesto 3 upita po review-u
+    async def to_public_reviews(self, reviews: list[dict]) -> list[PublicReview]:
+        if not reviews:
+            return []
 
-        reviews = await self.repo.find_many({
-            "organisation_id": org_oid,
-            "direction": "user_to_org"
-        })
+        event_ids = list({str(r["event_id"]) for r in reviews})
+        user_ids = list({str(r["user_id"]) for r in reviews})
+        org_ids = list({str(r["organisation_id"]) for r in reviews})
 
-        return [await self.to_public_review(r) for r in reviews]
-    
-    async def get_public_reviews_for_user(self, user_id: str):
-        user_oid = ObjectId(user_id)
+        events, users, orgs = await asyncio.gather(
+            self.event_repo.find_by_ids(event_ids, projection={"title": 1}),
+            self.user_repo.find_many_by_ids(user_ids, projection={"first_name": 1, "last_name": 1}),
+            self.org_repo.find_many_by_ids(org_ids, projection={"name": 1}),
+        )
 
-        reviews = await self.repo.find_many({
-            "user_id": user_oid,
-            "direction": "org_to_user"
-        })
+        event_map = {str(e["_id"]): e["title"] for e in events}
+        user_map = {
+            str(u["_id"]): f"{u.get('first_name', '')} {u.get('last_name', '')}".strip()
+            for u in users
+        }
+        org_map = {str(o["_id"]): o["name"] for o in orgs}
+
+        return [
+            PublicReview(
+                event_name=event_map.get(str(r["event_id"]), "Unknown event"),
+                user_name=user_map.get(str(r["user_id"]), "Unknown user"),
+                organisation_name=org_map.get(str(r["organisation_id"]), "Unknown organisation"),
+                rating=r["rating"],
+                comment=r.get("comment"),
+                created_at=r.get("created_at"),
+            )
+            for r in reviews
+        ]
+
+    async def get_public_reviews_for_org(self, org_id: str, limit: int = 20, cursor: str | None = None,
+                                         sort: ReviewSort = ReviewSort.newest):
+        return await self._review_page(
+            {"organisation_id": ObjectId(org_id), "direction": "user_to_org"}, limit, cursor, sort
+        )
+    
+    async def get_public_reviews_for_user(self, user_id: str, limit: int = 20, cursor: str | None = None,
+                                          sort: ReviewSort = ReviewSort.newest):
+        return await self._review_page(
+            {"user_id": ObjectId(user_id), "direction": "org_to_user"}, limit, cursor, sort
+        )
 
-        return [await self.to_public_review(r) for r in reviews]
 
 
+    # 🔹 avg se racuna iz agregata na dokumentu (rating_sum / rating_count)
+    @staticmethod
+    def _avg_from_aggregates(doc):
+        # rating_count je ukupan broj review-a; liste review-a su paginirane pa klijent ne broji sam
+        if not doc or not doc.get("rating_count"):
+            return {"avg_rating": None, "rating_count": 0}
+        return {"avg_rating": round(doc["rating_sum"] / doc["rating_count"], 2), "rating_count": doc["rating_count"]}
 
     async def get_user_avg_rating(self, user_id: str):
-        user_oid = ObjectId(user_id)
+        doc = await self.user_repo.find_rating_aggregates(user_id)
+        return self._avg_from_aggregates(doc)
 
-        pipeline = [
-            {"$match": {"user_id": user_oid, "direction": "org_to_user"}},
-            {"$group": {"_id": None, "avg_rating": {"$avg": "$rating"}}}
-        ]
+    async def get_org_avg_rating(self, org_id: str):
+        doc = await self.org_repo.find_rating_aggregates(org_id)
+        return self._avg_from_aggregates(doc)
 
-        result = await self.repo.aggregate(pipeline)
+    # ===============================
+    # RECONCILE agregata iz reviews kolekcije
+    # ===============================
+    async def reconcile_rating_aggregates(self):
+        # stariji user → org review-i imaju organisation_id sacuvan kao string
+        await self.repo.normalize_organisation_ids()
 
-        return {"avg_rating": round(result[0]["avg_rating"], 2)} if result else {"avg_rating": None}
-    
-    
-    async def get_org_avg_rating(self, org_id: str):
         pipeline = [
-            {"$match": {
-                "organisation_id": ObjectId(org_id),
-                "direction": "user_to_org"
-            }},
             {"$group": {
-                "_id": None,
-                "avg_rating": {"$avg": "$rating"}
+                "_id": {
+                    "direction": "$direction",
+                    "target": {"$cond": [
+                        {"$eq": ["$direction", "user_to_org"]}, "$organisation_id", "$user_id"
+                    ]},
+                    "rating": "$rating",
+                },
+                "count": {"$sum": 1},
             }}
         ]
+        rows = await self.repo.aggregate(pipeline)
+
+        per_direction = {"user_to_org": {}, "org_to_user": {}}
+        for row in rows:
+            key = row["_id"]
+            targets = per_direction.get(key["direction"])
+            if targets is None:
+                continue
+
+            agg = targets.setdefault(key["target"], {
+                "rating_sum": 0,
+                "rating_count": 0,
+                "rating_histogram": {str(i): 0 for i in range(1, 6)},
+            })
+            agg["rating_sum"] += key["rating"] * row["count"]
+            agg["rating_count"] += row["count"]
+            agg["rating_histogram"][str(key["rating"])] += row["count"]
+
+        await self.org_repo.set_rating_aggregates(per_direction["user_to_org"])
+        await self.user_repo.set_rating_aggregates(per_direction["org_to_user"])
 
-        result = await self.repo.aggregate(pipeline)
-
-        return {"avg_rating": round(result[0]["avg_rating"], 2)} if result else {"avg_rating": None}
-
-    
-    
+        return {
+            "organisations": len(per_direction["user_to_org"]),
+            "users": len(per_direction["org_to_user"]),
+        }
@@ -0,0 +1,176 @@
+import os
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+from date_helpers import bucket_start, next_bucket
+from repositories.events_repository import EventRepository
+from repositories.rollups_repository import GRANULARITIES, RollupRepository
+
+# najvise tacaka u jednoj seriji (npr. ~godina dana po danu)
+ROLLUP_MAX_POINTS = int(os.getenv("ROLLUP_MAX_POINTS", "400"))
+
+# statusi koji su odluka o prijavi; broje se u bucketu trenutka odluke (decided_at)
+DECISIONS = ("accepted", "rejected", "cancelled")
+
+
+def _status(value) -> Optional[str]:
+    return getattr(value, "value", value)
+
+
+def _scopes(event: dict) -> list[tuple[str, ObjectId]]:
+    return [("org", ObjectId(event["organisation_id"])), ("event", ObjectId(event["_id"]))]
+
+
+def _decided_at(application: dict) -> Optional[datetime]:
+    # prijave odlucene pre uvodjenja decided_at: updated_at (tako su i brojane)
+    return application.get("decided_at") or application.get("updated_at") or application.get("created_at")
+
+
+def _decision(status: str, category: Optional[str], amount: int) -> dict:
+    inc = {status: amount}
+    if status == "accepted" and category:
+        inc[f"categories.{category}"] = amount
+    return inc
+
+
+class RollupService:
+    """
+    Vremenske serije za dashboard organizacije iz dnevnih i mesecnih bucketa (`stats_rollups`).
+
+    Svaki upis prijave / eventa radi $inc upsert u bucket po organizaciji i po eventu, u istoj
+    transakciji kao i sam upis. Prijava se broji po created_at; odluka (accepted/rejected/cancelled)
+    po decided_at, a promena odluke skida brojac iz bucketa prethodne odluke. decided_at se menja
+    samo kada se status zaista promeni (updated_at menja i izmena bez promene statusa). Tako bucketi uvek
+    odgovaraju onome sto backfill() izracuna iz sirovih podataka.
+    """
+
+    def __init__(self):
+        self.repo = RollupRepository()
+        self.event_repo = EventRepository()
+
+    # -------------------------------------------------
+    # UPISI (pozivaju ih application / event servisi)
+    # -------------------------------------------------
+    async def application_created(self, event: dict, created_at: datetime, session=None):
+        await self.repo.increment(_scopes(event), created_at, {"applications": 1}, session=session)
+
+    async def application_status_changed(self, event: dict, previous: dict, new_status, decided_at: datetime,
+                                         session=None):
+        old_status, new_status = _status(previous.get("status")), _status(new_status)
+        if old_status == new_status:
+            return
+        category = _status(event.get("category"))
+        if old_status in DECISIONS:
+            await self.repo.increment(_scopes(event), _decided_at(previous) or decided_at,
+                                      _decision(old_status, category, -1), session=session)
+        if new_status in DECISIONS:
+            await self.repo.increment(_scopes(event), decided_at, _decision(new_status, category, 1),
+                                      session=session)
+
+    async def event_created(self, organisation_id, created_at: datetime):
+        await self.repo.increment([("org", ObjectId(organisation_id))], created_at, {"events": 1})
+
+    # -------------------------------------------------
+    # CITANJE: /org/stats/timeseries
+    # -------------------------------------------------
+    async def get_timeseries(self, organisation_id: str, metric: str, granularity: str,
+                             date_from: Optional[date] = None, date_to: Optional[date] = None,
+                             event_id: Optional[str] = None) -> dict:
+        date_to = date_to or datetime.utcnow().date()
+        if date_from is None:
+            date_from = date_to - timedelta(days=29) if granularity == "day" else date(date_to.year - 1, date_to.month, 1)
+        if date_from > date_to:
+            raise HTTPException(status_code=400, detail="Parametar 'from' mora biti pre 'to'.")
+
+        scope, scope_id = "org", ObjectId(organisation_id)
+        if event_id:
+            if not ObjectId.is_valid(event_id):
+                raise HTTPException(status_code=400, detail="Neispravan event_id.")
+            event = await self.event_repo.find_by_id(event_id)
+            if not event or str(event["organisation_id"]) != str(organisation_id):
+                raise HTTPException(status_code=403, detail="Event ne pripada organizaciji")
+            scope, scope_id = "event", ObjectId(event["_id"])
+            if metric == "events":
+                raise HTTPException(status_code=400, detail="Metrika 'events' postoji samo za organizaciju.")
+
+        buckets = []
+        current = bucket_start(datetime.combine(date_from, datetime.min.time()), granularity)
+        end = datetime.combine(date_to, datetime.min.time())
+        while current <= end:
+            buckets.append(current)
+            if len(buckets) > ROLLUP_MAX_POINTS:
+                raise HTTPException(status_code=400, detail=f"Opseg je prevelik (najvise {ROLLUP_MAX_POINTS} tačaka).")
+            current = next_bucket(current, granularity)
+
+        docs = await self.repo.find_range(scope, scope_id, granularity, buckets[0], current)
+        by_bucket = {doc["bucket"]: doc for doc in docs}
+
+        return {
+            "metric": metric,
+            "granularity": granularity,
+            "date_from": date_from,
+            "date_to": date_to,
+            "event_id": event_id,
+            "points": [
+                {"bucket": bucket.date(), "value": self._value(metric, by_bucket.get(bucket, {}))}
+                for bucket in buckets
+            ],
+        }
+
+    @staticmethod
+    def _value(metric: str, doc: dict):
+        if metric == "acceptance_rate":
+            accepted, rejected = doc.get("accepted", 0), doc.get("rejected", 0)
+            return round(accepted / (accepted + rejected), 4) if accepted + rejected > 0 else None
+        if metric == "volunteers_by_category":
+            return {category: count for category, count in doc.get("categories", {}).items() if count > 0}
+        return doc.get(metric, 0)
+
+    # -------------------------------------------------
+    # BACKFILL: ponovo gradi sve buckete iz events + applications
+    # -------------------------------------------------
+    async def backfill(self) -> dict:
+        """
+        Prebrisava stats_rollups. Upisi koji stignu tokom backfill-a mogu da se izgube,
+        pa ga pokretati kada nema saobracaja (ili posle toga ponoviti).
+        """
+        counters: dict[tuple, Counter] = defaultdict(Counter)
+
+        def add(scopes, moment, inc):
+            for scope, scope_id in scopes:
+                for granularity in GRANULARITIES:
+                    counters[(scope, scope_id, granularity, bucket_start(moment, granularity))].update(inc)
+
+        events = {}
+        async for event in self.repo.iter_events():
+            events[event["_id"]] = event
+            if event.get("created_at"):
+                add([("org", event["organisation_id"])], event["created_at"], {"events": 1})
+
+        applications = 0
+        async for application in self.repo.iter_applications():
+            event = events.get(application.get("event_id"))
+            if not event or not application.get("created_at"):
+                continue
+            applications += 1
+            add(_scopes(event), application["created_at"], {"applications": 1})
+            status = _status(application.get("status"))
+            if status in DECISIONS:
+                add(_scopes(event), _decided_at(application), _decision(status, _status(event.get("category")), 1))
+
+        docs = []
+        for (scope, scope_id, granularity, bucket), counts in counters.items():
+            doc = {"scope": scope, "scope_id": scope_id, "granularity": granularity, "bucket": bucket}
+            for key, count in counts.items():
+                if key.startswith("categories."):
+                    doc.setdefault("categories", {})[key.split(".", 1)[1]] = count
+                else:
+                    doc[key] = count
+            docs.append(doc)
+
+        await self.repo.replace_all(docs)
+        return {"events": len(events), "applications": applications, "buckets": len(docs)}
@@ -1,68 +1,103 @@
+import os
 from datetime import datetime
 
-from repositories.applications_repository import ApplicationRepository
-from repositories.events_repository import EventRepository
+from bson import ObjectId
+
+from repositories.org_stats_repository import OrgStatsRepository
 from repositories.organisations_repository import OrganisationRepository
 
+
+# koliko puta se preracunavanje ponavlja kada ga izmena brojaca pretekne (compare-and-set na version)
+ORG_STATS_REFRESH_ATTEMPTS = int(os.getenv("ORG_STATS_REFRESH_ATTEMPTS", "3"))
+
+
+def _status(value) -> str:
+    return getattr(value, "value", value)
+
+
 class StatisticsService:
+    """
+    Javna statistika organizacije iz materijalizovanog dokumenta `org_stats`.
+
+    Upisi prijava menjaju brojace inkrementalno (u istoj transakciji), kreiranje eventa takodje;
+    izmena/brisanje eventa oznaci dokument kao zastareo. Zastareo ili nepostojeci dokument
+    (i istek najranijeg aktivnog eventa) preracunava se jednom $facet agregacijom.
+
+    Svaka izmena povecava `version`; rezultat preracunavanja se upisuje samo ako se verzija
+    nije promenila, pa $inc ili oznaka "stale" stigla tokom compute-a ne bivaju pregazeni.
+    """
+
     def __init__(self):
-        self.event_repo = EventRepository()
-        self.app_repo = ApplicationRepository()
         self.org_repo = OrganisationRepository()
+        self.stats_repo = OrgStatsRepository()
 
     async def get_organisation_stats(self, organisation_id: str):
-        # organisation_id je USTVARI username, pa prvo naći organizaciju
-        org = await self.org_repo.find_exact_by_username(organisation_id)
-        if not org:
-            raise ValueError("Organisation not found")
-
-        org_id = str(org["_id"])
-        org_name = org["username"]
-
-        # 1️⃣ svi eventi te organizacije
-        events = await self.event_repo.find_by_organisation(org_id)
-        event_count = len(events)
-        event_ids = [str(e["_id"]) for e in events]
-
-        # ako nema evenata – odmah vrati minimalne statistike
-        if not events:
-            return {
-                "organisation_name": org_name,
-                "total_events": 0,
-                "total_applications": 0,
-                "accepted_volunteers": 0,
-                "rejected_or_cancelled": 0,
-                "avg_applications_per_event": 0,
-                "active_events": 0,
-                "last_event": None,
-            }
-
-        # 2️⃣ sve prijave za te evente
-        apps = await self.app_repo.find_by_multiple_events(event_ids)
-        total_apps = len(apps)
-
-        accepted = len([a for a in apps if a["status"] == "accepted"])
-        rejected_cancelled = len([a for a in apps if a["status"] in ["rejected", "cancelled"]])
-
-        avg_per_event = total_apps / event_count if event_count > 0 else 0
-
-        # 3️⃣ aktivni i poslednji event
+        # organisation_id je USTVARI username
+        stats = await self.stats_repo.find_by_username(organisation_id)
         now = datetime.utcnow()
-        active_events = len([e for e in events if e["end_date"] >= now])
+        if stats is None or stats.get("stale") or (stats.get("active_until") and stats["active_until"] < now):
+            org = await self.org_repo.find_exact_by_username(organisation_id)
+            if not org:
+                raise ValueError("Organisation not found")
+            stats = await self.refresh_organisation(org["_id"], org["username"])
+
+        return self._public(stats)
+
+    async def refresh_organisation(self, organisation_id, username: str) -> dict:
+        organisation_id = ObjectId(organisation_id)
+        for _ in range(ORG_STATS_REFRESH_ATTEMPTS):
+            version = await self.stats_repo.find_version(organisation_id)
+            stats = await self.stats_repo.compute(organisation_id, datetime.utcnow())
+            if await self.stats_repo.replace(organisation_id, username, stats, version):
+                break
+        else:
+            # stalno pretican (nalet upisa): vrati izracunato, a dokument ostaje na preracunavanje
+            await self.stats_repo.mark_stale(organisation_id)
+        return {**stats, "organisation_username": username}
+
+    async def reconcile_all(self):
+        """Periodicno: ispravlja eventualni drift inkrementalnih brojaca"""
+        for organisation_id in await self.stats_repo.find_organisation_ids():
+            org = await self.org_repo.find_by_id(str(organisation_id))
+            if org:
+                await self.refresh_organisation(organisation_id, org["username"])
+
+    # -------------------------------------------------
+    # INKREMENTALNE IZMENE (pozivaju ih application / event servisi)
+    # -------------------------------------------------
+    async def application_created(self, organisation_id, status, session=None):
+        await self.stats_repo.application_created(ObjectId(organisation_id), _status(status), session=session)
+
+    async def application_status_changed(self, organisation_id, old_status, new_status, session=None):
+        old_status, new_status = _status(old_status), _status(new_status)
+        if old_status and new_status and old_status != new_status:
+            await self.stats_repo.application_status_changed(
+                ObjectId(organisation_id), old_status, new_status, session=session
+            )
+
+    async def event_created(self, organisation_id, event: dict):
+        await self.stats_repo.event_created(ObjectId(organisation_id), event, datetime.utcnow())
+
+    async def event_changed(self, organisation_id):
+        await self.stats_repo.mark_stale(ObjectId(organisation_id))
 
-        last_event = max(events, key=lambda e: e["created_at"], default=None)
-        last_event_info = {
-            "title": last_event["title"],
-            "start_date": last_event["start_date"],
-        } if last_event else None
+    @staticmethod
+    def _public(stats: dict) -> dict:
+        counts = stats.get("status_counts", {})
+        total_events = stats.get("total_events", 0)
+        total_apps = stats.get("total_applications", 0)
+        last_event = stats.get("last_event")
 
         return {
-            "organisation_name": org_name,
-            "total_events": event_count,
+            "organisation_name": stats["organisation_username"],
+            "total_events": total_events,
             "total_applications": total_apps,
-            "accepted_volunteers": accepted,
-            "rejected_or_cancelled": rejected_cancelled,
-            "avg_applications_per_event": round(avg_per_event, 2),
-            "active_events": active_events,
-            "last_event": last_event_info,
+            "accepted_volunteers": counts.get("accepted", 0),
+            "rejected_or_cancelled": counts.get("rejected", 0) + counts.get("cancelled", 0),
+            "avg_applications_per_event": round(total_apps / total_events, 2) if total_events else 0,
+            "active_events": stats.get("active_events", 0),
+            "last_event": {
+                "title": last_event["title"],
+                "start_date": last_event["start_date"],
+            } if last_event else None,
         }
@@ -0,0 +1,140 @@
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from jose import JWTError, jwt
+
+import metrics
+from auth.jwt_handler import (
+    ALGORITHM, EXPIRE_MINUTES, REFRESH_EXPIRE_DAYS, SECRET_KEY, create_access_token, create_refresh_token,
+)
+from auth.revocation import revocation_list
+from models.auth_models import TokenResponse
+from repositories.organisations_repository import OrganisationRepository
+from repositories.token_repository import TokenRepository
+from repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+# koliko sekundi posle rotacije isti refresh token jos vraca vec izdatog naslednika
+# (dva taba koja istovremeno osveze token), umesto da se tretira kao kradja
+REFRESH_REUSE_GRACE_SECONDS = float(os.getenv("REFRESH_REUSE_GRACE_SECONDS", "10"))
+
+
+def _invalid_refresh() -> HTTPException:
+    return HTTPException(status_code=401, detail="Neispravan ili istekao refresh token",
+                         headers={"WWW-Authenticate": "Bearer"})
+
+
+class TokenService:
+
+    def __init__(self):
+        self.repo = TokenRepository()
+
+    async def issue(self, sub: str, role: str, family: str | None = None) -> TokenResponse:
+        """Access + refresh token; novi login zapocinje novu familiju refresh tokena"""
+        refresh_token, claims = create_refresh_token(sub, role, family or uuid.uuid4().hex)
+        await self.repo.create_refresh(claims)
+        return self._response(claims, refresh_token)
+
+    def _response(self, claims: dict, refresh_token: str) -> TokenResponse:
+        # fam u access tokenu: opoziv familije gasi i vec izdate access tokene
+        return TokenResponse(
+            access_token=create_access_token({"sub": claims["sub"], "role": claims["role"], "fam": claims["fam"]}),
+            refresh_token=refresh_token,
+            expires_in=EXPIRE_MINUTES * 60,
+        )
+
+    async def refresh(self, refresh_token: str) -> TokenResponse:
+        """Rotacija: stari refresh token se trosi, izdaje se novi par. Bez bcrypt-a."""
+        claims = self._decode_refresh(refresh_token)
+
+        successor = {
+            "jti": uuid.uuid4().hex,
+            "expires_at": datetime.utcnow() + timedelta(days=REFRESH_EXPIRE_DAYS),
+        }
+        record = await self.repo.use_refresh(claims["jti"], successor)
+        if record is None:
+            return await self._refresh_reused(claims)
+
+        if not await self._principal_active(claims["sub"], claims["role"]):
+            await self.revoke_family(claims["fam"])
+            raise _invalid_refresh()
+
+        metrics.inc("token_refreshes_total")
+        new_token, new_claims = self._successor_token(claims, successor)
+        await self.repo.create_refresh(new_claims)
+        return self._response(new_claims, new_token)
+
+    async def _refresh_reused(self, claims: dict) -> TokenResponse:
+        record = await self.repo.find_refresh(claims["jti"])
+
+        # tik posle rotacije (drugi tab je osvezio u isto vreme) → isti naslednik, bez opoziva
+        if (record and record.get("successor") and record.get("used_at")
+                and datetime.utcnow() - record["used_at"] <= timedelta(seconds=REFRESH_REUSE_GRACE_SECONDS)):
+            if not await self._principal_active(claims["sub"], claims["role"]):
+                raise _invalid_refresh()
+            metrics.inc("refresh_token_grace_total")
+            token, successor_claims = self._successor_token(claims, record["successor"])
+            return self._response(successor_claims, token)
+
+        # vec iskoriscen (ili nepoznat) token → verovatno je ukraden; gasi celu familiju
+        logger.warning("Ponovna upotreba refresh tokena (sub=%s), opozivam familiju", claims["sub"])
+        metrics.inc("refresh_token_reuse_total")
+        await self.revoke_family(claims["fam"])
+        raise _invalid_refresh()
+
+    def _successor_token(self, claims: dict, successor: dict) -> tuple[str, dict]:
+        """Naslednik je odredjen jti-jem i istekom, pa se isti token moze izgraditi ponovo"""
+        expire = successor["expires_at"].replace(tzinfo=timezone.utc)
+        return create_refresh_token(claims["sub"], claims["role"], claims["fam"], successor["jti"], expire)
+
+    async def logout(self, access_claims: dict, refresh_token: str | None = None):
+        if access_claims.get("jti"):
+            await revocation_list.revoke(access_claims["jti"], _expires_at(access_claims))
+
+        if refresh_token:
+            try:
+                claims = self._decode_refresh(refresh_token)
+            except HTTPException:
+                return
+            if claims["sub"] == access_claims.get("sub"):
+                await self.revoke_family(claims["fam"])
+
+    async def revoke_family(self, family: str):
+        tokens = await self.repo.find_family(family)
+        for token in tokens:
+            await revocation_list.revoke(token["_id"], token["expires_at"])
+
+        # i sama familija: access tokeni nose fam, pa opoziv vazi i za njih (i za naslednika iz grace prozora)
+        expires_at = max(
+            [token["expires_at"] for token in tokens] + [datetime.utcnow() + timedelta(minutes=EXPIRE_MINUTES)]
+        )
+        await revocation_list.revoke(family, expires_at)
+
+    def _decode_refresh(self, refresh_token: str) -> dict:
+        try:
+            claims = jwt.decode(refresh_token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise _invalid_refresh()
+        if claims.get("typ") != "refresh" or not claims.get("jti") or not claims.get("fam"):
+            raise _invalid_refresh()
+        if revocation_list.is_revoked(claims["jti"]) or revocation_list.is_revoked(claims["fam"]):
+            raise _invalid_refresh()
+        return claims
+
+    async def _principal_active(self, sub: str, role: str) -> bool:
+        if role == "organisation":
+            org = await OrganisationRepository().find_by_email(sub)
+            return bool(org) and org.get("status") == "approved"
+        try:
+            return await UserRepository().find_by_id(sub) is not None
+        except InvalidId:
+            return False
+
+
+def _expires_at(claims: dict) -> datetime:
+    return datetime.utcfromtimestamp(claims["exp"])
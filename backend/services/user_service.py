@@ -1,5 +1,5 @@
-import bcrypt
 from bson import ObjectId
+from auth.auth_utils import hash_password
 from repositories.user_repository import UserRepository
 from models.user_models import UserIn, UserUpdate
 from fastapi import HTTPException, status
@@ -43,18 +43,16 @@ class UserService:
 
             # Ako se menja password — hešuj ga
             if "password" in update_data and update_data["password"]:
-                update_data["password"] = bcrypt.hashpw(
-                    update_data["password"].encode(), bcrypt.gensalt()
-                ).decode()
+                update_data["password"] = await hash_password(update_data["password"])
                 
             if "username" in update_data:
                 existing = await repo.find_by_username(update_data["username"])
                 if existing and str(existing["_id"]) != str(current_user.id):
                     raise HTTPException(400, "Korisničko ime je zauzeto")
 
-            result = await repo.update(ObjectId(current_user.id), update_data)
+            updated = await repo.update(ObjectId(current_user.id), update_data)
 
-            if result.matched_count == 0:
+            if not updated:
                 raise HTTPException(status_code=404, detail="Korisnik nije pronađen")
 
             updated_user = await repo.find_by_id(current_user.id)
@@ -0,0 +1,95 @@
+"""
+Skladiste uploadovanih fajlova (STORAGE_BACKEND):
+  - local: uploads/ na disku API servera (default), servira ga StaticFiles mount
+  - s3:    S3-kompatibilan bucket (AWS, MinIO); upload ide presigned PUT-om direktno u bucket
+
+Kljuc fajla je putanja ispod korena skladista, npr. events/<sha256>.png.
+U bazi se cuva apsolutni URL, a pri serijalizaciji odgovora (MediaUrl u models/media_models.py)
+se prepisuje na MEDIA_PUBLIC_BASE_URL, pa promena domena / CDN-a ne trazi migraciju podataka.
+"""
+import os
+import posixpath
+
+from storage.local import UPLOAD_ROOT, LocalStorage
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "local")
+# npr. https://cdn.example.com/media; prazno = URL API servera (local) ili bucket-a (s3)
+MEDIA_PUBLIC_BASE_URL = os.getenv("MEDIA_PUBLIC_BASE_URL", "").rstrip("/")
+
+
+def _create_storage():
+    if STORAGE_BACKEND == "local":
+        return LocalStorage()
+    if STORAGE_BACKEND == "s3":
+        from storage.s3 import S3Storage
+        return S3Storage()
+    raise ValueError(f"Nepoznat STORAGE_BACKEND: {STORAGE_BACKEND}")
+
+
+storage = _create_storage()
+
+
+def public_base_url(request_base_url: str | None = None) -> str:
+    if MEDIA_PUBLIC_BASE_URL:
+        return MEDIA_PUBLIC_BASE_URL
+    if not storage.serves_locally:
+        return storage.default_public_base_url()
+    return f"{(request_base_url or '').rstrip('/')}/{UPLOAD_ROOT}"
+
+
+def url_for_key(key: str, request_base_url: str | None = None) -> str:
+    """URL koji se upisuje u bazu posle upload-a"""
+    return f"{public_base_url(request_base_url)}/{key}"
+
+
+def _known_bases() -> list[str]:
+    bases = [MEDIA_PUBLIC_BASE_URL] if MEDIA_PUBLIC_BASE_URL else []
+    if not storage.serves_locally:
+        bases.append(storage.default_public_base_url())
+    return bases
+
+
+def media_key(url: str | None) -> str | None:
+    """URL (trenutni ili stari, npr. http://host/uploads/events/x.jpg) → events/x.jpg; None ako nije nas fajl"""
+    if not url:
+        return None
+
+    key = None
+    for base in _known_bases():
+        if url.startswith(f"{base}/"):
+            key = url[len(base) + 1:]
+            break
+    else:
+        marker = f"/{UPLOAD_ROOT}/"  # URL-ovi sa lokalnog skladista (i pre MEDIA_PUBLIC_BASE_URL)
+        if marker in url:
+            key = url.split(marker, 1)[1]
+
+    if not key:
+        return None
+    key = posixpath.normpath(key.split("?", 1)[0])
+    if key.startswith("..") or key.startswith("/"):
+        return None
+    return key
+
+
+def canonical_media_url(url: str | None) -> str | None:
+    """URL koji je klijent vratio (npr. EventIn.image_url, mozda presigned) → oblik koji se cuva u bazi"""
+    key = media_key(url)
+    if key is None:
+        return url
+    if MEDIA_PUBLIC_BASE_URL or not storage.serves_locally:
+        return f"{public_base_url()}/{key}"
+    return url.split("?", 1)[0]
+
+
+def media_url(url: str | None) -> str | None:
+    """Sacuvani URL → URL za klijenta po trenutnoj konfiguraciji (tudji URL-ovi ostaju isti)"""
+    key = media_key(url)
+    if key is None:
+        return url
+    presigned = storage.presign_get(key)
+    if presigned:
+        return presigned
+    if MEDIA_PUBLIC_BASE_URL or not storage.serves_locally:
+        return f"{public_base_url()}/{key}"
+    return url
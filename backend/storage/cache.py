@@ -0,0 +1,16 @@
+import posixpath
+
+# ime fajla = sha256 sadrzaja (ili izvedeno iz njega) → sadrzaj na tom URL-u se nikad ne menja
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# stara imena (id vlasnika, uuid) su se prepisivala → browser mora da proveri ETag
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def is_content_addressed(key: str) -> bool:
+    """events/<sha256>.png i izvedene events/<sha256>.card.webp"""
+    stem = posixpath.basename(key).split(".", 1)[0]
+    return len(stem) == 64 and all(c in "0123456789abcdef" for c in stem)
+
+
+def cache_control_for(key: str) -> str:
+    return IMMUTABLE_CACHE_CONTROL if is_content_addressed(key) else REVALIDATE_CACHE_CONTROL
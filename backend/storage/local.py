@@ -0,0 +1,74 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+UPLOAD_ROOT = "uploads"
+
+
+def _move(src: str, dst: str):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    os.chmod(src, 0o644)  # mkstemp pravi 0600
+    os.replace(src, dst)
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _size(path: str) -> int | None:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return None
+
+
+class LocalStorage:
+    """Fajlovi u uploads/ na disku API servera, servira ih StaticFiles mount u main.py"""
+
+    serves_locally = True
+    supports_presigned_upload = False
+
+    def __init__(self, root: str = UPLOAD_ROOT):
+        self.root = root
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def staging_dir(self, key: str) -> str:
+        # privremeni fajl na istom fajl sistemu kao odrediste → os.replace je atomski
+        directory = os.path.dirname(self.path(key))
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    async def put_file(self, key: str, local_path: str, content_type: str | None = None):
+        """Premesta (ne kopira) lokalni fajl pod kljuc; isti fajl na istoj putanji se preskace"""
+        dst = self.path(key)
+        if os.path.abspath(local_path) != os.path.abspath(dst):
+            await asyncio.to_thread(_move, local_path, dst)
+
+    async def size(self, key: str) -> int | None:
+        return await asyncio.to_thread(_size, self.path(key))
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(_remove_quietly, self.path(key))
+
+    async def move(self, src_key: str, dst_key: str) -> bool:
+        try:
+            await asyncio.to_thread(os.replace, self.path(src_key), self.path(dst_key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    @asynccontextmanager
+    async def local_copy(self, key: str):
+        """Putanja do fajla za obradu (npr. Pillow); izvedeni fajlovi pisani pored njega ostaju na mestu"""
+        yield self.path(key)
+
+    def presign_put(self, key: str, content_type: str, size: int, sha256: str) -> dict | None:
+        return None
+
+    def presign_get(self, key: str) -> str | None:
+        return None
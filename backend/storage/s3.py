@@ -0,0 +1,135 @@
+import asyncio
+import base64
+import os
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from storage.cache import cache_control_for
+
+S3_BUCKET = os.getenv("S3_BUCKET", "diplomski-media")
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL")  # npr. http://localhost:9000 za lokalni MinIO; prazno = AWS
+S3_REGION = os.getenv("S3_REGION", "us-east-1")
+S3_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY_ID")
+S3_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY")
+S3_PRESIGN_EXPIRES_SECONDS = int(os.getenv("S3_PRESIGN_EXPIRES_SECONDS", "900"))
+# privatni bucket: javni URL-ovi se u odgovorima zamenjuju presigned GET URL-ovima
+S3_PRESIGN_GET = os.getenv("S3_PRESIGN_GET", "false").lower() == "true"
+
+
+def _is_not_found(e: ClientError) -> bool:
+    return e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+
+class S3Storage:
+    """S3-kompatibilan object storage (AWS S3, MinIO); bajtovi slika ne prolaze kroz API workere"""
+
+    serves_locally = False
+    supports_presigned_upload = True
+
+    def __init__(self, bucket: str = S3_BUCKET):
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=S3_ENDPOINT_URL,
+            region_name=S3_REGION,
+            aws_access_key_id=S3_ACCESS_KEY_ID,
+            aws_secret_access_key=S3_SECRET_ACCESS_KEY,
+            # path-style radi i sa MinIO bez wildcard DNS-a
+            config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+        )
+
+    def default_public_base_url(self) -> str:
+        endpoint = S3_ENDPOINT_URL or f"https://s3.{S3_REGION}.amazonaws.com"
+        return f"{endpoint.rstrip('/')}/{self.bucket}"
+
+    def staging_dir(self, key: str) -> str:
+        return tempfile.gettempdir()
+
+    async def put_file(self, key: str, local_path: str, content_type: str | None = None):
+        """Salje lokalni fajl pod kljuc i brise lokalnu kopiju"""
+        extra = {"CacheControl": cache_control_for(key)}
+        if content_type:
+            extra["ContentType"] = content_type
+        await asyncio.to_thread(self.client.upload_file, local_path, self.bucket, key, ExtraArgs=extra)
+        await asyncio.to_thread(os.remove, local_path)
+
+    async def size(self, key: str) -> int | None:
+        try:
+            head = await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if _is_not_found(e):
+                return None
+            raise
+        return head["ContentLength"]
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def move(self, src_key: str, dst_key: str) -> bool:
+        try:
+            await asyncio.to_thread(
+                self.client.copy_object, Bucket=self.bucket, Key=dst_key,
+                CopySource={"Bucket": self.bucket, "Key": src_key}
+            )
+        except ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise
+        await self.delete(src_key)
+        return True
+
+    @asynccontextmanager
+    async def local_copy(self, key: str):
+        """Preuzima objekat u privremeni folder; izvedeni fajlovi se iz njega salju sa put_file"""
+        directory = await asyncio.to_thread(tempfile.mkdtemp, prefix="media-")
+        path = os.path.join(directory, os.path.basename(key))
+        try:
+            try:
+                await asyncio.to_thread(self.client.download_file, self.bucket, key, path)
+            except ClientError as e:
+                if _is_not_found(e):
+                    raise FileNotFoundError(key) from e
+                raise
+            yield path
+        finally:
+            await asyncio.to_thread(shutil.rmtree, directory, True)
+
+    def presign_put(self, key: str, content_type: str, size: int, sha256: str) -> dict:
+        """
+        Presigned PUT direktno u bucket. Potpisani su Content-Type, Content-Length i
+        x-amz-checksum-sha256, pa storage odbija drugaciji sadrzaj ili velicinu od prijavljene.
+        Cache-Control se cuva uz objekat i bucket/CDN ga vraca pri svakom GET-u.
+        """
+        cache_control = cache_control_for(key)
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+                "ContentLength": size,
+                "CacheControl": cache_control,
+                "ChecksumSHA256": checksum,
+            },
+            ExpiresIn=S3_PRESIGN_EXPIRES_SECONDS,
+        )
+        return {
+            "upload_url": url,
+            "method": "PUT",
+            "headers": {"Content-Type": content_type, "Cache-Control": cache_control, "x-amz-checksum-sha256": checksum},
+            "expires_in": S3_PRESIGN_EXPIRES_SECONDS,
+        }
+
+    def presign_get(self, key: str) -> str | None:
+        if not S3_PRESIGN_GET:
+            return None
+        # potpisivanje je lokalno racunanje (bez mreznog poziva), pa moze i pri serijalizaciji
+        return self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key}, ExpiresIn=S3_PRESIGN_EXPIRES_SECONDS
+        )
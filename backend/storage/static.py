@@ -0,0 +1,70 @@
+import os
+from collections import OrderedDict
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+import metrics
+from repositories.media_repository import MediaRepository
+from storage.cache import cache_control_for, is_content_addressed
+
+MEDIA_META_CACHE_SIZE = int(os.getenv("MEDIA_META_CACHE_SIZE", "10000"))
+
+
+class MediaStaticFiles(StaticFiles):
+    """
+    StaticFiles za lokalno skladiste (/uploads):
+      - Cache-Control: immutable za content-addressed imena, no-cache za stara imena
+      - jak ETag = sha256 sadrzaja iz indeksa media_blobs (bez citanja fajla), If-None-Match → 304
+      - Range / If-Range obradjuje FileResponse (206, 416)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.repo = MediaRepository()
+        # sadrzaj na content-addressed kljucu se ne menja, pa se sha256 po kljucu moze cuvati u memoriji
+        self._meta: OrderedDict[str, tuple[str, int]] = OrderedDict()
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        # privremeni fajlovi upload-a i GC-a nisu javni
+        name = os.path.basename(path)
+        if name.startswith(".") or name.endswith((".part", ".gc")):
+            raise HTTPException(status_code=404)
+
+        key = path.replace(os.sep, "/")
+        scope["media_key"] = key
+        scope["media_meta"] = await self._lookup_meta(key) if is_content_addressed(key) else None
+        return await super().get_response(path, scope)
+
+    async def _lookup_meta(self, key: str) -> tuple[str, int] | None:
+        meta = self._meta.get(key)
+        if meta is not None:
+            self._meta.move_to_end(key)
+            return meta
+
+        doc = await self.repo.find_meta(key)
+        if not doc or "sha256" not in doc:
+            return None
+        meta = (doc["sha256"], doc["size"])
+        self._meta[key] = meta
+        while len(self._meta) > MEDIA_META_CACHE_SIZE:
+            self._meta.popitem(last=False)
+        return meta
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        headers = {"Cache-Control": cache_control_for(scope["media_key"])}
+        meta = scope.get("media_meta")
+        # indeks vazi samo ako se slaze sa fajlom na disku (inace ETag iz mtime/velicine, kao StaticFiles)
+        if meta is not None and meta[1] == stat_result.st_size:
+            headers["ETag"] = f'"{meta[0]}"'
+        else:
+            metrics.inc("media_serve_unindexed_total")
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            metrics.inc("media_serve_not_modified_total")
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,34 @@
+"""
+Testovi rade nad mongomock-motor bazom u memoriji (bez Mongo servera, bez transakcija).
+Kolekcije u database.connection se zamenjuju pre nego sto ih repozitorijumi uvezu.
+
+    pip install -r requirements-dev.txt
+    pytest
+"""
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ["MONGO_TRANSACTIONS"] = "off"
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+import database.connection as connection
+
+connection.client = AsyncMongoMockClient()
+connection.db = connection.client["test"]
+COLLECTIONS = [name for name in vars(connection) if name.endswith("_col")]
+for _name in COLLECTIONS:
+    setattr(connection, _name, connection.db[getattr(connection, _name).name])
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def clean_db(anyio_backend):
+    yield
+    for name in COLLECTIONS:
+        await getattr(connection, name).delete_many({})
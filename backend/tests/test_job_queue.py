@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import database.connection as connection
+from repositories.jobs_repository import JobRepository
+from services import job_queue
+from services.job_queue import JobWorkerPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_workers_lease_a_job_once():
+    repo = JobRepository()
+    await repo.enqueue("test.noop", {})
+
+    leased = await asyncio.gather(*[repo.lease(f"w{i}", 60) for i in range(5)])
+
+    assert sum(job is not None for job in leased) == 1
+
+
+async def test_delayed_job_waits_for_run_at():
+    repo = JobRepository()
+    await repo.enqueue("test.noop", {}, run_at=datetime.utcnow() + timedelta(minutes=1))
+
+    assert await repo.lease("w1", 60) is None
+
+
+async def test_expired_lease_is_taken_over_and_stale_worker_cannot_finish():
+    repo = JobRepository()
+    await repo.enqueue("test.noop", {})
+    job = await repo.lease("w1", 60)
+    # w1 je pao usred posla
+    expired = datetime.utcnow() - timedelta(seconds=1)
+    await connection.jobs_col.update_one({"_id": job["_id"]}, {"$set": {"lease_until": expired}})
+
+    taken = await repo.lease("w2", 60)
+    assert taken["_id"] == job["_id"] and taken["attempts"] == 2
+
+    await repo.complete(job["_id"], "w1")
+    assert (await connection.jobs_col.find_one({"_id": job["_id"]}))["status"] == "running"
+    await repo.complete(job["_id"], "w2")
+    assert (await connection.jobs_col.find_one({"_id": job["_id"]}))["status"] == "done"
+
+
+async def test_failing_job_is_retried_then_buried():
+    calls = []
+
+    async def failing(payload):
+        calls.append(payload)
+        raise RuntimeError("ne moze")
+
+    job_queue.register("test.failing", failing)
+    pool = JobWorkerPool(concurrency=1, max_attempts=2)
+    repo = JobRepository()
+    job_id = await repo.enqueue("test.failing", {"n": 1})
+
+    await pool._execute(await repo.lease("w1", 60), "w1")
+    job = await connection.jobs_col.find_one({})
+    assert job["status"] == "queued" and job["run_at"] > datetime.utcnow()
+    assert "RuntimeError" in job["last_error"]
+
+    await connection.jobs_col.update_one({}, {"$set": {"run_at": datetime.utcnow()}})
+    await pool._execute(await repo.lease("w1", 60), "w1")
+    job = await connection.jobs_col.find_one({})
+    assert str(job["_id"]) == job_id and job["status"] == "dead"
+    assert calls == [{"n": 1}, {"n": 1}]
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import database.connection as connection
+from services.notification_coalescer import NotificationCoalescer
+
+pytestmark = pytest.mark.anyio
+
+ORG = "org-1"
+SUMMARY = "{count} new volunteers applied"
+
+
+class Recorder:
+    def __init__(self, fail_times: int = 0):
+        self.sent = []
+        self.scheduled = []
+        self.fail_times = fail_times
+
+    async def flush(self, organisation_id, message, count, group):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("upis notifikacije nije uspeo")
+        self.sent.append((organisation_id, message, count, group))
+
+    async def schedule(self, payload, delay, session=None):
+        self.scheduled.append((payload, delay))
+
+
+def make(recorder: Recorder, window: float = 5, max_delay: float = 30) -> NotificationCoalescer:
+    return NotificationCoalescer(recorder.flush, recorder.schedule, window, max_delay)
+
+
+async def expire_window():
+    past = datetime.utcnow() - timedelta(minutes=5)
+    await connection.notification_buckets_col.update_many({}, {"$set": {"first_at": past, "last_at": past}})
+
+
+async def test_burst_is_sent_once_as_summary():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    for i in range(3):
+        await coalescer.add(ORG, "event-1", f"volunteer {i} applied", SUMMARY)
+
+    assert len(recorder.scheduled) == 1
+    await expire_window()
+    await coalescer.flush_due(recorder.scheduled[0][0])
+
+    assert recorder.sent == [(ORG, "3 new volunteers applied", 3, "event-1")]
+    assert await connection.notification_buckets_col.count_documents({}) == 0
+
+
+async def test_single_event_keeps_its_own_message():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    await coalescer.add(ORG, "event-1", "volunteer applied", SUMMARY)
+    await expire_window()
+    await coalescer.flush_due(recorder.scheduled[0][0])
+
+    assert recorder.sent == [(ORG, "volunteer applied", 1, "event-1")]
+
+
+async def test_concurrent_adds_schedule_one_flush_job():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    await asyncio.gather(*[coalescer.add(ORG, "event-1", "applied", SUMMARY) for _ in range(10)])
+
+    assert len(recorder.scheduled) == 1
+    bucket = await connection.notification_buckets_col.find_one({})
+    assert bucket["count"] == 10
+
+
+async def test_open_bucket_reschedules_instead_of_sending():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await coalescer.flush_due(recorder.scheduled[0][0])
+
+    assert recorder.sent == []
+    assert len(recorder.scheduled) == 2
+    assert 0 <= recorder.scheduled[1][1] <= 5
+
+
+async def test_only_the_closing_job_sends_the_summary():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await expire_window()
+
+    payload = recorder.scheduled[0][0]
+    stray = {**payload, "flush_id": "drugi-posao"}
+    await asyncio.gather(coalescer.flush_due(payload), coalescer.flush_due(stray))
+
+    assert len(recorder.sent) == 1
+
+
+async def test_retry_after_failed_flush_sends_once():
+    recorder = Recorder(fail_times=1)
+    coalescer = make(recorder)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await expire_window()
+    payload = recorder.scheduled[0][0]
+
+    with pytest.raises(RuntimeError):
+        await coalescer.flush_due(payload)
+    # bucket je zatvoren ali nije obrisan; drugi posao ga ne sme poslati, ponovni pokusaj vlasnika sme
+    await coalescer.flush_due({**payload, "flush_id": "drugi-posao"})
+    assert recorder.sent == []
+
+    await coalescer.flush_due(payload)
+    assert recorder.sent == [(ORG, "2 new volunteers applied", 2, "event-1")]
+    assert await connection.notification_buckets_col.count_documents({}) == 0
+
+
+async def test_events_after_close_go_to_a_new_bucket():
+    recorder = Recorder()
+    coalescer = make(recorder)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+    await expire_window()
+    first = recorder.scheduled[0][0]
+    await coalescer.flush_due(first)
+
+    await coalescer.add(ORG, "event-1", "applied again", SUMMARY)
+    assert len(recorder.scheduled) == 2
+    assert recorder.scheduled[1][0]["bucket_id"] != first["bucket_id"]
+
+
+async def test_zero_window_sends_immediately():
+    recorder = Recorder()
+    coalescer = make(recorder, window=0)
+    await coalescer.add(ORG, "event-1", "applied", SUMMARY)
+
+    assert recorder.sent == [(ORG, "applied", 1, "event-1")]
+    assert recorder.scheduled == []
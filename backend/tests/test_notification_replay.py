@@ -0,0 +1,33 @@
+import json
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+import database.connection as connection
+from services.notification_service import NotificationService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_replay_keeps_count_of_coalesced_notifications():
+    org_id = ObjectId()
+    now = datetime.utcnow()
+    result = await connection.notifications_col.insert_many([
+        {"organisation_id": org_id, "seq": 1, "message": "volunteer applied", "created_at": now},
+        {"organisation_id": org_id, "seq": 2, "message": "12 new volunteers applied", "created_at": now,
+         "count": 12, "group": "event-1"},
+        {"organisation_id": org_id, "seq": 3, "message": "volunteer cancelled", "created_at": now},
+    ])
+
+    replayed = await NotificationService().replay_missed(str(org_id), str(result.inserted_ids[0]))
+
+    assert [seq for seq, _ in replayed] == [2, 3]
+    envelopes = [json.loads(message) for _, message in replayed]
+    assert [envelope["count"] for envelope in envelopes] == [12, 1]
+
+
+async def test_unknown_resume_point_asks_for_resync():
+    replayed = await NotificationService().replay_missed(str(ObjectId()), str(ObjectId()))
+
+    assert [json.loads(message)["type"] for _, message in replayed] == ["resync"]
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+import database.connection as connection
+from services.statistics_service import StatisticsService
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_org(username: str = "crveni") -> ObjectId:
+    result = await connection.organisations_col.insert_one({"username": username, "name": "Crveni krst"})
+    return result.inserted_id
+
+
+async def create_event(org_id: ObjectId, title: str, ends_in_days: int) -> ObjectId:
+    now = datetime.utcnow()
+    result = await connection.events_col.insert_one({
+        "organisation_id": org_id,
+        "title": title,
+        "start_date": now,
+        "end_date": now + timedelta(days=ends_in_days),
+        "created_at": now,
+    })
+    return result.inserted_id
+
+
+async def test_first_read_materializes_stats():
+    org_id = await create_org()
+    event_id = await create_event(org_id, "Trka", ends_in_days=2)
+    await create_event(org_id, "Stara", ends_in_days=-2)
+    await connection.applications_col.insert_many([
+        {"event_id": event_id, "status": "accepted"},
+        {"event_id": event_id, "status": "pending"},
+        {"event_id": event_id, "status": "rejected"},
+    ])
+
+    stats = await StatisticsService().get_organisation_stats("crveni")
+
+    assert stats["total_events"] == 2
+    assert stats["active_events"] == 1
+    assert stats["total_applications"] == 3
+    assert stats["accepted_volunteers"] == 1
+    assert stats["rejected_or_cancelled"] == 1
+    doc = await connection.org_stats_col.find_one({"_id": org_id})
+    assert doc["stale"] is False and doc["version"] == 1
+
+
+async def test_increment_during_recompute_is_not_overwritten():
+    org_id = await create_org()
+    service = StatisticsService()
+    compute = service.stats_repo.compute
+    calls = []
+
+    async def racing_compute(organisation_id, now):
+        result = await compute(organisation_id, now)
+        if not calls:
+            # prijava stize izmedju compute() i replace(), pre prve materijalizacije
+            await connection.applications_col.insert_one({"event_id": ObjectId(), "status": "pending"})
+            await service.application_created(org_id, "pending")
+        calls.append(result)
+        return result
+
+    service.stats_repo.compute = racing_compute
+    await service.get_organisation_stats("crveni")
+
+    assert len(calls) == 2  # prvi rezultat je odbacen, drugi upisan
+    doc = await connection.org_stats_col.find_one({"_id": org_id})
+    assert doc["version"] == 2
+    assert doc["organisation_username"] == "crveni"
+
+
+async def test_stale_flag_set_during_recompute_survives():
+    org_id = await create_org()
+    service = StatisticsService()
+    await service.get_organisation_stats("crveni")
+    compute = service.stats_repo.compute
+
+    async def always_racing(organisation_id, now):
+        result = await compute(organisation_id, now)
+        await service.event_changed(org_id)
+        return result
+
+    service.stats_repo.compute = always_racing
+    await service.refresh_organisation(org_id, "crveni")
+
+    doc = await connection.org_stats_col.find_one({"_id": org_id})
+    assert doc["stale"] is True
+
+
+async def test_status_change_moves_count_between_statuses():
+    org_id = await create_org()
+    event_id = await create_event(org_id, "Trka", ends_in_days=2)
+    await connection.applications_col.insert_one({"event_id": event_id, "status": "pending"})
+    service = StatisticsService()
+    await service.get_organisation_stats("crveni")
+
+    await service.application_status_changed(org_id, "pending", "accepted")
+    await service.application_status_changed(org_id, "accepted", "accepted")  # bez promene
+
+    stats = await service.get_organisation_stats("crveni")
+    assert stats["accepted_volunteers"] == 1
+    assert stats["total_applications"] == 1
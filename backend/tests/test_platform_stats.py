@@ -0,0 +1,56 @@
+import pytest
+
+import database.connection as connection
+from repositories.user_repository import UserRepository
+from services.platform_stats_service import PlatformStatsService
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_user(username: str, location: str = "Beograd"):
+    return await UserRepository().create({"username": username, "location": location})
+
+
+async def test_reconcile_matches_collections():
+    await create_user("ana")
+    await create_user("marko", "Novi Sad")
+    await connection.platform_stats_col.insert_one({"_id": "global:0", "users": {"total": 5}})  # drift
+
+    stats = await PlatformStatsService().reconcile()
+
+    assert stats["users"]["total"] == 2
+    assert stats["users"]["by_city"] == {"beograd": 1, "novi sad": 1}
+
+
+async def test_increment_between_compute_and_replace_is_kept():
+    await create_user("ana")
+    service = PlatformStatsService()
+    compute = service.repo.compute
+
+    async def racing_compute():
+        result = await compute()
+        # korisnik se registruje posle brojanja, a pre upisa reconcile-a
+        await create_user("marko", "Novi Sad")
+        return result
+
+    service.repo.compute = racing_compute
+    try:
+        stats = await service.reconcile()
+    finally:
+        service.repo.compute = compute
+
+    assert stats["users"]["total"] == 2
+    assert stats["users"]["by_city"] == {"beograd": 1, "novi sad": 1}
+
+
+async def test_location_change_moves_city_count():
+    user_id = await create_user("ana")
+    service = PlatformStatsService()
+    await service.reconcile()
+
+    assert await UserRepository().update(user_id, {"location": "Niš"})
+    assert not await UserRepository().update("0" * 24, {"location": "Niš"})
+
+    stats = await service.repo.get()
+    assert stats["users"]["by_city"]["beograd"] == 0
+    assert stats["users"]["by_city"]["niš"] == 1
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import database.connection as connection
+from auth.rate_limiter import LoginLimiter, MemorySlidingWindow, MongoSlidingWindow
+
+pytestmark = pytest.mark.anyio
+
+
+def request_from(ip: str) -> Request:
+    return Request({"type": "http", "client": (ip, 5000), "headers": []})
+
+
+@pytest.fixture(params=["memory", "mongo"])
+def window(request):
+    if request.param == "memory":
+        return MemorySlidingWindow(limit=5, window=60)
+    return MongoSlidingWindow(connection.rate_limits_col, limit=5, window=60)
+
+
+async def test_window_allows_limit_then_rejects(window):
+    for _ in range(5):
+        assert await window.hit("ip:1.2.3.4") is None
+
+    retry_after = await window.hit("ip:1.2.3.4")
+    assert retry_after is not None and 0 < retry_after <= 60
+    assert await window.peek("ip:1.2.3.4") is not None
+    assert await window.peek("ip:5.6.7.8") is None
+
+
+async def test_concurrent_burst_allows_exactly_the_limit(window):
+    results = await asyncio.gather(*[window.hit("user:ana@example.com") for _ in range(12)])
+
+    assert sum(result is None for result in results) == 5
+
+
+async def test_rejected_hits_are_not_counted_and_reset_clears(window):
+    for _ in range(8):
+        await window.hit("user:ana@example.com")
+    await window.reset("user:ana@example.com")
+
+    assert await window.hit("user:ana@example.com") is None
+
+
+async def test_login_limiter_counts_attempts_per_account_up_front():
+    limiter = LoginLimiter()
+    for i in range(5):
+        await limiter.check(request_from(f"10.0.0.{i}"), "user", "Ana@Example.com")
+
+    # druga IP adresa, isti nalog (bez obzira na velika slova)
+    with pytest.raises(HTTPException) as throttled:
+        await limiter.check(request_from("10.0.0.99"), "user", "ana@example.com")
+    assert throttled.value.status_code == 429
+    assert int(throttled.value.headers["Retry-After"]) >= 1
+
+    await limiter.succeeded("user", "ana@example.com")
+    await limiter.check(request_from("10.0.0.99"), "user", "ana@example.com")
@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+import database.connection as connection
+from auth.dependencies import get_token_claims
+from services.token_service import TokenService
+
+pytestmark = pytest.mark.anyio
+
+
+async def login(service: TokenService):
+    result = await connection.users_col.insert_one({"username": "ana", "email": "ana@example.com"})
+    return await service.issue(str(result.inserted_id), "user")
+
+
+async def expire_grace():
+    past = datetime.utcnow() - timedelta(minutes=5)
+    await connection.refresh_tokens_col.update_many({"used_at": {"$ne": None}}, {"$set": {"used_at": past}})
+
+
+async def test_refresh_rotates_the_pair():
+    service = TokenService()
+    first = await login(service)
+
+    second = await service.refresh(first.refresh_token)
+
+    assert second.refresh_token != first.refresh_token
+    assert (await get_token_claims(second.access_token))["sub"]
+    assert await connection.refresh_tokens_col.count_documents({}) == 2
+
+
+async def test_concurrent_refresh_in_grace_window_returns_same_successor():
+    service = TokenService()
+    first = await login(service)
+
+    a, b = await asyncio.gather(service.refresh(first.refresh_token), service.refresh(first.refresh_token))
+
+    assert a.refresh_token == b.refresh_token
+    assert await connection.refresh_tokens_col.count_documents({}) == 2
+    await service.refresh(a.refresh_token)  # familija nije opozvana
+
+
+async def test_reuse_after_grace_window_revokes_the_family():
+    service = TokenService()
+    first = await login(service)
+    second = await service.refresh(first.refresh_token)
+    await expire_grace()
+
+    with pytest.raises(HTTPException) as reused:
+        await service.refresh(first.refresh_token)
+    assert reused.value.status_code == 401
+
+    # i naslednik i vec izdat access token iste familije vise ne vaze
+    with pytest.raises(HTTPException):
+        await service.refresh(second.refresh_token)
+    with pytest.raises(HTTPException):
+        await get_token_claims(second.access_token)
+
+
+async def test_other_families_survive_reuse():
+    service = TokenService()
+    stolen = await login(service)
+    other = await service.issue((await get_token_claims(stolen.access_token))["sub"], "user")
+    await service.refresh(stolen.refresh_token)
+    await expire_grace()
+
+    with pytest.raises(HTTPException):
+        await service.refresh(stolen.refresh_token)
+    assert (await service.refresh(other.refresh_token)).refresh_token
+
+
+async def test_refresh_for_deleted_user_is_rejected():
+    service = TokenService()
+    pair = await login(service)
+    await connection.users_col.delete_many({})
+
+    with pytest.raises(HTTPException) as rejected:
+        await service.refresh(pair.refresh_token)
+    assert rejected.value.status_code == 401
+
+
+async def test_logout_revokes_access_token_and_family():
+    service = TokenService()
+    pair = await login(service)
+    claims = await get_token_claims(pair.access_token)
+
+    await service.logout(claims, pair.refresh_token)
+
+    with pytest.raises(HTTPException):
+        await get_token_claims(pair.access_token)
+    with pytest.raises(HTTPException):
+        await service.refresh(pair.refresh_token)
@@ -0,0 +1,36 @@
+import pytest
+
+import database.connection as connection
+from routers import uploads
+
+pytestmark = pytest.mark.anyio
+
+OLD_VARIANTS = {"thumb": {"webp": "http://testserver/uploads/users/old_thumb.webp"}}
+NEW_URL = "http://testserver/uploads/users/" + "a" * 64 + ".jpg"
+
+
+async def test_new_profile_image_drops_previous_variants():
+    user_id = (await connection.users_col.insert_one({
+        "profile_image": "http://testserver/uploads/users/old.jpg",
+        "profile_image_variants": OLD_VARIANTS,
+    })).inserted_id
+
+    await uploads._set_profile_image(str(user_id), NEW_URL)
+
+    user = await connection.users_col.find_one({"_id": user_id})
+    assert user["profile_image"] == NEW_URL
+    assert user["profile_image_variants"] is None
+    assert await connection.jobs_col.count_documents({"payload.url": NEW_URL}) == 1
+
+
+async def test_new_logo_uses_existing_variants_of_same_content():
+    variants = {"thumb": {"webp": NEW_URL.replace(".jpg", "_thumb.webp")}}
+    await connection.images_col.insert_one({"_id": "orgs/x.jpg", "url": NEW_URL, "variants": variants})
+    org_id = (await connection.organisations_col.insert_one({"logo_variants": OLD_VARIANTS})).inserted_id
+
+    await uploads._set_logo(str(org_id), NEW_URL)
+
+    org = await connection.organisations_col.find_one({"_id": org_id})
+    assert org["logo"] == NEW_URL
+    assert org["logo_variants"] == variants
+
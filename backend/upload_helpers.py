@@ -0,0 +1,76 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+
+from fastapi import HTTPException, UploadFile
+
+# upload se cita i pise u komadima ove velicine → memorija po uploadu ne zavisi od velicine fajla
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(64 * 1024)))
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"Fajl je prevelik (maksimalno {max_bytes // (1024 * 1024)}MB)")
+
+
+async def stream_to_temp(file: UploadFile, directory: str, max_bytes: int) -> tuple[str, int, str]:
+    """
+    Strimuje upload u privremeni fajl u `directory` (blokirajuci I/O van event loop-a),
+    prekida cim predje max_bytes. Vraca (putanja privremenog fajla, velicina, sha256).
+    """
+    fd, tmp_path = await asyncio.to_thread(tempfile.mkstemp, dir=directory, prefix=".upload-", suffix=".part")
+    tmp = os.fdopen(fd, "wb")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(tmp.write, chunk)
+
+        await asyncio.to_thread(_flush_and_close, tmp)
+        return tmp_path, size, digest.hexdigest()
+    except BaseException:
+        await asyncio.to_thread(_discard, tmp, tmp_path)
+        raise
+
+
+async def discard_temp(tmp_path: str):
+    await asyncio.to_thread(_remove_quietly, tmp_path)
+
+
+def file_sha256(path: str) -> tuple[str, int]:
+    """(sha256, velicina) postojeceg fajla, citanjem u komadima"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _flush_and_close(tmp):
+    tmp.flush()
+    os.fsync(tmp.fileno())
+    tmp.close()
+
+
+def _discard(tmp, tmp_path: str):
+    tmp.close()
+    _remove_quietly(tmp_path)
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def reject_oversized_request(content_length: str | None, max_bytes: int, overhead: int = 64 * 1024):
+    """Brza provera pre citanja tela: Content-Length vec veci od limita (+ multipart overhead)"""
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes + overhead:
+        raise _too_large(max_bytes)
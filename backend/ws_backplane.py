@@ -0,0 +1,101 @@
+"""
+Pub/sub "backplane" ispod ConnectionManager-a.
+
+Svaki uvicorn worker drzi samo svoje WebSocket konekcije. Backplane odlucuje kako
+notifikacija upisana u jednom workeru stize do soketa u ostalima:
+
+  - memory: jedan proces, publish odmah isporucuje lokalnim soketima (default)
+  - mongo:  svaki worker prati change stream na `notifications` i isporucuje samo
+            soketima koje sam drzi; insert u kolekciju je ujedno i "objava"
+
+Change stream zahteva replica set. Lokalno je dovoljan single-node replica set:
+    mongod --replSet rs0 --dbpath ./data
+    mongosh --eval "rs.initiate()"
+    MONGO_URL="mongodb://localhost:27017/?replicaSet=rs0" WS_BACKPLANE=mongo uvicorn main:app --workers 4
+"""
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+CHANGE_STREAM_HISTORY_LOST = 286
+
+# callback kojim backplane predaje notifikaciju lokalnim soketima
+Deliver = Callable[[dict], Awaitable[None]]
+
+
+class InMemoryBackplane:
+    def __init__(self):
+        self._deliver: Deliver | None = None
+
+    def bind(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def publish(self, notification: dict):
+        await self._deliver(notification)
+
+
+class MongoChangeStreamBackplane:
+    def __init__(self, collection, retry_delay: float = 1.0):
+        self.collection = collection
+        self.retry_delay = retry_delay
+        self._deliver: Deliver | None = None
+        self._task: asyncio.Task | None = None
+        self._resume_token = None
+
+    def bind(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def start(self):
+        self._task = asyncio.create_task(self._watch(), name="ws-backplane-change-stream")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def publish(self, notification: dict):
+        # insert u notifications je vec objavljen preko change stream-a svim workerima
+        pass
+
+    async def _watch(self):
+        pipeline = [{"$match": {"operationType": "insert"}}]
+
+        while True:
+            try:
+                async with self.collection.watch(pipeline, resume_after=self._resume_token) as stream:
+                    async for change in stream:
+                        self._resume_token = stream.resume_token
+                        await self._deliver(change["fullDocument"])
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    # resume token je istekao iz oplog-a → nastavljamo od "sada"
+                    self._resume_token = None
+                logger.exception("Change stream na notifications je prekinut, ponovo se povezujem")
+                await asyncio.sleep(self.retry_delay)
+            except PyMongoError:
+                logger.exception("Change stream na notifications je prekinut, ponovo se povezujem")
+                await asyncio.sleep(self.retry_delay)
+
+
+def create_backplane():
+    kind = os.getenv("WS_BACKPLANE", "memory")
+    if kind == "memory":
+        return InMemoryBackplane()
+    if kind == "mongo":
+        from database.connection import notifications_col
+        return MongoChangeStreamBackplane(notifications_col)
+    raise ValueError(f"Nepoznat WS_BACKPLANE: {kind}")
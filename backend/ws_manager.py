@@ -1,28 +1,216 @@
-from typing import Dict, List
+import asyncio
+import json
+import os
+import time
+from enum import Enum
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from fastapi import WebSocket
 
+import metrics
+from models.notification_models import NotificationEnvelope
+from ws_backplane import create_backplane
+
+
+#sta radimo kada je red poruka jedne konekcije pun (spor ili "mrtav" tab)
+class OverflowPolicy(str, Enum):
+    drop_oldest = "drop_oldest"   # izbaci najstariju poruku iz reda, zadrzi konekciju
+    disconnect = "disconnect"     # zatvori konekciju, klijent ce se ponovo povezati
+
+
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "100"))
+WS_OVERFLOW_POLICY = OverflowPolicy(os.getenv("WS_OVERFLOW_POLICY", OverflowPolicy.drop_oldest.value))
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "25"))
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "60"))  # bez ijedne poruke (pong) od klijenta
+WS_MAX_CONNECTIONS_PER_ORG = int(os.getenv("WS_MAX_CONNECTIONS_PER_ORG", "10"))
+
+PING_MESSAGE = json.dumps({"type": "ping"})
+
+# (seq, JSON poruka); seq je None za poruke koje nisu notifikacije
+Replay = Callable[[], Awaitable[List[Tuple[Optional[int], str]]]]
+
+
+class Connection:
+    """Jedna WS konekcija: ograniceni red poruka + sopstveni writer task"""
+
+    def __init__(self, org_id: str, websocket: WebSocket, queue_size: int):
+        self.org_id = org_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.writer: asyncio.Task | None = None
+        self.connected_at = time.monotonic()
+        self.last_seen = self.connected_at
+        # dok traje replay, zive notifikacije cekaju ovde da ne bi presle odigrane
+        self.replaying = False
+        self.pending: list[tuple[Optional[int], str]] = []
+
 
 class ConnectionManager:
-    def __init__(self):
-        # kljuc: org_id, vrednost: lista WebSocket konekcija
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+    def __init__(
+        self,
+        queue_size: int = WS_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = WS_OVERFLOW_POLICY,
+        send_timeout: float = WS_SEND_TIMEOUT,
+        backplane=None,
+        ping_interval: float = WS_PING_INTERVAL,
+        idle_timeout: float = WS_IDLE_TIMEOUT,
+        max_connections_per_org: int = WS_MAX_CONNECTIONS_PER_ORG,
+    ):
+        # kljuc: org_id, vrednost: {websocket: Connection}
+        self.active_connections: Dict[str, Dict[WebSocket, Connection]] = {}
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.send_timeout = send_timeout
+        self.ping_interval = ping_interval
+        self.idle_timeout = idle_timeout
+        self.max_connections_per_org = max_connections_per_org
+        self._reaper: asyncio.Task | None = None
+        self._closing: set[asyncio.Task] = set()  # reference na close taskove da ih GC ne pokupi
+
+        # backplane isporucuje notifikacije iz svih workera; mi saljemo samo na svoje sokete
+        self.backplane = backplane or create_backplane()
+        self.backplane.bind(self._deliver_notification)
+
+    async def start(self):
+        await self.backplane.start()
+        self._reaper = asyncio.create_task(self._heartbeat(), name="ws-heartbeat")
 
-    async def connect(self, org_id: str, websocket: WebSocket):
+    async def stop(self):
+        if self._reaper:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+        await self.backplane.stop()
+
+    async def publish(self, notification: dict):
+        """Objavi upisanu notifikaciju svim workerima (preko backplane-a)"""
+        await self.backplane.publish(notification)
+
+    async def _deliver_notification(self, notification: dict):
+        envelope = NotificationEnvelope.from_doc(notification)
+        await self.send_to_org(str(notification["organisation_id"]), envelope.model_dump_json(), envelope.seq)
+
+    async def connect(self, org_id: str, websocket: WebSocket, replay: Replay | None = None):
         await websocket.accept()
 
-        if org_id not in self.active_connections:
-            self.active_connections[org_id] = []
+        conns = self.active_connections.setdefault(org_id, {})
+
+        # limit po organizaciji: izbaci najstarije konekcije (najverovatnije zaboravljeni tabovi)
+        while conns and len(conns) >= self.max_connections_per_org:
+            oldest = min(conns.values(), key=lambda c: c.connected_at)
+            self._evict(oldest, "cap", code=1008)
 
-        self.active_connections[org_id].append(websocket)
+        conn = Connection(org_id, websocket, self.queue_size)
+        conn.replaying = replay is not None
+        conn.writer = asyncio.create_task(self._writer(conn))
+        # evikcija je mozda uklonila (prazan) dict organizacije
+        self.active_connections.setdefault(org_id, {})[websocket] = conn
+
+        if replay is not None:
+            await self._replay(conn, replay)
+
+    async def _replay(self, conn: Connection, replay: Replay):
+        """Konekcija je vec registrovana (nema rupe), pa prvo saljemo propusteno, a zatim
+        zive notifikacije pristigle u medjuvremenu, bez onih koje je replay vec obuhvatio"""
+        replayed_seq = 0
+        try:
+            for seq, message in await replay():
+                self._enqueue(conn, message)
+                replayed_seq = max(replayed_seq, seq or 0)
+        finally:
+            for seq, message in conn.pending:
+                if seq is None or seq > replayed_seq:
+                    self._enqueue(conn, message)
+            conn.pending = []
+            conn.replaying = False
+
+    def touch(self, org_id: str, websocket: WebSocket):
+        """Klijent se javio (pong ili bilo koja poruka) → konekcija je ziva"""
+        conn = self.active_connections.get(org_id, {}).get(websocket)
+        if conn:
+            conn.last_seen = time.monotonic()
 
     def disconnect(self, org_id: str, websocket: WebSocket):
-        if org_id in self.active_connections:
-            self.active_connections[org_id].remove(websocket)
+        """Idempotentno: bezbedno je pozvati i ako je konekcija vec uklonjena"""
+        conns = self.active_connections.get(org_id)
+        if not conns:
+            return
+
+        conn = conns.pop(websocket, None)
+        if not conns:
+            self.active_connections.pop(org_id, None)
+
+        if conn and conn.writer and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
+
+    async def send_to_org(self, org_id: str, message: str, seq: int | None = None):
+        """Ne blokira pozivaoca: poruka se samo stavlja u red svake konekcije"""
+        for conn in list(self.active_connections.get(org_id, {}).values()):
+            if conn.replaying:
+                conn.pending.append((seq, message))
+            else:
+                self._enqueue(conn, message)
+
+    def _enqueue(self, conn: Connection, message: str):
+        try:
+            conn.queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == OverflowPolicy.drop_oldest:
+            conn.queue.get_nowait()
+            conn.dropped += 1
+            metrics.inc("ws_messages_dropped_total")
+            conn.queue.put_nowait(message)
+        else:
+            self._evict(conn, "overflow", code=1013)  # 1013 = try again later
 
-    async def send_to_org(self, org_id: str, message: str):
-        if org_id in self.active_connections:
-            for ws in self.active_connections[org_id]:
-                await ws.send_text(message)
+    def _evict(self, conn: Connection, reason: str, code: int):
+        self.disconnect(conn.org_id, conn.websocket)
+        metrics.inc(f"ws_evictions_total.{reason}")
+
+        task = asyncio.create_task(self._close(conn.websocket, code=code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _heartbeat(self):
+        """Periodicno: ping zivim konekcijama, izbacivanje onih koje se dugo nisu javile"""
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            now = time.monotonic()
+
+            for conns in list(self.active_connections.values()):
+                for conn in list(conns.values()):
+                    if now - conn.last_seen > self.idle_timeout:
+                        self._evict(conn, "idle", code=1001)
+                    else:
+                        self._enqueue(conn, PING_MESSAGE)
+
+    def connection_count(self) -> int:
+        return sum(len(conns) for conns in self.active_connections.values())
+
+    async def _writer(self, conn: Connection):
+        try:
+            while True:
+                message = await conn.queue.get()
+                await asyncio.wait_for(conn.websocket.send_text(message), self.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # slanje nije uspelo ili je isteklo → konekcija je mrtva
+            self.disconnect(conn.org_id, conn.websocket)
+            metrics.inc("ws_evictions_total.send_failed")
+            await self._close(conn.websocket, code=1011)
+
+    async def _close(self, websocket: WebSocket, code: int):
+        try:
+            await asyncio.wait_for(websocket.close(code=code), self.send_timeout)
+        except Exception:
+            pass
 
 
 ws_manager = ConnectionManager()
+
+metrics.register_gauge("ws_connections", ws_manager.connection_count)
+metrics.register_gauge("ws_connected_organisations", lambda: len(ws_manager.active_connections))
@@ -31,6 +31,13 @@ export const authApi = {
     });
   },
 
+  logout: async (refreshToken: string | null): Promise<any> => {
+    return apiRequest<any>("/auth/logout", {
+      method: "POST",
+      body: JSON.stringify({ refresh_token: refreshToken }),
+    });
+  },
+
   registerOrg: async (data: OrganisationIn): Promise<any> => {
     return apiRequest<any>("/public/organisations/register", {
       method: "POST",
@@ -21,9 +21,44 @@ async function safeJsonParse<T>(response: Response): Promise<T> {
   }
 }
 
+// Jedan zajednicki refresh za sve zahteve koji istovremeno dobiju 401
+let refreshInFlight: Promise<boolean> | null = null;
+
+async function refreshAccessToken(): Promise<boolean> {
+  const refreshToken = localStorage.getItem("refresh_token");
+  if (!refreshToken) return false;
+
+  if (!refreshInFlight) {
+    refreshInFlight = (async () => {
+      try {
+        const response = await fetch(`${BASE_URL}/auth/refresh`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({ refresh_token: refreshToken }),
+        });
+        if (!response.ok) {
+          localStorage.removeItem("refresh_token");
+          return false;
+        }
+        const tokens = await response.json();
+        localStorage.setItem("token", tokens.access_token);
+        localStorage.setItem("refresh_token", tokens.refresh_token);
+        return true;
+      } catch {
+        return false;
+      } finally {
+        refreshInFlight = null;
+      }
+    })();
+  }
+  return refreshInFlight;
+}
+
 export async function apiRequest<T>(
   endpoint: string,
-  options: RequestInit = {}
+  options: RequestInit = {},
+  onResponse?: (response: Response) => void,
+  retried: boolean = false
 ): Promise<T> {
   const token = localStorage.getItem("token");
   
@@ -47,6 +82,11 @@ export async function apiRequest<T>(
       headers,
     });
 
+    // Istekao access token → obnovi ga refresh tokenom (bez lozinke) i ponovi zahtev jednom
+    if (response.status === 401 && !retried && !endpoint.startsWith("/auth/") && (await refreshAccessToken())) {
+      return apiRequest<T>(endpoint, options, onResponse, true);
+    }
+
     if (!response.ok) {
       const errorData = await safeJsonParse<{ detail?: any; message?: string }>(response);
       
@@ -70,6 +110,7 @@ export async function apiRequest<T>(
       throw error;
     }
 
+    onResponse?.(response);
     return await safeJsonParse<T>(response);
   } catch (error) {
     if (error instanceof TypeError && error.message === "Failed to fetch") {
@@ -82,5 +123,31 @@ export async function apiRequest<T>(
   }
 }
 
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+export interface PageParams {
+  limit?: number;
+  cursor?: string | null;
+  sort?: string;
+}
+
+// Paginirane liste: telo je jedna strana, cursor sledece strane stize u X-Next-Cursor headeru.
+// Sledeca strana se trazi tek kada je korisnik zatrazi (nextCursor === null → poslednja strana).
+export async function apiRequestPage<T>(endpoint: string, { limit = 20, cursor, sort }: PageParams = {}): Promise<Page<T>> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) params.set("cursor", cursor);
+  if (sort) params.set("sort", sort);
+  const separator = endpoint.includes("?") ? "&" : "?";
+  const page = { nextCursor: null as string | null };
+
+  const data = await apiRequest<T[]>(`${endpoint}${separator}${params}`, {}, (response) => {
+    page.nextCursor = response.headers.get("X-Next-Cursor");
+  });
+  return { items: Array.isArray(data) ? data : [], nextCursor: page.nextCursor };
+}
+
 export default apiRequest;
 
@@ -1,8 +1,15 @@
 import apiRequest from "./client";
 
 export const notificationsApi = {
-  getMyNotifications: async (): Promise<any> => {
-    return apiRequest<any>("/notifications/me");
+  // Jedna strana istorije (najnovije prvo); sledecu stranu trazi sa before = X-Next-Cursor
+  getMyNotifications: async (
+    params: { limit?: number; before?: string; unreadOnly?: boolean } = {}
+  ): Promise<any> => {
+    const query = new URLSearchParams();
+    query.set("limit", String(params.limit ?? 20));
+    if (params.before) query.set("before", params.before);
+    if (params.unreadOnly) query.set("unread_only", "true");
+    return apiRequest<any>(`/notifications/me?${query.toString()}`);
   },
 
   markAsRead: async (notificationId: string): Promise<any> => {
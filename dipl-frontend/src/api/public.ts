@@ -1,4 +1,5 @@
-import apiRequest from "./client";
+import apiRequest, { apiRequestPage } from "./client";
+import type { Page, PageParams } from "./client";
 import type { UserPublic, OrganisationPublic, EventPublic } from "../types/api";
 
 export const publicApi = {
@@ -15,12 +16,12 @@ export const publicApi = {
     return apiRequest<UserPublic>(`/public/users/pronadjipouseru/${username}`);
   },
 
-  getReviewsGivenByOrg: async (orgId: string): Promise<any> => {
-    return apiRequest<any>(`/public/users/org/${orgId}/given`);
+  getReviewsGivenByOrg: async (orgId: string, params: PageParams = {}): Promise<Page<any>> => {
+    return apiRequestPage<any>(`/public/users/org/${orgId}/given`, params);
   },
 
-  getReviewsForUser: async (userId: string): Promise<any> => {
-    return apiRequest<any>(`/public/users/user/${userId}/reviews`);
+  getReviewsForUser: async (userId: string, params: PageParams = {}): Promise<Page<any>> => {
+    return apiRequestPage<any>(`/public/users/user/${userId}/reviews`, params);
   },
 
   getUserAvgRating: async (userId: string): Promise<any> => {
@@ -52,12 +53,12 @@ export const publicApi = {
     return apiRequest<any>(`/public/organisationsstatiiiiistika/${organisationId}/stats`);
   },
 
-  getReviewsReceivedByOrg: async (orgId: string): Promise<any> => {
-    return apiRequest<any>(`/public/organisations/org/${orgId}/received`);
+  getReviewsReceivedByOrg: async (orgId: string, params: PageParams = {}): Promise<Page<any>> => {
+    return apiRequestPage<any>(`/public/organisations/org/${orgId}/received`, params);
   },
 
-  getReviewsForOrg: async (orgId: string): Promise<any> => {
-    return apiRequest<any>(`/public/organisations/org/${orgId}/reviews`);
+  getReviewsForOrg: async (orgId: string, params: PageParams = {}): Promise<Page<any>> => {
+    return apiRequestPage<any>(`/public/organisations/org/${orgId}/reviews`, params);
   },
 
   getOrgAvgRating: async (orgId: string): Promise<any> => {
@@ -1,35 +1,75 @@
-import apiRequest from "./client";
+import apiRequest, { type ApiError } from "./client";
 
-export const uploadsApi = {
-  uploadUserImage: async (file: File): Promise<any> => {
-    const formData = new FormData();
-    formData.append("file", file);
+interface PresignedUpload {
+  key: string;
+  exists: boolean;
+  upload_url?: string;
+  method?: string;
+  headers?: Record<string, string>;
+}
 
-    return apiRequest<any>("/upload/user/me", {
-      method: "POST",
-      body: formData,
-    });
-  },
+// Lokalno skladiste na backendu ne podrzava direktan upload (409) → dalje samo multipart
+let directUploadSupported = true;
 
-  uploadOrgLogo: async (file: File): Promise<any> => {
-    const formData = new FormData();
-    formData.append("file", file);
+async function sha256Hex(file: File): Promise<string> {
+  const digest = await crypto.subtle.digest("SHA-256", await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest))
+    .map((b) => b.toString(16).padStart(2, "0"))
+    .join("");
+}
 
-    return apiRequest<any>("/upload/org/me", {
-      method: "POST",
-      body: formData,
-    });
-  },
+async function multipartUpload(endpoint: string, file: File): Promise<any> {
+  const formData = new FormData();
+  formData.append("file", file);
+
+  return apiRequest<any>(endpoint, {
+    method: "POST",
+    body: formData,
+  });
+}
 
-  uploadEventImage: async (file: File): Promise<any> => {
-    const formData = new FormData();
-    formData.append("file", file);
+// Fajl ide direktno u object storage (presigned PUT), API dobija samo kljuc
+async function uploadImage(endpoint: string, file: File): Promise<any> {
+  if (!directUploadSupported || !crypto?.subtle) {
+    return multipartUpload(endpoint, file);
+  }
 
-    return apiRequest<any>("/upload/event-image", {
+  let presigned: PresignedUpload;
+  try {
+    presigned = await apiRequest<PresignedUpload>(`${endpoint}/presign`, {
       method: "POST",
-      body: formData,
+      body: JSON.stringify({ content_type: file.type, size: file.size, sha256: await sha256Hex(file) }),
     });
-  },
-};
+  } catch (error) {
+    if ((error as ApiError).status === 409) {
+      directUploadSupported = false;
+      return multipartUpload(endpoint, file);
+    }
+    throw error;
+  }
 
+  // isti sadrzaj je vec u storage-u → nema ponovnog slanja
+  if (!presigned.exists && presigned.upload_url) {
+    const response = await fetch(presigned.upload_url, {
+      method: presigned.method || "PUT",
+      headers: presigned.headers,
+      body: file,
+    });
+    if (!response.ok) {
+      throw { message: `Upload nije uspeo (HTTP ${response.status})`, status: response.status } as ApiError;
+    }
+  }
+
+  return apiRequest<any>(`${endpoint}/complete`, {
+    method: "POST",
+    body: JSON.stringify({ key: presigned.key }),
+  });
+}
+
+export const uploadsApi = {
+  uploadUserImage: async (file: File): Promise<any> => uploadImage("/upload/user/me", file),
+
+  uploadOrgLogo: async (file: File): Promise<any> => uploadImage("/upload/org/me", file),
 
+  uploadEventImage: async (file: File): Promise<any> => uploadImage("/upload/event-image", file),
+};
@@ -116,12 +116,14 @@ export function AuthProvider({ children }: { children: ReactNode }) {
   const loginUser = async (username: string, password: string) => {
     const response = await authApi.loginUser(username, password);
     localStorage.setItem("token", response.access_token);
+    localStorage.setItem("refresh_token", response.refresh_token);
     await initializeAuth(response.access_token);
   };
 
   const loginOrg = async (email: string, password: string) => {
     const response = await authApi.loginOrg(email, password);
     localStorage.setItem("token", response.access_token);
+    localStorage.setItem("refresh_token", response.refresh_token);
     await initializeAuth(response.access_token);
   };
 
@@ -136,7 +138,12 @@ export function AuthProvider({ children }: { children: ReactNode }) {
   };
 
   const logout = () => {
+    // opozovi tokene na serveru; lokalno odjavljivanje ne ceka odgovor
+    if (localStorage.getItem("token")) {
+      authApi.logout(localStorage.getItem("refresh_token")).catch(() => {});
+    }
     localStorage.removeItem("token");
+    localStorage.removeItem("refresh_token");
     setIsAuthenticated(false);
     setRole(null);
     setUser(null);
@@ -0,0 +1,41 @@
+import type { ReviewSort } from "../types/api";
+
+interface ReviewSortSelectProps {
+  sort: ReviewSort;
+  onChange: (sort: ReviewSort) => void;
+}
+
+export function ReviewSortSelect({ sort, onChange }: ReviewSortSelectProps) {
+  return (
+    <select
+      value={sort}
+      onChange={(e) => onChange(e.target.value as ReviewSort)}
+      className="ml-auto px-3 py-2 text-sm border-2 border-mint/30 rounded-xl bg-white text-[#121212] focus:outline-none focus:border-mint"
+    >
+      <option value="created_at">Najnovije</option>
+      <option value="rating">Najbolje ocenjene</option>
+    </select>
+  );
+}
+
+interface LoadMoreReviewsProps {
+  hasMore: boolean;
+  loading: boolean;
+  onClick: () => void;
+}
+
+export function LoadMoreReviews({ hasMore, loading, onClick }: LoadMoreReviewsProps) {
+  if (!hasMore) return null;
+  return (
+    <div className="flex justify-center mt-6">
+      <button
+        type="button"
+        onClick={onClick}
+        disabled={loading}
+        className="px-6 py-2 rounded-xl border-2 border-mint text-[#121212] font-semibold hover:bg-mint/20 transition-all disabled:opacity-50"
+      >
+        {loading ? "Učitavanje..." : "Prikaži još ocena"}
+      </button>
+    </div>
+  );
+}
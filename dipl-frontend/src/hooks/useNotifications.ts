@@ -1,4 +1,4 @@
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import { useWebSocket } from "./useWebSocket";
 import type { WebSocketMessage } from "./useWebSocket";
 import { useAuth } from "../auth/useAuth";
@@ -7,11 +7,40 @@ import { applicationsApi } from "../api/applications";
 import { showToast } from "../components/Toast";
 import type { ApplicationPublic } from "../types/api";
 
+// koliko id-eva primljenih notifikacija pamtimo za odbacivanje duplikata
+const MAX_SEEN_IDS = 500;
+
 export function useNotifications() {
   const { isAuthenticated, role } = useAuth();
   const [unreadCount, setUnreadCount] = useState(0);
   const [pendingApplications, setPendingApplications] = useState<ApplicationPublic[]>([]);
   const [hasNewApplication, setHasNewApplication] = useState(false);
+  // notifikacija sa najvecim seq-om: pri reconnect-u server odigra samo ono sto je posle nje
+  const lastNotificationIdRef = useRef<string | null>(null);
+  const lastSeqRef = useRef(0);
+  // id-evi vec obradjenih notifikacija (replay i live poruka mogu da se preklope ili stignu van reda)
+  const seenIdsRef = useRef(new Set<string>());
+  const wasConnectedRef = useRef(false);
+  const getResumeFrom = useCallback(() => lastNotificationIdRef.current, []);
+
+  const rememberNotification = useCallback((id: string, seq: number) => {
+    if (seq > lastSeqRef.current) {
+      lastSeqRef.current = seq;
+      lastNotificationIdRef.current = id;
+    }
+  }, []);
+
+  // najnovija notifikacija iz istorije: resume_from postoji i ako WS jos nista nije poslao
+  const loadLatestNotification = useCallback(async () => {
+    try {
+      const latest = await notificationsApi.getMyNotifications({ limit: 1 });
+      if (Array.isArray(latest) && latest.length > 0 && latest[0].seq !== undefined) {
+        rememberNotification(latest[0]._id, latest[0].seq);
+      }
+    } catch (error) {
+      console.error("Failed to load latest notification:", error);
+    }
+  }, [rememberNotification]);
 
   const loadUnreadCount = useCallback(async () => {
     try {
@@ -67,32 +96,65 @@ export function useNotifications() {
         showToast(`Status prijave je promenjen: ${statusText}`, "info");
       }
     } else if (message.type === "notification") {
-      // General notification
-      loadUnreadCount();
+      // Notification envelope {id, seq, message}: duplikat odbacujemo po id-u, ne po seq-u,
+      // da poruka koja stigne van reda ne bi bila izgubljena
+      if (message.id) {
+        if (seenIdsRef.current.has(message.id)) return;
+        seenIdsRef.current.add(message.id);
+        if (seenIdsRef.current.size > MAX_SEEN_IDS) {
+          const oldest = seenIdsRef.current.values().next().value;
+          if (oldest !== undefined) seenIdsRef.current.delete(oldest);
+        }
+        if (message.seq !== undefined) rememberNotification(message.id, message.seq);
+      }
+
+      setUnreadCount((count) => count + 1);
+      setHasNewApplication(true);
       if (message.message) {
         showToast(message.message, "info");
       }
+    } else if (message.type === "resync") {
+      // Server ne moze da odigra propusteno → ucitaj stanje iznova
+      loadUnreadCount();
+      loadPendingApplications();
+      loadLatestNotification();
     }
-  }, [loadUnreadCount, loadPendingApplications]);
+  }, [loadUnreadCount, loadPendingApplications, loadLatestNotification, rememberNotification]);
 
   // Connect to WebSocket only if authenticated and is organisation
   const { isConnected } = useWebSocket(
     "/ws/notifications",
     handleWebSocketMessage,
-    isAuthenticated && role === "organisation"
+    isAuthenticated && role === "organisation",
+    getResumeFrom
   );
 
+  // Inicijalno ucitavanje samo jednom; posle reconnect-a propusteno stize kroz replay
   useEffect(() => {
     if (isAuthenticated && role === "organisation") {
       loadUnreadCount();
       loadPendingApplications();
-      
+      loadLatestNotification();
+    }
+  }, [isAuthenticated, role, loadUnreadCount, loadPendingApplications, loadLatestNotification]);
+
+  // Reconnect bez resume_from (jos nema nijedne notifikacije) → server nema sta da odigra, ucitaj iznova
+  useEffect(() => {
+    if (!isConnected) return;
+    if (wasConnectedRef.current && !getResumeFrom()) {
+      loadUnreadCount();
+      loadPendingApplications();
+      loadLatestNotification();
+    }
+    wasConnectedRef.current = true;
+  }, [isConnected, getResumeFrom, loadUnreadCount, loadPendingApplications, loadLatestNotification]);
+
+  useEffect(() => {
+    if (isAuthenticated && role === "organisation" && !isConnected) {
       // Fallback: Poll for updates every 30 seconds if WebSocket is not connected
       const pollInterval = setInterval(() => {
-        if (!isConnected) {
-          loadUnreadCount();
-          loadPendingApplications();
-        }
+        loadUnreadCount();
+        loadPendingApplications();
       }, 30000); // Poll every 30 seconds
 
       return () => clearInterval(pollInterval);
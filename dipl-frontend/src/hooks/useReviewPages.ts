@@ -0,0 +1,55 @@
+import { useCallback, useEffect, useState } from "react";
+import type { Page, PageParams } from "../api/client";
+import type { ReviewSort } from "../types/api";
+
+type ReviewPageFetcher = (id: string, params: PageParams) => Promise<Page<any>>;
+
+const PAGE_SIZE = 10;
+
+// Liste ocena po stranama: prva strana kada je id poznat, sledeca tek na "Prikaži još".
+// Promena sortiranja krece ispocetka (cursor vazi samo za sortiranje kojim je napravljen).
+export function useReviewPages(fetchPage: ReviewPageFetcher, id: string | null) {
+  const [reviews, setReviews] = useState<any[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [sort, setSort] = useState<ReviewSort>("created_at");
+  const [loading, setLoading] = useState(false);
+
+  useEffect(() => {
+    setReviews([]);
+    setNextCursor(null);
+    if (!id) return;
+
+    let cancelled = false;
+    setLoading(true);
+    fetchPage(id, { limit: PAGE_SIZE, sort })
+      .then((page) => {
+        if (cancelled) return;
+        setReviews(page.items);
+        setNextCursor(page.nextCursor);
+      })
+      .catch((error) => console.error("Failed to load reviews:", error))
+      .finally(() => {
+        if (!cancelled) setLoading(false);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [fetchPage, id, sort]);
+
+  const loadMore = useCallback(async () => {
+    if (!id || !nextCursor || loading) return;
+    setLoading(true);
+    try {
+      const page = await fetchPage(id, { limit: PAGE_SIZE, cursor: nextCursor, sort });
+      setReviews((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error("Failed to load more reviews:", error);
+    } finally {
+      setLoading(false);
+    }
+  }, [fetchPage, id, nextCursor, sort, loading]);
+
+  return { reviews, hasMore: nextCursor !== null, loading, loadMore, sort, setSort };
+}
@@ -11,12 +11,18 @@ export type WebSocketMessage = {
   type: string;
   data?: any;
   message?: string;
+  // "notification" envelope: id notifikacije i redni broj unutar organizacije
+  id?: string;
+  seq?: number;
+  created_at?: string;
 };
 
 export function useWebSocket(
   endpoint: string,
   onMessage?: (message: WebSocketMessage) => void,
-  enabled: boolean = true
+  enabled: boolean = true,
+  // id poslednje primljene notifikacije; server pri reconnect-u salje samo propusteno
+  getResumeFrom?: () => string | null
 ) {
   const [isConnected, setIsConnected] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -33,7 +39,12 @@ export function useWebSocket(
       // WebSocket doesn't support custom headers in browser, so we use query parameter
       // Backend should accept token in query: ?token=xxx
       // Alternative: Backend could accept token in first message after connection
-      const wsUrl = `${WS_BASE_URL}${endpoint}${token ? `?token=${encodeURIComponent(token)}` : ""}`;
+      const params = new URLSearchParams();
+      if (token) params.set("token", token);
+      const resumeFrom = getResumeFrom?.();
+      if (resumeFrom) params.set("resume_from", resumeFrom);
+      const query = params.toString();
+      const wsUrl = `${WS_BASE_URL}${endpoint}${query ? `?${query}` : ""}`;
       
       console.log("🔌 Connecting to WebSocket:", wsUrl.replace(token || "", "[TOKEN]"));
       
@@ -54,6 +65,13 @@ export function useWebSocket(
       ws.onmessage = (event) => {
         try {
           const message: WebSocketMessage = JSON.parse(event.data);
+
+          // Server heartbeat: odgovori pong-om, inace server gasi konekciju kao neaktivnu
+          if (message.type === "ping") {
+            ws.send(JSON.stringify({ type: "pong" }));
+            return;
+          }
+
           console.log("📨 WebSocket message received:", message);
           if (onMessage) {
             onMessage(message);
@@ -103,7 +121,7 @@ export function useWebSocket(
       console.error("Failed to create WebSocket:", err);
       setError("Failed to connect to WebSocket");
     }
-  }, [endpoint, onMessage, enabled]);
+  }, [endpoint, onMessage, enabled, getResumeFrom]);
 
   const disconnect = useCallback(() => {
     if (reconnectTimeoutRef.current) {
@@ -2,6 +2,8 @@ import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { applicationsApi } from "../../api/applications";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import { eventsApi } from "../../api/events";
 import { useNotifications } from "../../hooks/useNotifications";
 import type { ApplicationPublic, ApplicationUpdate, EventPublic } from "../../types/api";
@@ -21,7 +23,16 @@ export function AllApplications() {
   const [showUserInfoModal, setShowUserInfoModal] = useState(false);
   const [selectedUserInfo, setSelectedUserInfo] = useState<Record<string, any> | null>(null);
   const [loadingUserInfo, setLoadingUserInfo] = useState(false);
-  const [userReviews, setUserReviews] = useState<any[]>([]);
+  // korisnik cije se ocene prikazuju u modalu; ocene se ucitavaju po stranama
+  const [reviewUserId, setReviewUserId] = useState<string | null>(null);
+  const {
+    reviews: userReviews,
+    hasMore: hasMoreUserReviews,
+    loading: loadingMoreUserReviews,
+    loadMore: loadMoreUserReviews,
+    sort: userReviewSort,
+    setSort: setUserReviewSort,
+  } = useReviewPages(publicApi.getReviewsForUser, reviewUserId);
   const [userAvgRating, setUserAvgRating] = useState<number | null>(null);
   const [userTotalReviews, setUserTotalReviews] = useState<number>(0);
   const [loadingUserReviews, setLoadingUserReviews] = useState(false);
@@ -128,14 +139,10 @@ export function AllApplications() {
           const userId = (fullUserInfo as any)._id || (fullUserInfo as any).id || (userInfo as any)._id || (userInfo as any).id;
           if (userId) {
             try {
-              const [reviewsData, ratingData] = await Promise.all([
-                publicApi.getReviewsForUser(userId),
-                publicApi.getUserAvgRating(userId),
-              ]);
+              setReviewUserId(String(userId));
+              const ratingData = await publicApi.getUserAvgRating(userId);
               
-              const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-              setUserReviews(reviewsArray);
-              setUserTotalReviews(reviewsArray.length);
+              setUserTotalReviews(ratingData?.rating_count ?? 0);
               
               const avg = ratingData?.avg_rating || ratingData || null;
               setUserAvgRating(typeof avg === 'number' ? avg : null);
@@ -169,7 +176,7 @@ export function AllApplications() {
   const closeUserInfoModal = () => {
     setShowUserInfoModal(false);
     setSelectedUserInfo(null);
-    setUserReviews([]);
+    setReviewUserId(null);
     setUserAvgRating(null);
     setUserTotalReviews(0);
   };
@@ -765,6 +772,7 @@ export function AllApplications() {
                         )}
                       </div>
                     )}
+                    <ReviewSortSelect sort={userReviewSort} onChange={setUserReviewSort} />
                   </div>
 
                   {userReviews.length > 0 ? (
@@ -837,6 +845,7 @@ export function AllApplications() {
                           </div>
                         );
                       })}
+                      <LoadMoreReviews hasMore={hasMoreUserReviews} loading={loadingMoreUserReviews} onClick={loadMoreUserReviews} />
                     </div>
                   ) : (
                     <p className="text-sm text-gray-600 text-center py-4">Još nema ocena za ovog korisnika</p>
@@ -60,13 +60,9 @@ export function Dashboard() {
     if (!organisation || !(organisation as any)._id) return;
     
     try {
-      const [reviewsData, ratingData] = await Promise.all([
-        publicApi.getReviewsForOrg((organisation as any)._id),
-        publicApi.getOrgAvgRating((organisation as any)._id),
-      ]);
-      
-      const reviews = Array.isArray(reviewsData) ? reviewsData : [];
-      setTotalReviews(reviews.length);
+      // broj review-a dolazi iz agregata ocena, bez ucitavanja (paginiranih) review-a
+      const ratingData = await publicApi.getOrgAvgRating((organisation as any)._id);
+      setTotalReviews(ratingData?.rating_count ?? 0);
       
       const avg = ratingData?.avg_rating || ratingData || null;
       setAvgRating(typeof avg === 'number' ? avg : null);
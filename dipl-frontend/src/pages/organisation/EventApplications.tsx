@@ -2,6 +2,8 @@ import { useEffect, useState } from "react";
 import { useParams, Link } from "react-router-dom";
 import { applicationsApi } from "../../api/applications";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import type { ApplicationPublic, ApplicationUpdate, EventPublic } from "../../types/api";
 import { showToast } from "../../components/Toast";
 import { CheckCircleIcon, XCircleIcon, UserCircleIcon, PhoneIcon, EnvelopeIcon, InformationCircleIcon, MapPinIcon, BriefcaseIcon, SparklesIcon, XMarkIcon, CalendarDaysIcon, PencilIcon, ArrowLeftIcon, TagIcon, StarIcon, BuildingOffice2Icon } from "@heroicons/react/24/outline";
@@ -20,7 +22,16 @@ export function EventApplications() {
   const [showUserInfoModal, setShowUserInfoModal] = useState(false);
   const [selectedUserInfo, setSelectedUserInfo] = useState<Record<string, any> | null>(null);
   const [loadingUserInfo, setLoadingUserInfo] = useState(false);
-  const [userReviews, setUserReviews] = useState<any[]>([]);
+  // korisnik cije se ocene prikazuju u modalu; ocene se ucitavaju po stranama
+  const [reviewUserId, setReviewUserId] = useState<string | null>(null);
+  const {
+    reviews: userReviews,
+    hasMore: hasMoreUserReviews,
+    loading: loadingMoreUserReviews,
+    loadMore: loadMoreUserReviews,
+    sort: userReviewSort,
+    setSort: setUserReviewSort,
+  } = useReviewPages(publicApi.getReviewsForUser, reviewUserId);
   const [userAvgRating, setUserAvgRating] = useState<number | null>(null);
   const [userTotalReviews, setUserTotalReviews] = useState<number>(0);
   const [loadingUserReviews, setLoadingUserReviews] = useState(false);
@@ -113,14 +124,10 @@ export function EventApplications() {
           const userId = (fullUserInfo as any)._id || (fullUserInfo as any).id || (userInfo as any)._id || (userInfo as any).id;
           if (userId) {
             try {
-              const [reviewsData, ratingData] = await Promise.all([
-                publicApi.getReviewsForUser(userId),
-                publicApi.getUserAvgRating(userId),
-              ]);
+              setReviewUserId(String(userId));
+              const ratingData = await publicApi.getUserAvgRating(userId);
               
-              const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-              setUserReviews(reviewsArray);
-              setUserTotalReviews(reviewsArray.length);
+              setUserTotalReviews(ratingData?.rating_count ?? 0);
               
               const avg = ratingData?.avg_rating || ratingData || null;
               setUserAvgRating(typeof avg === 'number' ? avg : null);
@@ -155,7 +162,7 @@ export function EventApplications() {
   const closeUserInfoModal = () => {
     setShowUserInfoModal(false);
     setSelectedUserInfo(null);
-    setUserReviews([]);
+    setReviewUserId(null);
     setUserAvgRating(null);
     setUserTotalReviews(0);
   };
@@ -825,6 +832,7 @@ export function EventApplications() {
                         )}
                       </div>
                     )}
+                    <ReviewSortSelect sort={userReviewSort} onChange={setUserReviewSort} />
                   </div>
 
                   {userReviews.length > 0 ? (
@@ -897,6 +905,7 @@ export function EventApplications() {
                           </div>
                         );
                       })}
+                      <LoadMoreReviews hasMore={hasMoreUserReviews} loading={loadingMoreUserReviews} onClick={loadMoreUserReviews} />
                     </div>
                   ) : (
                     <p className="text-sm text-gray-600 text-center py-4">Još nema ocena za ovog korisnika</p>
@@ -2,6 +2,8 @@ import { useEffect, useState } from "react";
 import { useParams, Link } from "react-router-dom";
 import { applicationsApi } from "../../api/applications";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import { reviewsApi } from "../../api/reviews";
 import type { ApplicationPublic, EventPublic, ReviewOrgToUserIn } from "../../types/api";
 import { showToast } from "../../components/Toast";
@@ -30,7 +32,16 @@ export function EventVolunteers() {
   const [showUserInfoModal, setShowUserInfoModal] = useState(false);
   const [selectedUserInfo, setSelectedUserInfo] = useState<Record<string, any> | null>(null);
   const [loadingUserInfo, setLoadingUserInfo] = useState(false);
-  const [userReviews, setUserReviews] = useState<any[]>([]);
+  // korisnik cije se ocene prikazuju u modalu; ocene se ucitavaju po stranama
+  const [reviewUserId, setReviewUserId] = useState<string | null>(null);
+  const {
+    reviews: userReviews,
+    hasMore: hasMoreUserReviews,
+    loading: loadingMoreUserReviews,
+    loadMore: loadMoreUserReviews,
+    sort: userReviewSort,
+    setSort: setUserReviewSort,
+  } = useReviewPages(publicApi.getReviewsForUser, reviewUserId);
   const [userAvgRating, setUserAvgRating] = useState<number | null>(null);
   const [userTotalReviews, setUserTotalReviews] = useState<number>(0);
   const [loadingUserReviews, setLoadingUserReviews] = useState(false);
@@ -45,7 +56,7 @@ export function EventVolunteers() {
   const [reviewError, setReviewError] = useState("");
   const [fetchingUserId, setFetchingUserId] = useState(false);
   const [userIdMap, setUserIdMap] = useState<Map<string, string>>(new Map());
-  const [reviewedUsers, setReviewedUsers] = useState<Set<string>>(new Set()); // Set of user IDs that have been reviewed
+  const [reviewedUsers, setReviewedUsers] = useState<Set<string>>(new Set()); // ocenjeni u ovoj sesiji; javne ocene nemaju event_id/direction, ponovnu ocenu odbija server
 
   useEffect(() => {
     if (eventId) {
@@ -140,9 +151,7 @@ export function EventVolunteers() {
       setVolunteers(enrichedApps);
       setUserIdMap(newUserIdMap);
       console.log("Final userIdMap:", Array.from(newUserIdMap.entries()));
-      
-      // Check which users have already been reviewed for this event
-      await loadReviewedUsers(acceptedApps, newUserIdMap);
+
     } catch (error: any) {
       console.error("Failed to load volunteers:", error);
       console.error("Error type:", typeof error);
@@ -185,14 +194,10 @@ export function EventVolunteers() {
           const userId = (fullUserInfo as any)._id || (fullUserInfo as any).id || (userInfo as any)._id || (userInfo as any).id;
           if (userId) {
             try {
-              const [reviewsData, ratingData] = await Promise.all([
-                publicApi.getReviewsForUser(userId),
-                publicApi.getUserAvgRating(userId),
-              ]);
+              setReviewUserId(String(userId));
+              const ratingData = await publicApi.getUserAvgRating(userId);
               
-              const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-              setUserReviews(reviewsArray);
-              setUserTotalReviews(reviewsArray.length);
+              setUserTotalReviews(ratingData?.rating_count ?? 0);
               
               const avg = ratingData?.avg_rating || ratingData || null;
               setUserAvgRating(typeof avg === 'number' ? avg : null);
@@ -224,76 +229,11 @@ export function EventVolunteers() {
   const closeUserInfoModal = () => {
     setShowUserInfoModal(false);
     setSelectedUserInfo(null);
-    setUserReviews([]);
+    setReviewUserId(null);
     setUserAvgRating(null);
     setUserTotalReviews(0);
   };
 
-  const loadReviewedUsers = async (apps: ApplicationPublic[], userIdMap: Map<string, string>) => {
-    const reviewedSet = new Set<string>();
-    
-    console.log("Loading reviewed users for event:", eventId);
-    console.log("Apps to check:", apps.length);
-    console.log("UserIdMap:", Array.from(userIdMap.entries()));
-    
-    // For each volunteer, check if they have been reviewed
-    for (const app of apps) {
-      let userId = getUserId(app);
-      if (!userId && app.user_info?.username) {
-        userId = userIdMap.get(app.user_info.username) || null;
-      }
-      
-      console.log(`Checking user for app:`, {
-        username: app.user_info?.username,
-        userId: userId,
-        eventId: eventId
-      });
-      
-      if (userId && eventId) {
-        try {
-          // Try to get reviews for this user
-          const reviews = await publicApi.getReviewsForUser(userId);
-          console.log(`Reviews for user ${userId}:`, reviews);
-          
-          const reviewsArray = Array.isArray(reviews) ? reviews : [];
-          
-          // Check if any review is for this event and from an organization (org_to_user)
-          const hasReviewForThisEvent = reviewsArray.some((review: any) => {
-            const reviewEventId = review.event_id || review.event?._id || review.event?.id || review.event_id;
-            const isOrgToUser = review.direction === "org_to_user" || 
-                               review.direction === "org-to-user" ||
-                               review.direction === "org_to_user";
-            
-            console.log(`Review check:`, {
-              reviewEventId,
-              eventId,
-              isOrgToUser,
-              direction: review.direction,
-              matches: String(reviewEventId) === String(eventId) && isOrgToUser
-            });
-            
-            return String(reviewEventId) === String(eventId) && isOrgToUser;
-          });
-          
-          if (hasReviewForThisEvent) {
-            reviewedSet.add(String(userId));
-            console.log(`✓ User ${userId} already reviewed for event ${eventId}`);
-          } else {
-            console.log(`✗ User ${userId} NOT reviewed for event ${eventId}`);
-          }
-        } catch (error) {
-          console.error(`Failed to check reviews for user ${userId}:`, error);
-          // Don't block if we can't check - allow review attempt
-        }
-      } else {
-        console.log(`Skipping check - missing userId or eventId:`, { userId, eventId });
-      }
-    }
-    
-    console.log("Final reviewed users set:", Array.from(reviewedSet));
-    setReviewedUsers(reviewedSet);
-  };
-
   const getUserId = (app: ApplicationPublic): string | null => {
     // Try multiple possible field names and structures
     const userInfo = app.user_info;
@@ -805,6 +745,7 @@ export function EventVolunteers() {
                         )}
                       </div>
                     )}
+                    <ReviewSortSelect sort={userReviewSort} onChange={setUserReviewSort} />
                   </div>
 
                   {userReviews.length > 0 ? (
@@ -877,6 +818,7 @@ export function EventVolunteers() {
                           </div>
                         );
                       })}
+                      <LoadMoreReviews hasMore={hasMoreUserReviews} loading={loadingMoreUserReviews} onClick={loadMoreUserReviews} />
                     </div>
                   ) : (
                     <p className="text-sm text-gray-600 text-center py-4">Još nema ocena za ovog korisnika</p>
@@ -4,6 +4,8 @@ import { useAuth } from "../../auth/useAuth";
 import { organisationsApi } from "../../api/organisations";
 import { eventsApi } from "../../api/events";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import type { OrganisationPublic } from "../../types/api";
 import { ChartBarIcon, CalendarDaysIcon, PencilIcon, BuildingOfficeIcon, MapPinIcon, PhoneIcon, GlobeAltIcon, EnvelopeIcon, StarIcon, UserCircleIcon } from "@heroicons/react/24/outline";
 import { StarIcon as StarSolidIcon } from "@heroicons/react/24/solid";
@@ -16,7 +18,10 @@ export function Profile() {
   const [stats, setStats] = useState<any>(null);
   const [avgRating, setAvgRating] = useState<number | null>(null);
   const [totalReviews, setTotalReviews] = useState<number>(0);
-  const [reviews, setReviews] = useState<any[]>([]);
+  const { reviews, hasMore, loading: loadingReviews, loadMore, sort, setSort } = useReviewPages(
+    publicApi.getReviewsForOrg,
+    (organisation as any)?._id ?? null
+  );
 
   useEffect(() => {
     loadProfile();
@@ -57,14 +62,9 @@ export function Profile() {
     if (!organisation || !(organisation as any)._id) return;
     
     try {
-      const [reviewsData, ratingData] = await Promise.all([
-        publicApi.getReviewsForOrg((organisation as any)._id),
-        publicApi.getOrgAvgRating((organisation as any)._id),
-      ]);
+      const ratingData = await publicApi.getOrgAvgRating((organisation as any)._id);
       
-      const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-      setReviews(reviewsArray);
-      setTotalReviews(reviewsArray.length);
+      setTotalReviews(ratingData?.rating_count ?? 0);
       
       const avg = ratingData?.avg_rating || ratingData || null;
       setAvgRating(typeof avg === 'number' ? avg : null);
@@ -242,7 +242,7 @@ export function Profile() {
       </div>
 
       {/* Reviews Section - Before Statistics */}
-      {reviews.length > 0 && (
+      {totalReviews > 0 && (
         <div className="mb-6">
           <div className="flex items-center gap-4 mb-6">
             <div className="p-2 bg-mint/20 rounded-xl">
@@ -262,6 +262,7 @@ export function Profile() {
                 )}
               </div>
             )}
+            <ReviewSortSelect sort={sort} onChange={setSort} />
           </div>
 
           <div className="space-y-6">
@@ -404,6 +405,7 @@ export function Profile() {
               );
             })}
           </div>
+          <LoadMoreReviews hasMore={hasMore} loading={loadingReviews} onClick={loadMore} />
         </div>
       )}
 
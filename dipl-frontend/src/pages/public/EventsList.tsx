@@ -81,17 +81,12 @@ export function EventsList() {
     
     for (const orgId of orgIds) {
       try {
-        const [avgRatingData, reviewsData] = await Promise.all([
-          publicApi.getOrgAvgRating(orgId).catch(() => null),
-          publicApi.getReviewsForOrg(orgId).catch(() => [])
-        ]);
-        
+        const avgRatingData = await publicApi.getOrgAvgRating(orgId).catch(() => null);
         const avgRating = avgRatingData?.avg_rating || avgRatingData || null;
-        const reviews = Array.isArray(reviewsData) ? reviewsData : [];
         
         ratingsMap[orgId] = {
           avgRating: typeof avgRating === 'number' ? avgRating : null,
-          totalReviews: reviews.length
+          totalReviews: avgRatingData?.rating_count ?? 0
         };
       } catch (error) {
         console.error(`Failed to load rating for org ${orgId}:`, error);
@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import { useParams, Link } from "react-router-dom";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import type { OrganisationPublic, EventPublic } from "../../types/api";
 import { 
   CalendarDaysIcon, 
@@ -26,10 +28,12 @@ export function OrganisationDetail() {
   const [events, setEvents] = useState<EventPublic[]>([]);
   const [eventHistory, setEventHistory] = useState<EventPublic[]>([]);
   const [stats, setStats] = useState<any>(null);
-  const [reviews, setReviews] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
   const [showAllEvents, setShowAllEvents] = useState(false);
   const [showReviewsDropdown, setShowReviewsDropdown] = useState(false);
+  // ocene se ucitavaju po stranama (orgId), sledeca strana na "Prikaži još"
+  const orgId = organisation ? ((organisation as any)._id || (organisation as any).id || null) : null;
+  const { reviews, hasMore, loading: loadingReviews, loadMore, sort, setSort } = useReviewPages(publicApi.getReviewsForOrg, orgId);
 
   useEffect(() => {
     if (username) {
@@ -91,54 +95,6 @@ export function OrganisationDetail() {
           console.error("Failed to load event history:", error);
           setEventHistory([]);
         }
-
-        // Učitaj review-e - koristi orgId ili username
-        try {
-          const orgId = (org as any)._id || (org as any).id;
-          console.log("Loading reviews for org:", { orgId, username, org });
-          
-          // Pokušaj prvo sa orgId, pa sa username ako orgId ne postoji
-          let orgReviews = null;
-          if (orgId) {
-            try {
-              orgReviews = await publicApi.getReviewsForOrg(orgId);
-              console.log("Reviews loaded with orgId:", orgReviews);
-            } catch (err) {
-              console.warn("Failed to load reviews with orgId, trying username:", err);
-              // Pokušaj sa username-om
-              try {
-                orgReviews = await publicApi.getReviewsForOrg(username!);
-                console.log("Reviews loaded with username:", orgReviews);
-              } catch (err2) {
-                console.error("Failed to load reviews with username:", err2);
-              }
-            }
-          } else {
-            // Pokušaj sa username-om ako nema orgId
-            try {
-              orgReviews = await publicApi.getReviewsForOrg(username!);
-              console.log("Reviews loaded with username (no orgId):", orgReviews);
-            } catch (err) {
-              console.error("Failed to load reviews with username:", err);
-            }
-          }
-          
-          if (orgReviews) {
-            const reviewsArray = Array.isArray(orgReviews) ? orgReviews : [];
-            console.log("Reviews loaded with full data:", reviewsArray);
-            console.log("Reviews count:", reviewsArray.length);
-            if (reviewsArray.length > 0) {
-              console.log("First review structure:", reviewsArray[0]);
-            }
-            setReviews(reviewsArray);
-          } else {
-            console.log("No reviews found");
-            setReviews([]);
-          }
-        } catch (error) {
-          console.error("Failed to load reviews:", error);
-          setReviews([]);
-        }
       } else {
         console.warn("No organisation found with username:", username);
       }
@@ -319,7 +275,7 @@ export function OrganisationDetail() {
               </div>
               <h3 className="text-2xl font-bold text-[#121212]">Statistika i ocene</h3>
             </div>
-            {reviews.length > 0 && (
+            {(reviews.length > 0 || loadingReviews) && (
               <div className="relative reviews-dropdown-container">
                 <button
                   type="button"
@@ -331,6 +287,9 @@ export function OrganisationDetail() {
                 </button>
                 {showReviewsDropdown && (
                   <div className="absolute right-0 mt-2 w-[500px] max-h-[600px] overflow-y-auto bg-white rounded-xl shadow-2xl border-2 border-mint/30 z-10 p-6 reviews-dropdown-container">
+                    <div className="flex mb-4">
+                      <ReviewSortSelect sort={sort} onChange={setSort} />
+                    </div>
                     <div className="space-y-6">
                       {reviews.map((review, index) => {
                         // Backend vraća: event_name, user_name, organisation_name, rating, comment
@@ -469,6 +428,7 @@ export function OrganisationDetail() {
                         );
                       })}
                     </div>
+                    <LoadMoreReviews hasMore={hasMore} loading={loadingReviews} onClick={loadMore} />
                   </div>
                 )}
               </div>
@@ -38,8 +38,7 @@ export function OrganisationsList() {
           const orgId = (org as any)._id || (org as any).id;
           if (orgId) {
             const avgRating = await publicApi.getOrgAvgRating(orgId);
-            const reviews = await publicApi.getReviewsForOrg(orgId);
-            const totalReviews = Array.isArray(reviews) ? reviews.length : 0;
+            const totalReviews = avgRating?.rating_count ?? 0;
             const avg = typeof avgRating === 'number' ? avgRating : (avgRating?.avg_rating || null);
             if (avg !== null && avg !== undefined) {
               ratingsMap.set(orgId, { avg, total: totalReviews });
@@ -77,8 +76,7 @@ export function OrganisationsList() {
           const orgId = (org as any)._id || (org as any).id;
           if (orgId) {
             const avgRating = await publicApi.getOrgAvgRating(orgId);
-            const reviews = await publicApi.getReviewsForOrg(orgId);
-            const totalReviews = Array.isArray(reviews) ? reviews.length : 0;
+            const totalReviews = avgRating?.rating_count ?? 0;
             const avg = typeof avgRating === 'number' ? avgRating : (avgRating?.avg_rating || null);
             if (avg !== null && avg !== undefined) {
               ratingsMap.set(orgId, { avg, total: totalReviews });
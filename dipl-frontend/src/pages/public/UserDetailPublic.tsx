@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import { useParams } from "react-router-dom";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import type { UserPublic } from "../../types/api";
 import { 
   HeartIcon, 
@@ -16,10 +18,11 @@ import { StarIcon as StarSolidIcon } from "@heroicons/react/24/solid";
 export function UserDetailPublic() {
   const { username } = useParams<{ username: string }>();
   const [user, setUser] = useState<UserPublic | null>(null);
-  const [reviews, setReviews] = useState<any[]>([]);
   const [avgRating, setAvgRating] = useState<number | null>(null);
   const [totalReviews, setTotalReviews] = useState<number>(0);
   const [loading, setLoading] = useState(true);
+  const userId = user ? ((user as any)._id || (user as any).id || null) : null;
+  const { reviews, hasMore, loading: loadingReviews, loadMore, sort, setSort } = useReviewPages(publicApi.getReviewsForUser, userId);
 
   useEffect(() => {
     if (username) {
@@ -37,15 +40,10 @@ export function UserDetailPublic() {
       const userId = (userData as any)._id || (userData as any).id;
       
       if (userId) {
-        // Use ID for review and rating API calls
-        const [reviewsData, ratingData] = await Promise.all([
-          publicApi.getReviewsForUser(userId),
-          publicApi.getUserAvgRating(userId),
-        ]);
+        // Use ID for rating API call (ocene se ucitavaju po stranama kroz useReviewPages)
+        const ratingData = await publicApi.getUserAvgRating(userId);
 
-        const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-        setReviews(reviewsArray);
-        setTotalReviews(reviewsArray.length);
+        setTotalReviews(ratingData?.rating_count ?? 0);
         setAvgRating(ratingData?.avg_rating || ratingData || null);
       }
     } catch (error) {
@@ -156,7 +154,7 @@ export function UserDetailPublic() {
       )}
 
       {/* Reviews Section */}
-      {reviews.length > 0 && (
+      {totalReviews > 0 && (
         <div className="card p-8">
           <div className="flex items-center gap-4 mb-6">
             <div className="p-2 bg-mint/20 rounded-xl">
@@ -176,6 +174,7 @@ export function UserDetailPublic() {
                 )}
               </div>
             )}
+            <ReviewSortSelect sort={sort} onChange={setSort} />
           </div>
           <div className="space-y-6">
             {reviews.map((review, index) => {
@@ -241,6 +240,7 @@ export function UserDetailPublic() {
               );
             })}
           </div>
+          <LoadMoreReviews hasMore={hasMore} loading={loadingReviews} onClick={loadMore} />
         </div>
       )}
     </div>
@@ -5,6 +5,8 @@ import { StarIcon as StarSolidIcon } from "@heroicons/react/24/solid";
 import { usersApi } from "../../api/users";
 import { applicationsApi } from "../../api/applications";
 import { publicApi } from "../../api/public";
+import { useReviewPages } from "../../hooks/useReviewPages";
+import { LoadMoreReviews, ReviewSortSelect } from "../../components/ReviewPaging";
 import type { ApplicationPublic, EventPublic, UserDB } from "../../types/api";
 import { 
   DocumentTextIcon, 
@@ -20,8 +22,9 @@ export function Dashboard() {
   const [applications, setApplications] = useState<ApplicationPublic[]>([]);
   const [avgRating, setAvgRating] = useState<number | null>(null);
   const [totalReviews, setTotalReviews] = useState<number>(0);
-  const [reviews, setReviews] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
+  const userId = profile ? ((profile as any)._id || (profile as any).id || null) : null;
+  const { reviews, hasMore, loading: loadingReviews, loadMore, sort, setSort } = useReviewPages(publicApi.getReviewsForUser, userId);
 
   useEffect(() => {
     loadData();
@@ -51,20 +54,14 @@ export function Dashboard() {
           const userId = (userData as any)._id || (userData as any).id;
           console.log("Loading rating data for user ID:", userId);
           
-          const [reviewsData, ratingData] = await Promise.all([
-            publicApi.getReviewsForUser(userId),
-            publicApi.getUserAvgRating(userId),
-          ]);
+          const ratingData = await publicApi.getUserAvgRating(userId);
           
-          console.log("Reviews data:", reviewsData);
           console.log("Rating data (raw):", ratingData);
           console.log("Rating data (JSON):", JSON.stringify(ratingData, null, 2));
           console.log("Rating data type:", typeof ratingData);
           console.log("Rating data keys:", ratingData ? Object.keys(ratingData) : 'null/undefined');
           
-          const reviewsArray = Array.isArray(reviewsData) ? reviewsData : [];
-          setReviews(reviewsArray);
-          setTotalReviews(reviewsArray.length);
+          setTotalReviews(ratingData?.rating_count ?? 0);
           
           const avg = ratingData?.avg_rating || ratingData || null;
           console.log("Extracted avg:", avg, "Type:", typeof avg);
@@ -447,7 +444,7 @@ export function Dashboard() {
       </div>
 
       {/* Reviews Section - Moje ocene */}
-      {reviews.length > 0 && (
+      {totalReviews > 0 && (
         <div id="my-reviews" className="mb-6">
           <div className="flex items-center gap-4 mb-6">
             <div className="p-2 bg-mint/20 rounded-xl">
@@ -467,6 +464,7 @@ export function Dashboard() {
                 )}
               </div>
             )}
+            <ReviewSortSelect sort={sort} onChange={setSort} />
           </div>
 
           <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
@@ -597,6 +595,7 @@ export function Dashboard() {
               );
             })}
           </div>
+          <LoadMoreReviews hasMore={hasMore} loading={loadingReviews} onClick={loadMore} />
         </div>
       )}
     </div>
@@ -7,6 +7,7 @@ export type EventCategory = "sports" | "cultural" | "business" | "eco" | "festiv
 export type OrganisationStatus = "pending" | "approved" | "rejected";
 export type OrganisationType = "official" | "informal";
 export type ReviewRating = 1 | 2 | 3 | 4 | 5;
+export type ReviewSort = "created_at" | "rating";
 
 export interface UserIn {
   username: string;
@@ -197,6 +198,8 @@ export interface HTTPValidationError {
 
 export interface LoginResponse {
   access_token: string;
+  refresh_token: string;
   token_type: string;
+  expires_in: number;
 }
 